@@ -2,18 +2,21 @@ import os
 from flask import Flask, jsonify, request, send_from_directory
 from flask_cors import CORS
 from flask_migrate import Migrate
-from datetime import datetime
+from datetime import date, datetime
 import sys
 import os
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from models.database import DatabaseManager
+from models.database import get_database_manager
+from models.connection import DB_PATH, migrate_legacy_ledger
 from models.budget_models import db
 from services.data_processor import DataProcessor
 from services.recommendation_engine import RecommendationEngine
 from services.feature_flags import FeatureFlags
+from services.response_cache import ResponseCache
+from services.event_dates import parse_date
 from routes.budget_routes import budget_bp
 from routes.policy_recommendation_routes import policy_recommendation_bp
 from routes.event_recommendation_routes import event_recommendation_bp
@@ -22,22 +25,79 @@ app = Flask(__name__)
 CORS(app)  # CORS 활성화
 
 # 데이터베이스 설정
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///hungry_people.db'
+# 이전 버전이 instance/hungry_people.db에 만든 예산 원장이 있으면 DB_PATH로 옮긴다
+migrate_legacy_ledger()
+# raw sqlite3 쪽(DatabaseManager)과 같은 파일을 사용 (HUNGRY_PEOPLE_DB_PATH로 변경 가능)
+app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{DB_PATH}'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'connect_args': {'timeout': 30}}
 
 # SQLAlchemy 초기화
 db.init_app(app)
 migrate = Migrate(app, db)
 
 # 데이터베이스 매니저 및 추천 엔진 초기화
-db_manager = DatabaseManager()
+db_manager = get_database_manager()
 recommendation_engine = RecommendationEngine()
+# 재적재 전까지 바뀌지 않는 조회 응답 캐시 (데이터셋 태그가 바뀌면 자동 무효화)
+response_cache = ResponseCache(db_manager.get_dataset_tag)
 
 # 블루프린트 등록
 app.register_blueprint(budget_bp)
 app.register_blueprint(policy_recommendation_bp)
 app.register_blueprint(event_recommendation_bp)
 
+# 목록 API 한 페이지 최대 건수
+MAX_PAGE_SIZE = 200
+
+def get_int_arg(name: str, default=None, minimum: int = 0):
+    """정수 파라미터 조회 (없으면 default, 정수가 아니거나 minimum 미만이면 ValueError)"""
+    value = request.args.get(name)
+    if not value:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        raise ValueError(f'{name} 파라미터는 정수여야 합니다.')
+    if parsed < minimum:
+        raise ValueError(f'{name} 파라미터는 {minimum} 이상이어야 합니다.')
+    return parsed
+
+def get_page_args(default_limit: int):
+    """페이지네이션 파라미터 조회 (limit, offset, after_id)
+    
+    limit은 MAX_PAGE_SIZE까지로 제한하고, 잘못된 값이면 ValueError.
+    """
+    limit = min(get_int_arg('limit', default_limit, minimum=1), MAX_PAGE_SIZE)
+    offset = get_int_arg('offset', 0)
+    after_id = get_int_arg('after_id') if request.args.get('after_id') else get_int_arg('cursor')
+    return limit, offset, after_id
+
+def get_date_arg(name: str, default=None):
+    """날짜 파라미터 조회 (없으면 default, 형식이 잘못되면 ValueError)"""
+    value = request.args.get(name)
+    if not value:
+        return default
+    parsed = parse_date(value)
+    if parsed is None:
+        raise ValueError(f'{name} 파라미터는 YYYY-MM-DD 형식이어야 합니다.')
+    return parsed
+
+def page_envelope(rows, limit: int, offset: int, keyset: bool) -> dict:
+    """limit + 1개 조회 결과로 페이지 응답 구성
+    
+    keyset이 True면 id 순 목록이므로 마지막 id를 next_cursor(after_id)로 돌려준다.
+    """
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        'success': True,
+        'data': rows,
+        'count': len(rows),
+        'next_cursor': str(rows[-1]['id']) if has_more and keyset and rows else None,
+        'next_offset': offset + limit if has_more else None
+    }
+
 @app.route('/')
 def index():
     """메인 페이지 서빙"""
@@ -65,29 +125,64 @@ def healthz():
     })
 
 @app.route('/api/restaurants', methods=['GET'])
+@response_cache.cached('restaurants')
 def get_restaurants():
     """백년가게 목록 조회"""
     try:
         region = request.args.get('region')
         keyword = request.args.get('keyword')
-        limit = int(request.args.get('limit', 50))
+        sido = request.args.get('sido')
+        business_type = request.args.get('business_type')
+        ids = request.args.get('ids')
+        try:
+            limit, offset, after_id = get_page_args(50)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
         
-        if region:
-            restaurants = db_manager.get_restaurants_by_region(region)
+        # 상세 카드 일괄 조회 (ids=1,2,3)
+        if ids:
+            values = [value.strip() for value in ids.split(',') if value.strip()]
+            if not all(value.isascii() and value.isdigit() for value in values):
+                return jsonify({
+                    'success': False,
+                    'error': 'ids는 쉼표로 구분한 정수 id 목록이어야 합니다.'
+                }), 400
+            restaurant_ids = [int(value) for value in values]
+            if len(restaurant_ids) > 200:
+                return jsonify({
+                    'success': False,
+                    'error': 'ids는 최대 200개까지 조회할 수 있습니다.'
+                }), 400
+            
+            restaurants = db_manager.get_restaurants_by_ids(restaurant_ids)
+            found_ids = {restaurant['id'] for restaurant in restaurants}
+            return jsonify({
+                'success': True,
+                'data': restaurants,
+                'count': len(restaurants),
+                'missing_ids': [value for value in restaurant_ids if value not in found_ids]
+            })
+        
+        # 다음 페이지 존재 여부 확인을 위해 limit + 1개 조회
+        if sido:
+            restaurants = db_manager.get_restaurants_by_admin_area(
+                sido, request.args.get('sigungu'), request.args.get('eupmyeondong'),
+                limit + 1, offset, after_id
+            )
+        elif region:
+            restaurants = db_manager.get_restaurants_by_region(region, limit + 1, offset, after_id)
+        elif business_type:
+            restaurants = db_manager.get_restaurants_by_business_type(business_type, limit + 1, offset, after_id)
         elif keyword:
-            restaurants = db_manager.get_restaurants_by_keyword(keyword)
+            restaurants = db_manager.get_restaurants_by_keyword(keyword, limit + 1, offset)
         else:
             # 전체 조회 (제한)
-            restaurants = db_manager.get_restaurants_by_keyword('')
-        
-        # 제한 적용
-        restaurants = restaurants[:limit]
+            restaurants = db_manager.get_restaurants_by_keyword('', limit + 1, offset, after_id)
         
-        return jsonify({
-            'success': True,
-            'data': restaurants,
-            'count': len(restaurants)
-        })
+        return jsonify(page_envelope(restaurants, limit, offset, keyset=not keyword or bool(region or sido or business_type)))
     
     except Exception as e:
         return jsonify({
@@ -99,8 +194,7 @@ def get_restaurants():
 def get_restaurant(restaurant_id):
     """특정 백년가게 상세 정보 조회"""
     try:
-        restaurants = db_manager.get_restaurants_by_keyword('')
-        restaurant = next((r for r in restaurants if r['id'] == restaurant_id), None)
+        restaurant = db_manager.get_restaurant_by_id(restaurant_id)
         
         if not restaurant:
             return jsonify({
@@ -120,28 +214,73 @@ def get_restaurant(restaurant_id):
         }), 500
 
 @app.route('/api/events', methods=['GET'])
+@response_cache.cached('events')
 def get_events():
     """행사일정 목록 조회"""
     try:
         region = request.args.get('region')
         location = request.args.get('location')
-        limit = int(request.args.get('limit', 50))
+        try:
+            limit, offset, after_id = get_page_args(50)
+            date_from = get_date_arg('from')
+            date_to = get_date_arg('to')
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
         
-        if region:
-            events = db_manager.get_events_by_region(region)
+        # 다음 페이지 존재 여부 확인을 위해 limit + 1개 조회
+        if date_from or date_to:
+            # 기간 조회는 시작일 순이므로 offset 페이지네이션만 지원
+            events = db_manager.get_events_in_period(date_from, date_to, region, limit + 1, offset)
+            return jsonify(page_envelope(events, limit, offset, keyset=False))
+        elif region:
+            events = db_manager.get_events_by_region(region, limit + 1, offset, after_id)
         elif location:
-            events = db_manager.get_events_by_location(location)
+            events = db_manager.get_events_by_location(location, limit + 1, offset)
         else:
             # 전체 조회 (제한)
-            events = db_manager.get_events_by_region('')
+            events = db_manager.get_events_by_region('', limit + 1, offset, after_id)
         
-        # 제한 적용
-        events = events[:limit]
+        return jsonify(page_envelope(events, limit, offset, keyset=not location or bool(region)))
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/events/upcoming', methods=['GET'])
+def get_upcoming_events():
+    """예정 행사 조회 (lat/lon을 주면 반경 안, region을 주면 해당 지역)
+    
+    기준일(from, 기본값 오늘)이 바뀌면 결과도 바뀌므로 응답 캐시를 적용하지 않는다.
+    """
+    try:
+        region = request.args.get('region')
+        lat = request.args.get('lat', type=float)
+        lon = request.args.get('lon', type=float)
+        radius_km = request.args.get('radius_km', type=float)
+        limit = int(request.args.get('limit', 20))
+        try:
+            date_from = get_date_arg('from', date.today())
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        if lat is not None and lon is not None:
+            events = db_manager.get_upcoming_events_near(lat, lon, date_from, radius_km, limit)
+        else:
+            events = db_manager.get_events_in_period(date_from, None, region, limit)
         
         return jsonify({
             'success': True,
             'data': events,
-            'count': len(events)
+            'count': len(events),
+            'from': date_from.isoformat()
         })
     
     except Exception as e:
@@ -150,27 +289,60 @@ def get_events():
             'error': str(e)
         }), 500
 
+@app.route('/api/schedules', methods=['GET'])
+@response_cache.cached('schedules')
+def get_schedules():
+    """유관기관 일정 조회 (from/to 기간, q 제목 검색)"""
+    try:
+        keyword = request.args.get('q', '').strip()
+        limit = int(request.args.get('limit', 50))
+        offset = int(request.args.get('offset', 0))
+        try:
+            date_from = get_date_arg('from')
+            date_to = get_date_arg('to')
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        schedules = db_manager.get_schedules(date_from, date_to, keyword, limit + 1, offset)
+        return jsonify(page_envelope(schedules, limit, offset, keyset=False))
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/api/recommendations', methods=['GET'])
+@response_cache.cached('recommendations')
 def get_recommendations():
     """추천 서비스 - 행사 장소 근처 백년가게 추천"""
     try:
         location = request.args.get('location')
         region = request.args.get('region')
         event_id = request.args.get('event_id')
+        lat = request.args.get('lat', type=float)
+        lon = request.args.get('lon', type=float)
+        radius_km = request.args.get('radius_km', type=float)
         limit = int(request.args.get('limit', 10))
         
-        if not location and not region and not event_id:
+        if not location and not region and not event_id and (lat is None or lon is None):
             return jsonify({
                 'success': False,
-                'error': 'location, region 또는 event_id 파라미터가 필요합니다.'
+                'error': 'location, region, event_id 또는 lat/lon 파라미터가 필요합니다.'
             }), 400
         
         # 추천 타입별 처리
         if event_id:
-            restaurants = recommendation_engine.get_event_based_recommendations(int(event_id), limit)
+            restaurants = recommendation_engine.get_event_based_recommendations(int(event_id), limit, radius_km)
             recommendation_type = 'event_based'
+        elif lat is not None and lon is not None:
+            restaurants = recommendation_engine.get_coordinate_based_recommendations(lat, lon, limit, radius_km)
+            recommendation_type = 'coordinate_based'
         elif location:
-            restaurants = recommendation_engine.get_location_based_recommendations(location, limit)
+            restaurants = recommendation_engine.get_location_based_recommendations(location, limit, radius_km)
             recommendation_type = 'location_based'
         else:
             restaurants = recommendation_engine.get_region_based_recommendations(region, limit)
@@ -184,7 +356,10 @@ def get_recommendations():
             'search_criteria': {
                 'location': location,
                 'region': region,
-                'event_id': event_id
+                'event_id': event_id,
+                'lat': lat,
+                'lon': lon,
+                'radius_km': radius_km
             }
         })
     
@@ -195,6 +370,7 @@ def get_recommendations():
         }), 500
 
 @app.route('/api/regions', methods=['GET'])
+@response_cache.cached('regions')
 def get_regions():
     """지역 목록 조회"""
     try:
@@ -219,6 +395,7 @@ def search():
         query = request.args.get('q', '')
         search_type = request.args.get('type', 'all')  # all, restaurants, events
         limit = int(request.args.get('limit', 20))
+        offset = int(request.args.get('offset', 0))
         
         if not query:
             return jsonify({
@@ -231,13 +408,19 @@ def search():
             'events': []
         }
         
+        # 유형별 limit//2개씩, 다음 페이지 확인용으로 1개 더 조회
+        page_size = limit // 2
+        has_more = False
+        
         if search_type in ['all', 'restaurants']:
-            restaurants = db_manager.get_restaurants_by_keyword(query)[:limit//2]
-            results['restaurants'] = restaurants
+            restaurants = db_manager.get_restaurants_by_keyword(query, page_size + 1, offset)
+            has_more = has_more or len(restaurants) > page_size
+            results['restaurants'] = restaurants[:page_size]
         
         if search_type in ['all', 'events']:
-            events = db_manager.get_events_by_location(query)[:limit//2]
-            results['events'] = events
+            events = db_manager.search_events(query, page_size + 1, offset)
+            has_more = has_more or len(events) > page_size
+            results['events'] = events[:page_size]
         
         total_count = len(results['restaurants']) + len(results['events'])
         
@@ -245,7 +428,8 @@ def search():
             'success': True,
             'data': results,
             'total_count': total_count,
-            'query': query
+            'query': query,
+            'next_offset': offset + page_size if has_more else None
         })
     
     except Exception as e:
@@ -283,17 +467,12 @@ def get_smart_recommendations():
         }), 500
 
 @app.route('/api/stats', methods=['GET'])
+@response_cache.cached('stats')
 def get_stats():
     """통계 정보 조회"""
     try:
-        regions = db_manager.get_all_regions()
-        
-        stats = {
-            'total_restaurants': len(db_manager.get_restaurants_by_keyword('')),
-            'total_events': len(db_manager.get_events_by_region('')),
-            'total_regions': len(regions),
-            'regions': regions
-        }
+        # 적재 시 미리 계산된 집계 테이블 조회
+        stats = db_manager.get_stats()
         
         return jsonify({
             'success': True,
@@ -327,6 +506,8 @@ if __name__ == '__main__':
     print("  GET /api/restaurants - 백년가게 목록")
     print("  GET /api/restaurants/<id> - 백년가게 상세")
     print("  GET /api/events - 행사일정 목록")
+    print("  GET /api/events/upcoming - 예정 행사")
+    print("  GET /api/schedules - 유관기관 일정")
     print("  GET /api/recommendations - 추천 서비스")
     print("  GET /api/smart-recommendations - 스마트 추천")
     print("  GET /api/regions - 지역 목록")
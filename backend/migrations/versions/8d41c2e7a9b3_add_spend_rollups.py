@@ -0,0 +1,45 @@
+"""Add spend rollups
+
+Revision ID: 8d41c2e7a9b3
+Revises: 2fb46f0564a5
+Create Date: 2026-10-17 11:02:41.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d41c2e7a9b3'
+down_revision = '2fb46f0564a5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('spend_rollups',
+    sa.Column('budget_line_id', sa.Integer(), nullable=False),
+    sa.Column('period', sa.String(length=7), nullable=False),
+    sa.Column('budget_id', sa.Integer(), nullable=False),
+    sa.Column('transaction_count', sa.Integer(), nullable=False),
+    sa.Column('total_amount', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['budget_id'], ['budgets.id'], ),
+    sa.ForeignKeyConstraint(['budget_line_id'], ['budget_lines.id'], ),
+    sa.PrimaryKeyConstraint('budget_line_id', 'period')
+    )
+    op.create_index('ix_spend_rollups_budget_period', 'spend_rollups', ['budget_id', 'period'], unique=False)
+
+    # 기존 유효 거래로 집계 채우기
+    op.execute('''
+        INSERT INTO spend_rollups (budget_line_id, period, budget_id, transaction_count, total_amount)
+        SELECT t.budget_line_id, substr(t.date, 1, 7), l.budget_id, COUNT(*), SUM(t.amount)
+        FROM transactions t
+        JOIN budget_lines l ON l.id = t.budget_line_id
+        WHERE t.is_valid = 1
+        GROUP BY t.budget_line_id, substr(t.date, 1, 7), l.budget_id
+    ''')
+
+
+def downgrade():
+    op.drop_index('ix_spend_rollups_budget_period', table_name='spend_rollups')
+    op.drop_table('spend_rollups')
@@ -0,0 +1,44 @@
+"""Add ledger indexes
+
+Revision ID: c52f8e19d6a4
+Revises: 8d41c2e7a9b3
+Create Date: 2026-10-17 11:40:12.507731
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c52f8e19d6a4'
+down_revision = '8d41c2e7a9b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 같은 분류의 정책 규칙이 여러 개면 어떤 규칙을 남길지 정할 수 없으므로 중단
+    # (SQLite는 DDL이 바로 반영되므로 인덱스를 만들기 전에 확인)
+    duplicates = op.get_bind().exec_driver_sql('''
+        SELECT category, COUNT(*) FROM policy_rules
+        GROUP BY category HAVING COUNT(*) > 1 ORDER BY category
+    ''').fetchall()
+    if duplicates:
+        listed = ', '.join(f'{category} ({count}개)' for category, count in duplicates)
+        raise RuntimeError(
+            f'policy_rules에 분류가 중복된 규칙이 있어 유니크 인덱스를 만들 수 없습니다: {listed}. '
+            '분류마다 규칙 하나만 남기도록 정리한 뒤 다시 업그레이드하세요.'
+        )
+
+    op.create_index(op.f('ix_budgets_created_at'), 'budgets', ['created_at'], unique=False)
+    op.create_index(op.f('ix_budget_lines_budget_id'), 'budget_lines', ['budget_id'], unique=False)
+    # (거래일, id) 순 정렬을 인덱스 순서로 처리하고 amount까지 담아 건수·합계를 커버
+    op.create_index('ix_transactions_line_valid_date', 'transactions',
+                    ['budget_line_id', 'is_valid', 'date', 'id', 'amount'], unique=False)
+    op.create_index(op.f('ix_policy_rules_category'), 'policy_rules', ['category'], unique=True)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_policy_rules_category'), table_name='policy_rules')
+    op.drop_index('ix_transactions_line_valid_date', table_name='transactions')
+    op.drop_index(op.f('ix_budget_lines_budget_id'), table_name='budget_lines')
+    op.drop_index(op.f('ix_budgets_created_at'), table_name='budgets')
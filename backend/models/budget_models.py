@@ -13,7 +13,7 @@ class Budget(db.Model):
     project_name = db.Column(db.String(200), nullable=False)
     fiscal_year = db.Column(db.Integer, nullable=False)
     total_amount = db.Column(db.Integer, nullable=False)  # 원 단위 정수
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     
     # 관계
     budget_lines = db.relationship('BudgetLine', backref='budget', lazy='dynamic', cascade='all, delete-orphan')
@@ -32,7 +32,7 @@ class BudgetLine(db.Model):
     __tablename__ = 'budget_lines'
     
     id = db.Column(db.Integer, primary_key=True)
-    budget_id = db.Column(db.Integer, db.ForeignKey('budgets.id'), nullable=False)
+    budget_id = db.Column(db.Integer, db.ForeignKey('budgets.id'), nullable=False, index=True)
     category = db.Column(db.String(100), nullable=False)  # 회의비, 다과비, 교통비 등
     allocated_amount = db.Column(db.Integer, nullable=False)  # 원 단위 정수
     spent_amount = db.Column(db.Integer, default=0)  # 원 단위 정수 (denormalized)
@@ -66,6 +66,10 @@ class BudgetLine(db.Model):
 class Transaction(db.Model):
     """거래 내역 모델"""
     __tablename__ = 'transactions'
+    __table_args__ = (
+        # 비목별 유효 거래 조회·(거래일, id) 순 정렬·건수/합계 집계를 인덱스만으로 처리
+        db.Index('ix_transactions_line_valid_date', 'budget_line_id', 'is_valid', 'date', 'id', 'amount'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     budget_line_id = db.Column(db.Integer, db.ForeignKey('budget_lines.id'), nullable=False)
@@ -92,12 +96,34 @@ class Transaction(db.Model):
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
 
+class SpendRollup(db.Model):
+    """예산·비목·월별 집행 집계 (거래 등록·무효화 시 증분 갱신)"""
+    __tablename__ = 'spend_rollups'
+    __table_args__ = (
+        db.Index('ix_spend_rollups_budget_period', 'budget_id', 'period'),
+    )
+    
+    budget_line_id = db.Column(db.Integer, db.ForeignKey('budget_lines.id'), primary_key=True)
+    period = db.Column(db.String(7), primary_key=True)  # YYYY-MM
+    budget_id = db.Column(db.Integer, db.ForeignKey('budgets.id'), nullable=False)
+    transaction_count = db.Column(db.Integer, nullable=False, default=0)
+    total_amount = db.Column(db.Integer, nullable=False, default=0)  # 원 단위 정수
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'budget_id': self.budget_id,
+            'budget_line_id': self.budget_line_id,
+            'period': self.period,
+            'transaction_count': self.transaction_count,
+            'total_amount': self.total_amount
+        }
+
 class PolicyRule(db.Model):
     """정책 규칙 모델 (읽기 전용 카탈로그)"""
     __tablename__ = 'policy_rules'
     
     id = db.Column(db.Integer, primary_key=True)
-    category = db.Column(db.String(100), nullable=False)
+    category = db.Column(db.String(100), nullable=False, unique=True, index=True)
     rule_text = db.Column(db.Text, nullable=False)
     required_receipt_types = db.Column(db.Text, nullable=True)  # JSON 문자열
     allowed_business_types = db.Column(db.Text, nullable=True)  # JSON 문자열
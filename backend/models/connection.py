@@ -0,0 +1,112 @@
+import os
+import sqlite3
+import threading
+from typing import Dict
+from urllib.request import pathname2url
+
+from services.text_search import register_search_functions
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# raw sqlite3 쪽(DatabaseManager, RecommendationEngine)과 Flask-SQLAlchemy 쪽이 함께 쓰는 DB 파일
+DB_PATH = os.environ.get('HUNGRY_PEOPLE_DB_PATH', os.path.join(BACKEND_DIR, 'hungry_people.db'))
+
+# 이전 버전의 Flask-SQLAlchemy URI('sqlite:///hungry_people.db')가 가리키던 예산 원장 DB 파일
+LEGACY_LEDGER_PATH = os.path.join(BACKEND_DIR, 'instance', 'hungry_people.db')
+
+# 연결마다 적용하는 PRAGMA
+# WAL 모드에서는 읽기 연결이 적재(쓰기) 트랜잭션을 기다리지 않고 직전 커밋 스냅샷을 읽는다.
+CONNECTION_PRAGMAS = (
+    'PRAGMA journal_mode = WAL',
+    'PRAGMA synchronous = NORMAL',
+    'PRAGMA cache_size = -16000',      # 16MB 페이지 캐시
+    'PRAGMA mmap_size = 268435456',    # 256MB 메모리 맵
+    'PRAGMA temp_store = MEMORY'
+)
+
+_local = threading.local()
+
+def connect(db_path: str = DB_PATH, **kwargs) -> sqlite3.Connection:
+    """
+    PRAGMA와 SQL 함수가 적용된 새 연결 생성
+
+    적재처럼 트랜잭션을 직접 관리하는 쓰기 작업에 사용하고, 사용 후 닫는다.
+    """
+    conn = sqlite3.connect(db_path, timeout=30, cached_statements=256, **kwargs)
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    register_search_functions(conn)
+    return conn
+
+def get_connection(db_path: str = DB_PATH) -> sqlite3.Connection:
+    """
+    현재 스레드 전용 연결 반환
+
+    스레드마다 DB 파일별로 한 번만 연결하고 이후 요청에서 재사용하므로 닫지 않는다.
+    sqlite3 모듈의 문장 캐시(cached_statements)로 같은 쿼리의 prepare도 재사용된다.
+    """
+    connections: Dict[str, sqlite3.Connection] = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+
+    key = os.path.abspath(db_path)
+    conn = connections.get(key)
+    if conn is None:
+        conn = connections[key] = connect(db_path)
+    return conn
+
+def _table_names(conn: sqlite3.Connection, schema: str = 'main') -> set:
+    """스키마의 테이블 이름 집합"""
+    rows = conn.execute(f"SELECT name FROM {schema}.sqlite_master WHERE type = 'table'").fetchall()
+    return {row[0] for row in rows}
+
+def migrate_legacy_ledger(db_path: str = DB_PATH, legacy_path: str = LEGACY_LEDGER_PATH) -> bool:
+    """
+    instance/hungry_people.db에 남은 예산 원장을 db_path로 옮김
+
+    db_path에 원장 테이블(budgets)이 없고 이전 파일에 있을 때만 동작한다. 이전 파일의 테이블
+    (alembic_version 포함)과 인덱스를 한 트랜잭션으로 db_path에 복사하고, 이전 파일은
+    hungry_people.db.migrated로 이름을 바꿔 백업으로 남긴다. 옮겼으면 True.
+    """
+    if os.path.abspath(db_path) == os.path.abspath(legacy_path) or not os.path.exists(legacy_path):
+        return False
+
+    conn = connect(db_path, isolation_level=None, uri=True)
+    try:
+        # 읽기 전용으로 붙여 다른 워커가 먼저 옮긴 경우 빈 파일이 새로 생기지 않게 한다
+        conn.execute('ATTACH DATABASE ? AS legacy', (f'file:{pathname2url(os.path.abspath(legacy_path))}?mode=ro',))
+        if 'budgets' not in _table_names(conn, 'legacy'):
+            return False
+
+        # 쓰기 잠금을 잡은 뒤 확인 (동시 기동한 워커의 중복 이전 방지)
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if 'budgets' in _table_names(conn):
+                conn.execute('ROLLBACK')
+                print(f"예산 원장이 이미 {db_path}에 있어 이전 파일을 옮기지 않습니다: {legacy_path}")
+                return False
+
+            # 카탈로그 테이블처럼 db_path에 이미 있는 테이블은 건드리지 않는다
+            tables = sorted(_table_names(conn, 'legacy') - _table_names(conn) - {'sqlite_sequence'})
+            for table in tables:
+                create_sql = conn.execute(
+                    "SELECT sql FROM legacy.sqlite_master WHERE type = 'table' AND name = ?", (table,)
+                ).fetchone()[0]
+                conn.execute(create_sql)
+                conn.execute(f'INSERT INTO main."{table}" SELECT * FROM legacy."{table}"')
+            index_rows = conn.execute(
+                "SELECT sql FROM legacy.sqlite_master WHERE type = 'index' AND sql IS NOT NULL AND tbl_name IN "
+                f"({', '.join('?' for _ in tables)})", tables
+            ).fetchall()
+            for (index_sql,) in index_rows:
+                conn.execute(index_sql)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+    finally:
+        conn.close()
+
+    os.replace(legacy_path, legacy_path + '.migrated')
+    print(f"예산 원장 이전 완료: {legacy_path} -> {db_path} (테이블 {', '.join(tables)})")
+    return True
@@ -1,152 +1,545 @@
 # 간단한 샘플 데이터로 시작
-import sqlite3
 import os
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime
-import re
+import glob
+import hashlib
+import threading
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+from datetime import date, datetime
+
+from services.bulk_loader import BulkLoader
+from services.incremental_loader import IncrementalLoader
+from services.text_search import build_match_query
+from services.lru_cache import LRUCache
+from services.geocoder import bounding_box, get_geocoder, haversine_km
+from services.address_parser import normalize_sido, parse_address
+from services.event_dates import normalize_period, parse_date
+from services.feature_flags import FeatureFlags
+from services.memory_catalog import MemoryCatalog, MemoryCatalogHolder
+from services.event_candidates import nearest_candidates
+from models.connection import DB_PATH, connect, get_connection
+
+# 적재 파이프라인 버전 (스키마·가공 방식이 바뀌면 올려서 재적재 유도)
+LOADER_VERSION = '10'
+
+# 적재 대상 원본 CSV 파일
+RESTAURANT_CSV = '소상공인시장진흥공단_전국 백년가게 지정리스트 현황 정보_20250724.csv'
+EVENT_CSV = '(재)연구개발특구진흥재단_행사일정_20250714.csv'
+# 유관기관 일정은 월별 누적 내보내기 파일을 파일명(작성 기준일) 순으로 증분 반영
+SCHEDULE_CSV_PATTERN = '(재)연구개발특구진흥재단_재단 유관기관 일정_*.csv'
+
+# 테이블 스키마 ({table}은 실제 테이블 또는 스테이징 테이블명)
+TABLE_SCHEMAS = {
+    'restaurants': '''
+        CREATE TABLE IF NOT EXISTS {table} (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            address TEXT NOT NULL,
+            phone TEXT,
+            region TEXT,
+            sido TEXT,
+            sigungu TEXT,
+            eupmyeondong TEXT,
+            business_type TEXT,
+            has_private_room INTEGER DEFAULT 0,
+            noise_level TEXT DEFAULT "mid",
+            max_party_size INTEGER DEFAULT 4,
+            tax_invoice_supported INTEGER DEFAULT 0,
+            card_payment_supported INTEGER DEFAULT 1,
+            lat REAL,
+            lon REAL,
+            geo_precision TEXT,
+            sample_rank INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''',
+    'events': '''
+        CREATE TABLE IF NOT EXISTS {table} (
+            id INTEGER PRIMARY KEY,
+            organization TEXT,
+            event_name TEXT NOT NULL,
+            host_organization TEXT,
+            region TEXT,
+            location TEXT,
+            tech_category TEXT,
+            hashtags TEXT,
+            start_date TEXT,
+            end_date TEXT,
+            start_ord INTEGER,
+            end_ord INTEGER,
+            lat REAL,
+            lon REAL,
+            geo_precision TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    '''
+}
+
+# 적재 완료 후 생성하는 인덱스
+TABLE_INDEXES = {
+    'restaurants': [
+        'CREATE INDEX IF NOT EXISTS idx_restaurants_region ON {table}(region)',
+        'CREATE INDEX IF NOT EXISTS idx_restaurants_sample_rank ON {table}(sample_rank)',
+        'CREATE INDEX IF NOT EXISTS idx_restaurants_admin_area ON {table}(sido, sigungu, eupmyeondong)',
+        'CREATE INDEX IF NOT EXISTS idx_restaurants_business_type ON {table}(business_type)'
+    ],
+    'events': [
+        'CREATE INDEX IF NOT EXISTS idx_events_region ON {table}(region)',
+        'CREATE INDEX IF NOT EXISTS idx_events_location ON {table}(location)',
+        'CREATE INDEX IF NOT EXISTS idx_events_region_start ON {table}(region, start_ord)',
+        'CREATE INDEX IF NOT EXISTS idx_events_start ON {table}(start_ord)'
+    ]
+}
+
+# 유관기관 일정 테이블 (교체 적재 대신 구분(id) 기준 증분 반영, row_hash로 변경 감지)
+SCHEDULE_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS schedules (
+        id INTEGER PRIMARY KEY,
+        title TEXT NOT NULL,
+        start_date TEXT,
+        end_date TEXT,
+        start_ord INTEGER,
+        end_ord INTEGER,
+        created_date TEXT,
+        row_hash TEXT NOT NULL
+    )
+'''
+SCHEDULE_INDEXES = [
+    'CREATE INDEX IF NOT EXISTS idx_schedules_start ON schedules(start_ord)',
+    'CREATE INDEX IF NOT EXISTS idx_schedules_created ON schedules(created_date)'
+]
+SCHEDULE_COLUMNS = ('id', 'title', 'start_date', 'end_date', 'start_ord', 'end_ord', 'created_date')
+
+# 행사별 근처 백년가게 후보 (적재 시 행사장 좌표 기준 가까운 순으로 미리 계산)
+EVENT_CANDIDATE_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS event_restaurant_candidates (
+        event_id INTEGER NOT NULL,
+        rank INTEGER NOT NULL,
+        restaurant_id INTEGER NOT NULL,
+        distance_km REAL NOT NULL,
+        distance_bucket INTEGER,
+        score REAL NOT NULL,
+        PRIMARY KEY (event_id, rank)
+    ) WITHOUT ROWID
+'''
+# 행사당 미리 계산해 두는 후보 수
+EVENT_CANDIDATE_LIMIT = 30
+
+# FTS5 전문 검색 색인: 기준 테이블 -> (FTS 테이블, 색인 컬럼)
+# 컬럼 값은 ngram_tokens()로 bigram·unigram 분해하여 저장하고 기준 테이블 트리거로 동기화
+SEARCH_INDEXES = {
+    'restaurants': ('restaurants_fts', ('name', 'address')),
+    'events': ('events_fts', ('event_name', 'location', 'hashtags')),
+    'schedules': ('schedules_fts', ('title',))
+}
+
+def _schema_columns(create_sql: str) -> List[Tuple[str, str]]:
+    """테이블 DDL의 (컬럼명, 컬럼 정의) 목록"""
+    body = create_sql[create_sql.index('(') + 1:create_sql.rindex(')')]
+    columns = []
+    for line in body.splitlines():
+        definition = line.strip().rstrip(',')
+        if definition and not definition.upper().startswith(('PRIMARY KEY', 'UNIQUE', 'FOREIGN KEY')):
+            name, _, column_type = definition.partition(' ')
+            columns.append((name, column_type))
+    return columns
+
+def _search_index_sqls(table: str) -> Tuple[str, List[str]]:
+    """기준 테이블의 FTS 테이블 DDL과 동기화 트리거 DDL 생성"""
+    fts_table, columns = SEARCH_INDEXES[table]
+    column_list = ', '.join(columns)
+    new_values = ', '.join(f'ngram_tokens(new.{column})' for column in columns)
+    
+    create_sql = f'''
+        CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table}
+        USING fts5({column_list}, tokenize = 'unicode61')
+    '''
+    trigger_sqls = [
+        f'''
+        CREATE TRIGGER IF NOT EXISTS {table}_fts_ai AFTER INSERT ON {table} BEGIN
+            INSERT INTO {fts_table} (rowid, {column_list}) VALUES (new.id, {new_values});
+        END
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS {table}_fts_ad AFTER DELETE ON {table} BEGIN
+            DELETE FROM {fts_table} WHERE rowid = old.id;
+        END
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS {table}_fts_au AFTER UPDATE OF id, {column_list} ON {table} BEGIN
+            DELETE FROM {fts_table} WHERE rowid = old.id;
+            INSERT INTO {fts_table} (rowid, {column_list}) VALUES (new.id, {new_values});
+        END
+        '''
+    ]
+    return create_sql, trigger_sqls
+
+# R*Tree 공간 색인: 기준 테이블 -> rtree 테이블 (점 좌표를 min=max 상자로 저장, 적재 시 재구성)
+SPATIAL_INDEXES = {
+    'restaurants': 'restaurants_geo',
+    'events': 'events_geo'
+}
+
+# 오프라인 지오코딩 결과 컬럼 (위도, 경도, 정밀도)
+GEO_COLUMNS = ('lat', 'lon', 'geo_precision')
+
+# 주소를 분해한 행정구역 컬럼 (시도, 시군구, 읍면동)
+ADMIN_AREA_COLUMNS = ('sido', 'sigungu', 'eupmyeondong')
+
+RESTAURANT_COLUMNS = ('id', 'name', 'address', 'phone', 'region') + ADMIN_AREA_COLUMNS + GEO_COLUMNS + ('sample_rank',)
+EVENT_COLUMNS = ('id', 'organization', 'event_name', 'host_organization', 'region',
+                 'location', 'tech_category', 'hashtags', 'start_date', 'end_date',
+                 'start_ord', 'end_ord') + GEO_COLUMNS
+
+# 근접 검색 시 후보 상자의 시작 반경과 최대 반경(km)
+NEARBY_START_RADIUS_KM = 2.0
+NEARBY_MAX_RADIUS_KM = 500.0
+
+# 근처 예정 행사 조회의 기본 반경(km)
+UPCOMING_EVENT_RADIUS_KM = 20.0
+
+# 표본 추출 순위 값의 범위 (0 이상 SAMPLE_RANK_SPACE 미만)
+SAMPLE_RANK_SPACE = 1 << 31
+
+# scripts/enhance_restaurant_data.py가 채우는 보강 컬럼 (재적재 시 유지)
+RESTAURANT_ENRICHMENT_COLUMNS = ('business_type', 'has_private_room', 'noise_level',
+                                 'max_party_size', 'tax_invoice_supported', 'card_payment_supported')
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+def _sql_limit(limit: Optional[int]) -> int:
+    """LIMIT 절 값 (None이면 SQLite의 무제한 값 -1)"""
+    return -1 if limit is None else limit
+
+def sample_rank(key: Any) -> int:
+    """키에서 결정적으로 만든 의사 난수 순위 (재적재해도 같은 행은 같은 값)"""
+    digest = hashlib.sha256(str(key).encode('utf-8')).digest()
+    return int.from_bytes(digest[:4], 'big') % SAMPLE_RANK_SPACE
+
+def find_data_file(filename: str) -> Optional[str]:
+    """데이터 파일 경로 탐색 (backend/data, 실행 위치 기준 순)"""
+    candidates = [
+        os.path.join(DATA_DIR, filename),
+        os.path.join('data', filename),
+        os.path.join('..', 'data', filename),
+        filename
+    ]
+    for file_path in candidates:
+        if os.path.exists(file_path):
+            return file_path
+    return None
 
 class DatabaseManager:
     """SQLite 데이터베이스 관리 클래스"""
     
-    def __init__(self, db_path: str = "hungry_people.db"):
+    def __init__(self, db_path: str = DB_PATH, auto_load: bool = True,
+                 memory_engine: Optional[bool] = None):
         self.db_path = db_path
+        # 자주 조회되는 백년가게 상세 정보 캐시 (데이터셋 태그가 바뀌면 비움)
+        self._restaurant_cache = LRUCache(maxsize=2048)
+        self._restaurant_cache_tag = None
+        # 메모리 조회 엔진 (활성화 시 목록·검색 조회를 SQLite 대신 메모리 카탈로그에서 처리)
+        if memory_engine is None:
+            memory_engine = FeatureFlags.is_memory_engine_enabled()
+        self._memory = MemoryCatalogHolder(lambda: connect(self.db_path), self.get_dataset_tag) if memory_engine else None
         self.init_database()
-        self.load_sample_data()
+        if auto_load:
+            self.ensure_data_loaded()
     
     def init_database(self):
         """데이터베이스 초기화 및 테이블 생성"""
-        conn = sqlite3.connect(self.db_path)
+        conn = connect(self.db_path)
         cursor = conn.cursor()
         
-        # 백년가게 테이블
+        # 백년가게 / 행사일정 테이블, 인덱스, 전문 검색 색인
+        for table, create_sql in TABLE_SCHEMAS.items():
+            cursor.execute(create_sql.format(table=table))
+            self._add_missing_columns(cursor, table, create_sql)
+            for index_sql in TABLE_INDEXES[table]:
+                cursor.execute(index_sql.format(table=table))
+            fts_sql, trigger_sqls = _search_index_sqls(table)
+            cursor.execute(fts_sql)
+            for trigger_sql in trigger_sqls:
+                cursor.execute(trigger_sql)
+            cursor.execute(f'''
+                CREATE VIRTUAL TABLE IF NOT EXISTS {SPATIAL_INDEXES[table]}
+                USING rtree(id, min_lat, max_lat, min_lon, max_lon)
+            ''')
+        
+        # 유관기관 일정 테이블 (증분 반영이므로 FTS 색인은 트리거로만 동기화)
+        cursor.execute(SCHEDULE_SCHEMA)
+        for index_sql in SCHEDULE_INDEXES:
+            cursor.execute(index_sql)
+        fts_sql, trigger_sqls = _search_index_sqls('schedules')
+        cursor.execute(fts_sql)
+        for trigger_sql in trigger_sqls:
+            cursor.execute(trigger_sql)
+        
+        # 행사별 근처 백년가게 후보 테이블
+        cursor.execute(EVENT_CANDIDATE_SCHEMA)
+        
+        # 적재 메타데이터 테이블 (원본 해시, 데이터셋 버전)
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS restaurants (
-                id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                address TEXT NOT NULL,
-                phone TEXT,
-                region TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            CREATE TABLE IF NOT EXISTS dataset_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
             )
         ''')
         
-        # 행사일정 테이블
+        # 적재 시 갱신하는 집계 테이블 (지역별·기술분류별 건수, 행사 기간)
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS events (
-                id INTEGER PRIMARY KEY,
-                organization TEXT,
-                event_name TEXT NOT NULL,
-                host_organization TEXT,
-                region TEXT,
-                location TEXT,
-                tech_category TEXT,
-                hashtags TEXT,
-                start_date TEXT,
-                end_date TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
+            CREATE TABLE IF NOT EXISTS dataset_stats (
+                metric TEXT NOT NULL,
+                dimension TEXT NOT NULL DEFAULT '',
+                count INTEGER,
+                value TEXT,
+                PRIMARY KEY (metric, dimension)
+            ) WITHOUT ROWID
         ''')
         
-        # 지역별 인덱스 생성
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_restaurants_region ON restaurants(region)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_region ON events(region)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_location ON events(location)')
-        
         conn.commit()
         conn.close()
     
-    def load_sample_data(self):
-        """전체 데이터 로드"""
-        conn = sqlite3.connect(self.db_path)
+    def _add_missing_columns(self, cursor, table: str, create_sql: str):
+        """이전 버전에서 만든 테이블에 없는 컬럼 추가
+        
+        인덱스 대상 컬럼(sample_rank, 행정구역, start_ord 등)이 없으면 인덱스 생성이 실패하므로
+        먼저 빈 컬럼으로 추가해 둔다. 값은 원본 해시가 바뀌어 일어나는 재적재에서 채워진다.
+        """
+        cursor.execute(f'PRAGMA table_info({table})')
+        existing = {row[1] for row in cursor.fetchall()}
+        for name, definition in _schema_columns(create_sql):
+            if name not in existing:
+                cursor.execute(f'ALTER TABLE {table} ADD COLUMN {name} {definition}')
+    
+    def compute_source_hash(self) -> str:
+        """원본 CSV 파일 내용의 SHA-256 해시 계산"""
+        digest = hashlib.sha256(LOADER_VERSION.encode('utf-8'))
+        for filename in (RESTAURANT_CSV, EVENT_CSV):
+            digest.update(filename.encode('utf-8'))
+            file_path = find_data_file(filename)
+            if not file_path:
+                digest.update(b'<missing>')
+                continue
+            with open(file_path, 'rb') as file:
+                for chunk in iter(lambda: file.read(1 << 20), b''):
+                    digest.update(chunk)
+        return digest.hexdigest()
+    
+    def get_meta(self, key: str) -> Optional[str]:
+        """적재 메타데이터 조회"""
+        conn = get_connection(self.db_path)
         cursor = conn.cursor()
         
-        # 기존 데이터 삭제
-        cursor.execute('DELETE FROM restaurants')
-        cursor.execute('DELETE FROM events')
+        cursor.execute('SELECT value FROM dataset_meta WHERE key = ?', (key,))
+        row = cursor.fetchone()
+        
+        return row[0] if row else None
+    
+    def get_dataset_version(self) -> int:
+        """데이터셋 버전 조회 (재적재마다 1씩 증가)"""
+        return int(self.get_meta('dataset_version') or 0)
+    
+    def ensure_data_loaded(self) -> bool:
+        """원본 CSV가 변경된 경우에만 데이터 재적재 (유관기관 일정은 증분 반영)"""
+        source_hash = self.compute_source_hash()
+        loaded = False
+        if self.get_meta('source_hash') != source_hash:
+            loaded = self.load_sample_data(source_hash)
+        self.sync_schedules()
+        return loaded
+    
+    def find_schedule_files(self) -> List[str]:
+        """유관기관 일정 내보내기 파일 목록 (파일명 순 = 작성 기준일 순)"""
+        for directory in (DATA_DIR, 'data', os.path.join('..', 'data')):
+            files = glob.glob(os.path.join(glob.escape(directory), SCHEDULE_CSV_PATTERN))
+            if files:
+                return sorted(files, key=os.path.basename)
+        return []
+    
+    def sync_schedules(self, file_paths: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        유관기관 일정 파일의 새 행·변경 행만 schedules 테이블에 반영
+        
+        파일마다 내용 해시를 기록해 두고, 바뀐(또는 새로 추가된) 파일 중 가장 앞선 파일부터
+        끝까지만 읽는다. 뒤 파일이 앞 파일의 최신본이므로 앞 파일만 다시 내보내졌어도
+        뒤 파일이 그 위에 다시 반영된다. 읽은 행은 모두 구분(id)별 row_hash와 비교해
+        추가·갱신하므로 예전 작성일의 행이 수정되어도 반영되고, 쓰기 비용은 바뀐 행 수에 비례한다.
+        원본에서 사라진 행은 삭제하지 않는다.
+        
+        Returns:
+            Dict[str, Any]: inserted, updated, unchanged 건수와 작성일 최댓값(watermark)
+                (바뀐 파일이 없으면 빈 딕셔너리)
+        """
+        if file_paths is None:
+            file_paths = self.find_schedule_files()
+        
+        file_hashes = []
+        for file_path in file_paths:
+            digest = hashlib.sha256(LOADER_VERSION.encode('utf-8'))
+            with open(file_path, 'rb') as file:
+                for chunk in iter(lambda: file.read(1 << 20), b''):
+                    digest.update(chunk)
+            file_hashes.append((f'schedule_file:{os.path.basename(file_path)}', digest.hexdigest()))
+        if not self._changed_schedule_files(get_connection(self.db_path).cursor(), file_hashes):
+            return {}
         
-        # 전체 백년가게 데이터 로드
+        conn = connect(self.db_path, isolation_level=None)
+        cursor = conn.cursor()
+        
+        # 쓰기 잠금을 잡은 뒤 해시를 다시 확인 (동시 기동한 워커의 중복 반영 방지)
+        cursor.execute('BEGIN IMMEDIATE')
         try:
+            changed = self._changed_schedule_files(cursor, file_hashes)
+            if not changed:
+                cursor.execute('ROLLBACK')
+                return {}
+            
             from services.data_processor import DataProcessor
             processor = DataProcessor()
+            loader = IncrementalLoader(cursor)
+            cursor.execute("SELECT value FROM dataset_meta WHERE key = 'schedule_watermark'")
+            row = cursor.fetchone()
+            result = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'watermark': row[0] if row else None}
+            for file_path in file_paths[min(changed):]:
+                print(f"유관기관 일정 파일 발견: {file_path}")
+                rows = (self._schedule_row(row) for row in processor.iter_schedule_data(file_path))
+                applied = loader.apply('schedules', 'id', SCHEDULE_COLUMNS, rows, version_column='created_date')
+                for key in ('inserted', 'updated', 'unchanged'):
+                    result[key] += applied[key]
+                if applied['watermark'] and (not result['watermark'] or applied['watermark'] > result['watermark']):
+                    result['watermark'] = applied['watermark']
             
-            # 파일 경로 확인
-            import os
-            csv_files = [
-                'data/소상공인시장진흥공단_전국 백년가게 지정리스트 현황 정보_20250724.csv',
-                '../data/소상공인시장진흥공단_전국 백년가게 지정리스트 현황 정보_20250724.csv',
-                '소상공인시장진흥공단_전국 백년가게 지정리스트 현황 정보_20250724.csv'
-            ]
+            meta_rows = list(file_hashes)
+            if result['watermark']:
+                meta_rows.append(('schedule_watermark', result['watermark']))
+            cursor.executemany('INSERT OR REPLACE INTO dataset_meta (key, value) VALUES (?, ?)', meta_rows)
+            if result['inserted'] or result['updated']:
+                self._refresh_schedule_stats(cursor)
+                # 데이터셋 버전을 올려 응답 캐시가 바뀐 일정을 다시 읽도록 함
+                cursor.execute('''
+                    UPDATE dataset_meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'dataset_version'
+                ''')
+            cursor.execute('COMMIT')
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+        
+        print(f"유관기관 일정 반영 완료: 추가 {result['inserted']}개, 갱신 {result['updated']}개, "
+              f"변경 없음 {result['unchanged']}개")
+        return result
+    
+    def _changed_schedule_files(self, cursor, file_hashes: Sequence[Tuple[str, str]]) -> List[int]:
+        """기록된 해시와 다른 유관기관 일정 파일의 위치 목록"""
+        if not file_hashes:
+            return []
+        keys = [key for key, _ in file_hashes]
+        cursor.execute(f'''
+            SELECT key, value FROM dataset_meta WHERE key IN ({','.join('?' for _ in keys)})
+        ''', keys)
+        recorded = dict(cursor.fetchall())
+        return [position for position, (key, file_hash) in enumerate(file_hashes) if recorded.get(key) != file_hash]
+    
+    def _schedule_row(self, row: Dict[str, Any]) -> Tuple:
+        """정제된 유관기관 일정 행을 SCHEDULE_COLUMNS 순서의 튜플로 변환 (기간·작성일 정규화)"""
+        start_date, end_date, start_ord, end_ord = normalize_period(row['start_date'], row['end_date'])
+        created = parse_date(row['created_date'])
+        created_date = created.isoformat() if created else row['created_date']
+        return (row['id'], row['title'], start_date, end_date, start_ord, end_ord, created_date)
+    
+    def load_sample_data(self, source_hash: Optional[str] = None) -> bool:
+        """전체 데이터 로드
+        
+        Args:
+            source_hash: 적재할 원본 해시. 다른 프로세스가 이미 같은 해시로
+                적재를 마쳤다면 다시 적재하지 않는다.
             
-            restaurant_file = None
-            for file_path in csv_files:
-                if os.path.exists(file_path):
-                    restaurant_file = file_path
-                    print(f"백년가게 파일 발견: {file_path}")
-                    break
+        Returns:
+            bool: 실제로 적재를 수행했는지 여부
+        """
+        if source_hash is None:
+            source_hash = self.compute_source_hash()
+        
+        conn = connect(self.db_path, isolation_level=None)
+        cursor = conn.cursor()
+        
+        # 쓰기 잠금을 먼저 잡고 해시를 다시 확인 (동시 기동한 워커의 중복 적재 방지)
+        cursor.execute('BEGIN IMMEDIATE')
+        cursor.execute('SELECT value FROM dataset_meta WHERE key = ?', ('source_hash',))
+        row = cursor.fetchone()
+        if row and row[0] == source_hash:
+            cursor.execute('ROLLBACK')
+            conn.close()
+            return False
+        
+        # 스테이징 테이블에 적재 후 교체 (커밋 전까지 다른 연결은 기존 데이터 조회)
+        loaded_source = True
+        try:
+            from services.data_processor import DataProcessor
+            processor = DataProcessor()
             
+            # 파일 경로 확인
+            restaurant_file = find_data_file(RESTAURANT_CSV)
             if not restaurant_file:
                 raise Exception("백년가게 CSV 파일을 찾을 수 없습니다")
+            print(f"백년가게 파일 발견: {restaurant_file}")
             
             # 백년가게 데이터 로드
-            restaurant_data = processor.load_restaurant_data(restaurant_file)
-            for restaurant in restaurant_data:
-                cursor.execute('''
-                    INSERT INTO restaurants (id, name, address, phone, region)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (
-                    restaurant['id'],
-                    restaurant['name'],
-                    restaurant['address'],
-                    restaurant['phone'],
-                    restaurant['region']
-                ))
+            restaurant_data = processor.iter_restaurant_data(restaurant_file)
+            restaurant_count = self._bulk_load_restaurants(cursor, restaurant_data)
             
             # 행사일정 파일 찾기
-            event_files = [
-                'data/(재)연구개발특구진흥재단_행사일정_20250714.csv',
-                '../data/(재)연구개발특구진흥재단_행사일정_20250714.csv',
-                '(재)연구개발특구진흥재단_행사일정_20250714.csv'
-            ]
-            
-            event_file = None
-            for file_path in event_files:
-                if os.path.exists(file_path):
-                    event_file = file_path
-                    print(f"행사일정 파일 발견: {file_path}")
-                    break
+            event_file = find_data_file(EVENT_CSV)
             
             if event_file:
+                print(f"행사일정 파일 발견: {event_file}")
                 # 행사일정 데이터 로드
-                event_data = processor.load_event_data(event_file)
-                for event in event_data:
-                    cursor.execute('''
-                        INSERT INTO events (id, organization, event_name, host_organization, 
-                                           region, location, tech_category, hashtags, start_date, end_date)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        event['id'],
-                        event['organization'],
-                        event['event_name'],
-                        event['host_organization'],
-                        event['region'],
-                        event['location'],
-                        event['tech_category'],
-                        event['hashtags'],
-                        event['start_date'],
-                        event['end_date']
-                    ))
+                event_data = processor.iter_event_data(event_file)
+                self._bulk_load_events(cursor, event_data)
             else:
                 print("행사일정 파일을 찾을 수 없어 백년가게만 로드합니다")
+                self._bulk_load_events(cursor, [])
             
-            print(f"전체 데이터 로드 완료: 백년가게 {len(restaurant_data)}개")
+            print(f"전체 데이터 로드 완료: 백년가게 {restaurant_count}개")
             
         except Exception as e:
             print(f"전체 데이터 로드 실패, 샘플 데이터 사용: {e}")
             # 샘플 데이터로 폴백
             self._load_fallback_data(cursor)
+            loaded_source = False
         
-        conn.commit()
+        # 유관기관 일정은 증분 반영이므로 색인 토큰 방식이 바뀌는 재적재 때 함께 재구성
+        self._rebuild_search_index(cursor, 'schedules')
+        self._rebuild_event_candidates(cursor)
+        self._refresh_stats(cursor)
+        
+        # 적재 메타데이터 갱신
+        dataset_version = 0
+        cursor.execute('SELECT value FROM dataset_meta WHERE key = ?', ('dataset_version',))
+        row = cursor.fetchone()
+        if row:
+            dataset_version = int(row[0])
+        meta_rows = [
+            ('dataset_version', str(dataset_version + 1)),
+            ('loaded_at', datetime.now().isoformat())
+        ]
+        if loaded_source:
+            meta_rows.append(('source_hash', source_hash))
+        else:
+            # 폴백 데이터는 원본 해시를 남기지 않아 다음 기동 때 원본 적재를 다시 시도
+            cursor.execute("DELETE FROM dataset_meta WHERE key = 'source_hash'")
+        cursor.executemany('''
+            INSERT OR REPLACE INTO dataset_meta (key, value) VALUES (?, ?)
+        ''', meta_rows)
+        
+        cursor.execute('COMMIT')
         conn.close()
+        
+        self._restaurant_cache.clear()
+        if self._memory:
+            self._memory.refresh()
+        return True
     
     def _load_fallback_data(self, cursor):
         """폴백 샘플 데이터"""
@@ -158,138 +551,700 @@ class DatabaseManager:
             (5, '고려회관', '대전 중구 중앙로109번길 30, 2층', '', '대전')
         ]
         
-        cursor.executemany('''
-            INSERT INTO restaurants (id, name, address, phone, region)
-            VALUES (?, ?, ?, ?, ?)
-        ''', sample_restaurants)
+        self._bulk_load_restaurants(cursor, (dict(zip(RESTAURANT_COLUMNS, row)) for row in sample_restaurants))
         
         sample_events = [
             (1, '홍보협력팀', '2023 연구개발특구 신년인사회', '연구개발특구진흥재단', '대덕특구', '대전 DCC', '기타', '#신년인사회', '2023-01-30', '2023-01-30'),
             (2, '연구개발특구진흥재단', '환경기후분야 국내외 R&BD 활성화를 위한 심포지움', '인천대학교 환경공학과', '과학벨트', '경원재 엠배서더(인천 송도)', 'ET,기타', '#환경', '2023-01-12', '2023-01-12')
         ]
         
+        self._bulk_load_events(cursor, (dict(zip(EVENT_COLUMNS, row)) for row in sample_events))
+    
+    def _bulk_load_restaurants(self, cursor, rows) -> int:
+        """백년가게 행(딕셔너리)을 주소 기준으로 지오코딩해 대량 적재 후 교체"""
+        geocoder = get_geocoder()
+        rows = (dict(row, sample_rank=sample_rank(row['id']), **parse_address(row['address'])._asdict())
+                for row in rows)
+        rows = self._geocoded_rows(rows, RESTAURANT_COLUMNS,
+                                   lambda row: geocoder.geocode_address(row['address']))
+        count = BulkLoader(cursor).load(
+            'restaurants', TABLE_SCHEMAS['restaurants'], TABLE_INDEXES['restaurants'],
+            RESTAURANT_COLUMNS, rows, preserve_columns=RESTAURANT_ENRICHMENT_COLUMNS,
+            trigger_sqls=_search_index_sqls('restaurants')[1]
+        )
+        self._rebuild_search_index(cursor, 'restaurants')
+        self._rebuild_spatial_index(cursor, 'restaurants')
+        return count
+    
+    def _bulk_load_events(self, cursor, rows) -> int:
+        """행사일정 행(딕셔너리)의 기간을 정규화하고 행사장 기준으로 지오코딩해 대량 적재 후 교체"""
+        geocoder = get_geocoder()
+        rows = (dict(row, **dict(zip(('start_date', 'end_date', 'start_ord', 'end_ord'),
+                                     normalize_period(row['start_date'], row['end_date']))))
+                for row in rows)
+        rows = self._geocoded_rows(rows, EVENT_COLUMNS,
+                                   lambda row: geocoder.geocode_location(row['location'], row['region']))
+        count = BulkLoader(cursor).load(
+            'events', TABLE_SCHEMAS['events'], TABLE_INDEXES['events'],
+            EVENT_COLUMNS, rows, trigger_sqls=_search_index_sqls('events')[1]
+        )
+        self._rebuild_search_index(cursor, 'events')
+        self._rebuild_spatial_index(cursor, 'events')
+        return count
+    
+    def _geocoded_rows(self, rows, columns: Sequence[str], geocode):
+        """딕셔너리 행에 좌표를 붙여 columns 순서의 튜플로 변환"""
+        for row in rows:
+            row['lat'], row['lon'], row['geo_precision'] = geocode(row) or (None, None, None)
+            yield tuple(row[column] for column in columns)
+    
+    def _rebuild_event_candidates(self, cursor):
+        """교체된 두 테이블 기준으로 행사별 근처 백년가게 후보 재계산 (좌표 없는 행사는 제외)"""
+        cursor.execute('SELECT id, lat, lon FROM events WHERE lat IS NOT NULL AND lon IS NOT NULL ORDER BY id')
+        events = cursor.fetchall()
+        cursor.execute('SELECT id, lat, lon FROM restaurants WHERE lat IS NOT NULL AND lon IS NOT NULL ORDER BY id')
+        restaurants = cursor.fetchall()
+        
+        cursor.execute('DELETE FROM event_restaurant_candidates')
         cursor.executemany('''
-            INSERT INTO events (id, organization, event_name, host_organization, 
-                               region, location, tech_category, hashtags, start_date, end_date)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', sample_events)
+            INSERT INTO event_restaurant_candidates
+                (event_id, rank, restaurant_id, distance_km, distance_bucket, score)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', nearest_candidates(events, restaurants, EVENT_CANDIDATE_LIMIT))
     
-    def get_restaurants_by_region(self, region: str) -> List[Dict[str, Any]]:
-        """지역별 백년가게 조회"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def _refresh_stats(self, cursor):
+        """적재된 데이터 기준으로 집계 테이블 재계산"""
+        cursor.execute('DELETE FROM dataset_stats')
+        self._refresh_schedule_stats(cursor)
         
         cursor.execute('''
-            SELECT * FROM restaurants WHERE region = ?
-        ''', (region,))
+            INSERT INTO dataset_stats (metric, dimension, count)
+            SELECT 'restaurants', '', COUNT(*) FROM restaurants
+            UNION ALL
+            SELECT 'events', '', COUNT(*) FROM events
+            UNION ALL
+            SELECT 'restaurants_by_region', region, COUNT(*) FROM restaurants
+            WHERE region IS NOT NULL AND region != '' GROUP BY region
+            UNION ALL
+            SELECT 'events_by_region', region, COUNT(*) FROM events
+            WHERE region IS NOT NULL AND region != '' GROUP BY region
+        ''')
         
-        columns = [description[0] for description in cursor.description]
-        results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        # 기술 분류는 "ET,기타"처럼 여러 값이 콤마로 이어져 있으므로 나누어 집계
+        tech_counts = {}
+        cursor.execute("SELECT tech_category FROM events WHERE tech_category IS NOT NULL AND tech_category != ''")
+        for (tech_category,) in cursor.fetchall():
+            for category in {part.strip() for part in tech_category.split(',') if part.strip()}:
+                tech_counts[category] = tech_counts.get(category, 0) + 1
+        cursor.executemany('''
+            INSERT INTO dataset_stats (metric, dimension, count) VALUES ('events_by_tech_category', ?, ?)
+        ''', tech_counts.items())
         
-        conn.close()
-        return results
+        cursor.execute('''
+            INSERT INTO dataset_stats (metric, dimension, value)
+            SELECT 'event_date_range', 'from', MIN(start_date) FROM events WHERE start_date != ''
+            UNION ALL
+            SELECT 'event_date_range', 'to', MAX(end_date) FROM events WHERE end_date != ''
+        ''')
+        
+        # 기간 겹침 조회가 시작일 범위만 훑도록 가장 긴 행사 기간(일)을 기록
+        cursor.execute('''
+            INSERT INTO dataset_stats (metric, dimension, count)
+            SELECT 'event_max_duration', '', COALESCE(MAX(end_ord - start_ord), 0) FROM events
+        ''')
+    
+    def _refresh_schedule_stats(self, cursor):
+        """유관기관 일정 건수와 가장 긴 일정 기간(일) 재계산"""
+        cursor.execute('''
+            INSERT OR REPLACE INTO dataset_stats (metric, dimension, count)
+            SELECT 'schedules', '', COUNT(*) FROM schedules
+            UNION ALL
+            SELECT 'schedule_max_duration', '', COALESCE(MAX(end_ord - start_ord), 0) FROM schedules
+        ''')
+    
+    def _rebuild_search_index(self, cursor, table: str):
+        """교체된 테이블 기준으로 FTS 색인 일괄 재구성"""
+        fts_table, columns = SEARCH_INDEXES[table]
+        column_list = ', '.join(columns)
+        token_list = ', '.join(f'ngram_tokens({column})' for column in columns)
+        
+        cursor.execute(f'DELETE FROM {fts_table}')
+        cursor.execute(f'''
+            INSERT INTO {fts_table} (rowid, {column_list})
+            SELECT id, {token_list} FROM {table}
+        ''')
+        cursor.execute(f"INSERT INTO {fts_table} ({fts_table}) VALUES ('optimize')")
+    
+    def _rebuild_spatial_index(self, cursor, table: str):
+        """교체된 테이블 기준으로 R*Tree 공간 색인 일괄 재구성"""
+        geo_table = SPATIAL_INDEXES[table]
+        
+        cursor.execute(f'DELETE FROM {geo_table}')
+        cursor.execute(f'''
+            INSERT INTO {geo_table} (id, min_lat, max_lat, min_lon, max_lon)
+            SELECT id, lat, lat, lon, lon FROM {table} WHERE lat IS NOT NULL AND lon IS NOT NULL
+        ''')
+    
+    def _memory_catalog(self) -> Optional[MemoryCatalog]:
+        """메모리 조회 엔진이 켜져 있으면 현재 적재본의 카탈로그 반환"""
+        return self._memory.get() if self._memory else None
     
-    def get_restaurants_by_keyword(self, keyword: str) -> List[Dict[str, Any]]:
-        """키워드로 백년가게 검색"""
-        conn = sqlite3.connect(self.db_path)
+    def _fetch_all(self, query: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """쿼리 결과를 딕셔너리 리스트로 반환"""
+        conn = get_connection(self.db_path)
         cursor = conn.cursor()
         
-        if keyword:
-            cursor.execute('''
-                SELECT * FROM restaurants 
-                WHERE name LIKE ? OR address LIKE ?
-            ''', (f'%{keyword}%', f'%{keyword}%'))
-        else:
-            cursor.execute('SELECT * FROM restaurants')
+        cursor.execute(query, params)
         
         columns = [description[0] for description in cursor.description]
         results = [dict(zip(columns, row)) for row in cursor.fetchall()]
         
-        conn.close()
         return results
     
-    def get_events_by_region(self, region: str) -> List[Dict[str, Any]]:
+    def _list_by_id(self, table: str, where: str, params: List[Any],
+                    limit: Optional[int], offset: int, after_id: Optional[int]) -> List[Dict[str, Any]]:
+        """id 순 목록 조회 (after_id 키셋 또는 offset 페이지네이션)"""
+        if after_id is not None:
+            where += ' AND id > ?'
+            params = params + [after_id]
+        
+        return self._fetch_all(f'''
+            SELECT * FROM {table} WHERE {where}
+            ORDER BY id
+            LIMIT ? OFFSET ?
+        ''', params + [_sql_limit(limit), offset])
+    
+    def get_restaurants_by_region(self, region: str, limit: Optional[int] = None,
+                                  offset: int = 0, after_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """지역별 백년가게 조회"""
+        catalog = self._memory_catalog()
+        if catalog:
+            restaurants = catalog.restaurants
+            return restaurants.page(restaurants.lookup('region', region), limit, offset, after_id)
+        return self._list_by_id('restaurants', 'region = ?', [region], limit, offset, after_id)
+    
+    def get_restaurants_by_business_type(self, business_type: str, limit: Optional[int] = None,
+                                         offset: int = 0, after_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """업종별 백년가게 조회"""
+        catalog = self._memory_catalog()
+        if catalog:
+            restaurants = catalog.restaurants
+            return restaurants.page(restaurants.lookup('business_type', business_type), limit, offset, after_id)
+        return self._list_by_id('restaurants', 'business_type = ?', [business_type], limit, offset, after_id)
+    
+    def get_restaurants_by_admin_area(self, sido: str, sigungu: Optional[str] = None,
+                                      eupmyeondong: Optional[str] = None, limit: Optional[int] = None,
+                                      offset: int = 0, after_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        행정구역(시도 > 시군구 > 읍면동)별 백년가게 조회
+        
+        (sido, sigungu, eupmyeondong) 복합 인덱스의 앞부분 일치로 조회한다.
+        시도는 "대전광역시"처럼 전체 표기로 넘겨도 약칭으로 바꾸어 찾는다.
+        """
+        sido = normalize_sido(sido) or sido
+        catalog = self._memory_catalog()
+        if catalog:
+            restaurants = catalog.restaurants
+            positions = [
+                position for position in restaurants.lookup('sido', sido)
+                if (not sigungu or restaurants.data['sigungu'][position] == sigungu)
+                and (not sigungu or not eupmyeondong or restaurants.data['eupmyeondong'][position] == eupmyeondong)
+            ]
+            return restaurants.page(positions, limit, offset, after_id)
+        
+        where = ['sido = ?']
+        params = [sido]
+        if sigungu:
+            where.append('sigungu = ?')
+            params.append(sigungu)
+            if eupmyeondong:
+                where.append('eupmyeondong = ?')
+                params.append(eupmyeondong)
+        
+        return self._list_by_id('restaurants', ' AND '.join(where), params, limit, offset, after_id)
+    
+    def get_restaurant_by_id(self, restaurant_id: int) -> Optional[Dict[str, Any]]:
+        """id로 백년가게 조회 (기본키 조회, LRU 캐시 사용)"""
+        restaurants = self.get_restaurants_by_ids([restaurant_id])
+        return restaurants[0] if restaurants else None
+    
+    def get_restaurants_by_ids(self, restaurant_ids: Sequence[int]) -> List[Dict[str, Any]]:
+        """
+        여러 id의 백년가게를 한 번에 조회
+        
+        캐시에 없는 id만 IN 조건으로 조회하며, 결과는 요청한 id 순서(중복 제거)를 따른다.
+        존재하지 않는 id는 결과에서 빠진다. 다른 프로세스가 재적재하거나 보강 스크립트가
+        데이터셋 버전을 올리면 태그가 바뀌므로 캐시를 비우고 다시 조회한다.
+        """
+        restaurant_ids = list(dict.fromkeys(restaurant_ids))
+        catalog = self._memory_catalog()
+        if catalog:
+            rows = (catalog.restaurants.get(restaurant_id) for restaurant_id in restaurant_ids)
+            return [row for row in rows if row is not None]
+        
+        dataset_tag = self.get_dataset_tag()
+        if self._restaurant_cache_tag != dataset_tag:
+            self._restaurant_cache.clear()
+            self._restaurant_cache_tag = dataset_tag
+        
+        found = {}
+        missing = []
+        for restaurant_id in restaurant_ids:
+            cached = self._restaurant_cache.get(restaurant_id)
+            if cached is None:
+                missing.append(restaurant_id)
+            else:
+                found[restaurant_id] = cached
+        
+        # SQLite 바인드 변수 개수 제한(999)을 넘지 않도록 나누어 조회
+        for start in range(0, len(missing), 500):
+            chunk = missing[start:start + 500]
+            placeholders = ','.join('?' for _ in chunk)
+            for row in self._fetch_all(f'SELECT * FROM restaurants WHERE id IN ({placeholders})', chunk):
+                self._restaurant_cache.set(row['id'], row)
+                found[row['id']] = row
+        
+        # 캐시된 딕셔너리가 호출자에 의해 변경되지 않도록 복사본 반환
+        return [dict(found[restaurant_id]) for restaurant_id in restaurant_ids if restaurant_id in found]
+    
+    def sample_restaurants(self, where: str = '1 = 1', params: Sequence[Any] = (),
+                           limit: int = 10, seed: Optional[str] = None,
+                           offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        조건에 맞는 백년가게를 seed별로 고정된 무작위 순서로 조회
+        
+        적재 시 미리 계산한 sample_rank 순서를 seed로 정한 시작점부터 한 바퀴 돌며 읽으므로
+        ORDER BY RANDOM()처럼 전체 후보를 정렬하지 않고 인덱스에서 offset + limit개만 읽는다.
+        같은 seed와 offset이면 항상 같은 결과가 나온다.
+        
+        Args:
+            where: 추가 조건 SQL (예: "max_party_size >= ?")
+            params: where의 바인드 값
+            limit: 최대 결과 수
+            seed: 시작점을 정하는 값 (None이면 첫 순위부터)
+            offset: 건너뛸 행 수 (같은 seed로 다음 페이지 조회)
+        """
+        start = sample_rank(f'seed:{seed}') if seed is not None else 0
+        wanted = offset + limit
+        query = f'''
+            SELECT * FROM restaurants INDEXED BY idx_restaurants_sample_rank
+            WHERE sample_rank {{}} ? AND ({where})
+            ORDER BY sample_rank
+            LIMIT ?
+        '''
+        
+        rows = self._fetch_all(query.format('>='), [start] + list(params) + [wanted])
+        if len(rows) < wanted and start > 0:
+            # 순위 공간 끝에 닿으면 처음부터 시작점 직전까지 이어서 읽음
+            rows += self._fetch_all(query.format('<'), [start] + list(params) + [wanted - len(rows)])
+        
+        return rows[offset:wanted]
+    
+    def get_restaurants_by_keyword(self, keyword: str, limit: Optional[int] = None,
+                                   offset: int = 0, after_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        키워드로 백년가게 검색
+        
+        키워드가 있으면 BM25 순으로 정렬되므로 offset으로만 페이지를 넘기고,
+        키워드가 없으면 id 순 전체 목록에서 after_id 키셋 페이지네이션을 사용할 수 있다.
+        """
+        catalog = self._memory_catalog()
+        if catalog:
+            restaurants = catalog.restaurants
+            if not keyword:
+                return restaurants.page(None, limit, offset, after_id)
+            # 메모리 엔진은 업체명에 검색어가 모두 포함된 업소를 먼저, 그 안에서는 id 순
+            words = [word.lower() for word in keyword.split()]
+            positions = sorted(
+                restaurants.search(keyword),
+                key=lambda position: not all(word in restaurants.data['name'][position].lower() for word in words)
+            )
+            return restaurants.page(positions, limit, offset)
+        
+        if not keyword:
+            return self._list_by_id('restaurants', '1 = 1', [], limit, offset, after_id)
+        
+        # 전문 검색 색인 조회 (BM25 순, 업체명 가중치 2배)
+        return self._fetch_all('''
+            SELECT r.* FROM restaurants_fts
+            JOIN restaurants r ON r.id = restaurants_fts.rowid
+            WHERE restaurants_fts MATCH ?
+            ORDER BY bm25(restaurants_fts, 2.0, 1.0), r.id
+            LIMIT ? OFFSET ?
+        ''', (build_match_query(keyword) or '""', _sql_limit(limit), offset))
+    
+    def get_events_by_region(self, region: str, limit: Optional[int] = None,
+                             offset: int = 0, after_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """지역별 행사 조회"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        catalog = self._memory_catalog()
+        if catalog:
+            events = catalog.events
+            return events.page(events.lookup('region', region) if region else None, limit, offset, after_id)
+        if region:
+            return self._list_by_id('events', 'region = ?', [region], limit, offset, after_id)
+        return self._list_by_id('events', '1 = 1', [], limit, offset, after_id)
+    
+    def get_events_by_ids(self, event_ids: Sequence[int]) -> List[Dict[str, Any]]:
+        """여러 id의 행사를 요청한 id 순서(중복 제거)대로 조회 (없는 id는 제외)"""
+        event_ids = list(dict.fromkeys(event_ids))
+        catalog = self._memory_catalog()
+        if catalog:
+            rows = (catalog.events.get(event_id) for event_id in event_ids)
+            return [row for row in rows if row is not None]
+        
+        found = {}
+        for start in range(0, len(event_ids), 500):
+            chunk = event_ids[start:start + 500]
+            placeholders = ','.join('?' for _ in chunk)
+            for row in self._fetch_all(f'SELECT * FROM events WHERE id IN ({placeholders})', chunk):
+                found[row['id']] = row
+        return [found[event_id] for event_id in event_ids if event_id in found]
+    
+    def get_events_by_location(self, location: str, limit: Optional[int] = None,
+                               offset: int = 0) -> List[Dict[str, Any]]:
+        """장소별 행사 조회"""
+        return self._search_events(build_match_query(location, columns=['location']), limit, offset)
+    
+    def search_events(self, keyword: str, limit: Optional[int] = None,
+                      offset: int = 0) -> List[Dict[str, Any]]:
+        """키워드로 행사 검색 (행사명, 장소, 해시태그)"""
+        catalog = self._memory_catalog()
+        if catalog:
+            return catalog.events.page(catalog.events.search(keyword), limit, offset)
+        return self._search_events(build_match_query(keyword), limit, offset)
+    
+    def _search_events(self, match_query: str, limit: Optional[int] = None,
+                       offset: int = 0) -> List[Dict[str, Any]]:
+        """행사 전문 검색 색인 조회 (BM25 순)"""
+        if not match_query:
+            return []
+        
+        return self._fetch_all('''
+            SELECT e.* FROM events_fts
+            JOIN events e ON e.id = events_fts.rowid
+            WHERE events_fts MATCH ?
+            ORDER BY bm25(events_fts, 2.0, 1.0, 1.0), e.id
+            LIMIT ? OFFSET ?
+        ''', (match_query, _sql_limit(limit), offset))
+    
+    def get_events_in_period(self, date_from: Optional[date] = None, date_to: Optional[date] = None,
+                             region: Optional[str] = None, limit: Optional[int] = None,
+                             offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        기간이 [date_from, date_to]와 겹치는 행사 조회 (시작일, id 순)
         
+        종료일 조건만으로는 인덱스 범위를 정할 수 없으므로, 시작일 하한을 적재 시 기록한
+        가장 긴 행사 기간만큼 앞당겨 (region, start_ord) / (start_ord) 인덱스 범위만 훑고
+        종료일은 그 안에서 거른다.
+        """
+        conditions, params = self._period_conditions('event_max_duration', date_from, date_to)
         if region:
-            cursor.execute('''
-                SELECT * FROM events WHERE region = ?
-            ''', (region,))
-        else:
-            cursor.execute('SELECT * FROM events')
+            conditions.append('region = ?')
+            params.append(region)
         
-        columns = [description[0] for description in cursor.description]
-        results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        return self._fetch_all(f'''
+            SELECT * FROM events
+            WHERE {' AND '.join(conditions)}
+            ORDER BY start_ord, id
+            LIMIT ? OFFSET ?
+        ''', params + [_sql_limit(limit), offset])
+    
+    def _period_conditions(self, duration_metric: str, date_from: Optional[date], date_to: Optional[date],
+                           alias: str = '') -> Tuple[List[str], List[Any]]:
+        """기간 겹침 조건 (시작일 하한은 duration_metric에 기록된 최장 기간만큼 앞당김)"""
+        conditions = [f'{alias}start_ord IS NOT NULL']
+        params: List[Any] = []
+        if date_from:
+            conditions.append(f'''
+                {alias}start_ord >= ? - (SELECT count FROM dataset_stats WHERE metric = '{duration_metric}')
+                AND {alias}end_ord >= ?
+            ''')
+            params += [date_from.toordinal(), date_from.toordinal()]
+        if date_to:
+            conditions.append(f'{alias}start_ord <= ?')
+            params.append(date_to.toordinal())
+        return conditions, params
+    
+    def get_schedules(self, date_from: Optional[date] = None, date_to: Optional[date] = None,
+                      keyword: Optional[str] = None, limit: Optional[int] = None,
+                      offset: int = 0) -> List[Dict[str, Any]]:
+        """기간이 [date_from, date_to]와 겹치고 제목에 keyword가 들어간 유관기관 일정 조회 (시작일, id 순)"""
+        conditions, params = self._period_conditions('schedule_max_duration', date_from, date_to, 's.')
+        source = 'schedules s'
+        if keyword:
+            match_query = build_match_query(keyword)
+            if not match_query:
+                return []
+            source = 'schedules_fts JOIN schedules s ON s.id = schedules_fts.rowid'
+            conditions.append('schedules_fts MATCH ?')
+            params.append(match_query)
         
-        conn.close()
-        return results
+        return self._fetch_all(f'''
+            SELECT s.id, s.title, s.start_date, s.end_date, s.created_date FROM {source}
+            WHERE {' AND '.join(conditions)}
+            ORDER BY s.start_ord, s.id
+            LIMIT ? OFFSET ?
+        ''', params + [_sql_limit(limit), offset])
     
-    def get_events_by_location(self, location: str) -> List[Dict[str, Any]]:
-        """장소별 행사 조회"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def get_upcoming_events_near(self, lat: float, lon: float, date_from: date,
+                                 radius_km: Optional[float] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        좌표 반경 안에서 date_from 이후 진행 중이거나 열릴 행사 조회 (시작일, 거리 순)
         
-        cursor.execute('''
-            SELECT * FROM events WHERE location LIKE ?
-        ''', (f'%{location}%',))
+        R*Tree 경계 상자로 후보를 뽑은 뒤 종료일과 실제 거리(haversine)로 거른다.
+        """
+        radius = radius_km or UPCOMING_EVENT_RADIUS_KM
+        min_lat, max_lat, min_lon, max_lon = bounding_box(lat, lon, radius)
+        candidates = self._fetch_all('''
+            SELECT e.* FROM events_geo g
+            JOIN events e ON e.id = g.id
+            WHERE g.min_lat >= ? AND g.max_lat <= ? AND g.min_lon >= ? AND g.max_lon <= ?
+            AND e.end_ord >= ?
+        ''', (min_lat, max_lat, min_lon, max_lon, date_from.toordinal()))
         
-        columns = [description[0] for description in cursor.description]
-        results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        results = []
+        for row in candidates:
+            row['distance_km'] = round(haversine_km(lat, lon, row['lat'], row['lon']), 3)
+            if row['distance_km'] <= radius:
+                results.append(row)
         
-        conn.close()
-        return results
+        results.sort(key=lambda row: (row['start_ord'], row['distance_km'], row['id']))
+        return results[:limit]
     
-    def get_nearby_restaurants(self, location: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """특정 장소 근처 백년가게 조회"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def get_latest_event(self, location: str, region: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        장소명이 일치하거나 같은 지역인 행사 중 가장 최근에 시작한 행사 조회
         
-        # 장소명에서 지역 키워드 추출
-        location_keywords = self._extract_location_keywords(location)
+        장소는 전문 검색 색인, 지역은 (region, start_ord) 인덱스를 역순으로 읽어
+        각각 한 건씩만 찾은 뒤 더 늦게 시작한 쪽을 고른다.
+        """
+        candidates = []
+        match_query = build_match_query(location, columns=['location'])
+        if match_query:
+            candidates += self._fetch_all('''
+                SELECT e.* FROM events_fts
+                JOIN events e ON e.id = events_fts.rowid
+                WHERE events_fts MATCH ?
+                ORDER BY e.start_ord DESC, e.id DESC
+                LIMIT 1
+            ''', (match_query,))
+        if region:
+            candidates += self._fetch_all('''
+                SELECT * FROM events WHERE region = ?
+                ORDER BY start_ord DESC, id DESC
+                LIMIT 1
+            ''', (region,))
         
-        if not location_keywords:
-            conn.close()
-            return []
+        if not candidates:
+            return None
+        return max(candidates, key=lambda row: (row['start_ord'] or 0, row['id']))
+    
+    def get_event_candidates(self, event_id: int, limit: int = 10, radius_km: Optional[float] = None,
+                             where: str = '', params: Sequence[Any] = ()) -> Optional[List[Dict[str, Any]]]:
+        """
+        적재 시 미리 계산한 행사 근처 백년가게 후보 조회 (가까운 순, 한 번의 인덱스 조인)
         
-        # 키워드로 주소 검색
-        query = ' OR '.join(['address LIKE ?' for _ in location_keywords])
-        params = [f'%{keyword}%' for keyword in location_keywords]
+        후보 목록만으로 답이 확정되지 않으면 None을 돌려주므로 호출하는 쪽은 실시간 근접 검색으로 대체한다.
+        (좌표가 없는 행사, limit이 후보 수보다 큰 경우, 조건으로 걸러져 limit개가 안 되는데
+        잘린 후보 밖에 더 가까운 반경 내 업소가 남아 있을 수 있는 경우)
         
-        cursor.execute(f'''
-            SELECT * FROM restaurants WHERE {query}
+        Args:
+            event_id: 행사 id
+            limit: 최대 결과 수
+            radius_km: 검색 반경 (None이면 실시간 근접 검색과 같은 최대 반경)
+            where: 추가 조건 SQL (restaurants 별칭 r 기준)
+            params: where의 바인드 값
+            
+        Returns:
+            Optional[List[Dict[str, Any]]]: distance_km, distance_bucket, score가 추가된 백년가게 목록
+        """
+        if limit > EVENT_CANDIDATE_LIMIT:
+            return None
+        
+        radius = radius_km if radius_km else NEARBY_MAX_RADIUS_KM
+        conditions = ['c.event_id = ?', 'c.distance_km <= ?']
+        condition_params: List[Any] = [event_id, radius]
+        if where:
+            conditions.append(f'({where})')
+            condition_params += list(params)
+        
+        results = self._fetch_all(f'''
+            SELECT r.*, c.distance_km, c.distance_bucket, c.score
+            FROM event_restaurant_candidates c
+            JOIN restaurants r ON r.id = c.restaurant_id
+            WHERE {' AND '.join(conditions)}
+            ORDER BY c.rank
             LIMIT ?
-        ''', params + [limit])
+        ''', condition_params + [limit])
+        if len(results) == limit:
+            return results
         
-        columns = [description[0] for description in cursor.description]
-        results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        # 후보가 잘리지 않았거나(전체 업소 수 미만) 마지막 후보가 반경 밖이면 결과가 확정됨
+        conn = get_connection(self.db_path)
+        count, farthest = conn.execute('''
+            SELECT COUNT(*), MAX(distance_km) FROM event_restaurant_candidates WHERE event_id = ?
+        ''', (event_id,)).fetchone()
+        if count == 0:
+            return None
+        if count < EVENT_CANDIDATE_LIMIT or farthest > radius:
+            return results
+        return None
+    
+    def get_nearby_restaurants(self, location: str, limit: int = 10,
+                               radius_km: Optional[float] = None) -> List[Dict[str, Any]]:
+        """특정 장소 근처 백년가게 조회 (장소를 지오코딩한 좌표 기준 거리순)"""
+        coordinate = get_geocoder().geocode_location(location)
+        if not coordinate:
+            # 좌표를 알 수 없는 장소는 주소 전문 검색으로 대체
+            return self.get_restaurants_by_location_words(location, limit)
         
-        conn.close()
-        return results
+        lat, lon, _ = coordinate
+        return self.find_restaurants_near(lat, lon, limit, radius_km)
     
-    def _extract_location_keywords(self, location: str) -> List[str]:
-        """장소명에서 지역 키워드 추출"""
-        keywords = []
+    def get_restaurants_by_location_words(self, location: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        장소 문자열의 단어 중 하나라도 주소에 포함된 백년가게를 한 번의 쿼리로 조회
         
-        # 주요 지역 키워드
-        regions = ['서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종',
-                  '경기', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주',
-                  '대덕특구', '과학벨트', '부산특구', '대구특구', '광주특구', '울산특구']
+        단어들을 OR로 묶은 주소 전문 검색을 BM25 순으로 정렬하므로
+        더 많은 단어와 일치하는 업소가 앞에 온다.
+        """
+        match_query = build_match_query(location, columns=['address'], operator='OR')
+        if not match_query:
+            return []
         
-        for region in regions:
-            if region in location:
-                keywords.append(region)
+        return self._fetch_all('''
+            SELECT r.* FROM restaurants_fts
+            JOIN restaurants r ON r.id = restaurants_fts.rowid
+            WHERE restaurants_fts MATCH ?
+            ORDER BY bm25(restaurants_fts), r.id
+            LIMIT ?
+        ''', (match_query, limit))
+    
+    def find_restaurants_near(self, lat: float, lon: float, limit: int = 10,
+                              radius_km: Optional[float] = None, where: str = '',
+                              params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """
+        좌표 기준 k-최근접 / 반경 내 백년가게 조회
+        
+        R*Tree에서 경계 상자로 후보를 뽑고 실제 거리(haversine)로 걸러 정렬한다.
+        반경을 주지 않으면 limit개가 찰 때까지 상자를 두 배씩 넓힌다.
+        
+        Args:
+            lat, lon: 기준 좌표
+            limit: 최대 결과 수
+            radius_km: 검색 반경 (None이면 가장 가까운 limit개)
+            where: 추가 조건 SQL (restaurants 별칭 r 기준, 예: "r.max_party_size >= ?")
+            params: where의 바인드 값
+            
+        Returns:
+            List[Dict[str, Any]]: distance_km 필드가 추가된 백년가게 목록 (가까운 순)
+        """
+        max_radius = radius_km if radius_km else NEARBY_MAX_RADIUS_KM
+        radius = min(NEARBY_START_RADIUS_KM, max_radius)
+        condition = f'AND ({where})' if where else ''
+        
+        while True:
+            min_lat, max_lat, min_lon, max_lon = bounding_box(lat, lon, radius)
+            candidates = self._fetch_all(f'''
+                SELECT r.* FROM restaurants_geo g
+                JOIN restaurants r ON r.id = g.id
+                WHERE g.min_lat >= ? AND g.max_lat <= ? AND g.min_lon >= ? AND g.max_lon <= ?
+                {condition}
+            ''', [min_lat, max_lat, min_lon, max_lon] + list(params))
+            
+            # 상자 모서리 쪽 후보는 반경 밖일 수 있으므로 실제 거리로 다시 거름
+            results = []
+            for row in candidates:
+                row['distance_km'] = round(haversine_km(lat, lon, row['lat'], row['lon']), 3)
+                if row['distance_km'] <= radius:
+                    results.append(row)
+            
+            if len(results) >= limit or radius >= max_radius:
+                break
+            radius = min(radius * 2, max_radius)
         
-        return keywords
+        results.sort(key=lambda row: (row['distance_km'], row['id']))
+        return results[:limit]
     
     def get_all_regions(self) -> List[str]:
-        """모든 지역 목록 조회"""
-        conn = sqlite3.connect(self.db_path)
+        """모든 지역 목록 조회 (집계 테이블 기준)"""
+        conn = get_connection(self.db_path)
         cursor = conn.cursor()
         
-        cursor.execute('SELECT DISTINCT region FROM restaurants WHERE region IS NOT NULL AND region != ""')
+        cursor.execute('''
+            SELECT dimension FROM dataset_stats
+            WHERE metric = 'restaurants_by_region'
+            ORDER BY dimension
+        ''')
         regions = [row[0] for row in cursor.fetchall()]
         
-        conn.close()
-        return sorted(regions)
\ No newline at end of file
+        return regions
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """적재 시 계산된 집계 정보 조회"""
+        conn = get_connection(self.db_path)
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT metric, dimension, count, value FROM dataset_stats ORDER BY metric, dimension')
+        rows = cursor.fetchall()
+        
+        
+        stats = {
+            'total_restaurants': 0,
+            'total_events': 0,
+            'total_schedules': 0,
+            'restaurants_by_region': {},
+            'events_by_region': {},
+            'tech_categories': {},
+            'event_date_range': {'from': None, 'to': None}
+        }
+        grouped = {
+            'restaurants_by_region': 'restaurants_by_region',
+            'events_by_region': 'events_by_region',
+            'events_by_tech_category': 'tech_categories'
+        }
+        for metric, dimension, count, value in rows:
+            if metric == 'restaurants':
+                stats['total_restaurants'] = count
+            elif metric == 'events':
+                stats['total_events'] = count
+            elif metric == 'schedules':
+                stats['total_schedules'] = count
+            elif metric in grouped:
+                stats[grouped[metric]][dimension] = count
+            elif metric == 'event_date_range':
+                stats['event_date_range'][dimension] = value
+        
+        stats['regions'] = sorted(stats['restaurants_by_region'])
+        stats['total_regions'] = len(stats['regions'])
+        return stats
+    
+    def get_dataset_tag(self) -> str:
+        """현재 적재본을 식별하는 태그 (ETag 등에 사용)"""
+        conn = get_connection(self.db_path)
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT key, value FROM dataset_meta WHERE key IN ('dataset_version', 'source_hash')
+        ''')
+        meta = dict(cursor.fetchall())
+        
+        return f"{meta.get('dataset_version', '0')}-{(meta.get('source_hash') or '')[:12]}"
+
+_shared_managers: Dict[str, DatabaseManager] = {}
+_shared_lock = threading.Lock()
+
+def get_database_manager(db_path: str = DB_PATH) -> DatabaseManager:
+    """프로세스 전역에서 공유하는 조회용 DatabaseManager 반환
+    
+    최초 호출 시에만 스키마 생성과 적재 여부 확인을 수행하고,
+    이후에는 같은 인스턴스를 재사용한다.
+    """
+    manager = _shared_managers.get(db_path)
+    if manager is None:
+        with _shared_lock:
+            manager = _shared_managers.get(db_path)
+            if manager is None:
+                manager = DatabaseManager(db_path)
+                _shared_managers[db_path] = manager
+    return manager
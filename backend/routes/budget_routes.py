@@ -1,11 +1,62 @@
-from flask import Blueprint, request, jsonify
-from models.budget_models import db, Budget, BudgetLine, Transaction, PolicyRule
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from models.budget_models import db, Budget, BudgetLine, Transaction, PolicyRule, SpendRollup
 from services.feature_flags import FeatureFlags
+from services.transaction_import import (MAX_BATCH_ROWS, iter_csv_records, iter_json_lines,
+                                         normalize_transaction)
+from services.spend_rollup import apply_spend_deltas, spend_period
 from datetime import datetime, date
+from itertools import islice
+from typing import Any, Dict, List, Sequence, Tuple
+import csv
+import io
+import json
+import re
+from sqlalchemy import and_, func, or_, select, update
 from sqlalchemy.exc import IntegrityError
 
 budget_bp = Blueprint('budget', __name__, url_prefix='/api/budgets')
 
+def lines_by_budget(budget_ids: Sequence[int], with_transaction_stats: bool = False) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    여러 예산의 비목 목록을 한 번의 쿼리로 조회해 예산 id별로 묶음
+    
+    with_transaction_stats이면 유효 거래 건수(transaction_count)와 합계(transaction_total)를
+    거래 테이블 외부 조인 GROUP BY로 함께 계산한다.
+    """
+    if with_transaction_stats:
+        rows = db.session.query(
+            BudgetLine,
+            func.count(Transaction.id),
+            func.coalesce(func.sum(Transaction.amount), 0)
+        ).outerjoin(
+            Transaction, and_(Transaction.budget_line_id == BudgetLine.id, Transaction.is_valid == True)
+        ).filter(
+            BudgetLine.budget_id.in_(budget_ids)
+        ).group_by(BudgetLine.id).order_by(BudgetLine.budget_id, BudgetLine.id).all()
+    else:
+        rows = [
+            (line, None, None) for line in
+            BudgetLine.query.filter(BudgetLine.budget_id.in_(budget_ids)).order_by(BudgetLine.budget_id, BudgetLine.id).all()
+        ]
+    
+    grouped: Dict[int, List[Dict[str, Any]]] = {budget_id: [] for budget_id in budget_ids}
+    for line, transaction_count, transaction_total in rows:
+        line_data = line.to_dict()
+        if with_transaction_stats:
+            line_data['transaction_count'] = transaction_count
+            line_data['transaction_total'] = int(transaction_total)
+        grouped[line.budget_id].append(line_data)
+    return grouped
+
+def budget_with_lines(budget: Budget, lines: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """예산 정보에 비목 목록과 합계(배정·집행·잔액)를 붙임"""
+    budget_data = budget.to_dict()
+    budget_data['budget_lines'] = lines
+    budget_data['total_allocated'] = sum(line['allocated_amount'] for line in lines)
+    budget_data['total_spent'] = sum(line['spent_amount'] for line in lines)
+    budget_data['total_remaining'] = budget_data['total_allocated'] - budget_data['total_spent']
+    return budget_data
+
 @budget_bp.route('', methods=['POST'])
 @FeatureFlags.require_budget_ledger
 def create_budget():
@@ -57,7 +108,7 @@ def get_budget(budget_id):
         
         # 비목별 집계 정보 포함
         budget_data = budget.to_dict()
-        budget_data['budget_lines'] = [line.to_dict() for line in budget.budget_lines]
+        budget_data['budget_lines'] = lines_by_budget([budget_id])[budget_id]
         
         return jsonify({
             'success': True,
@@ -117,9 +168,12 @@ def create_budget_line(budget_id):
 @budget_bp.route('/lines/<int:line_id>/transactions', methods=['POST'])
 @FeatureFlags.require_budget_ledger
 def create_transaction(line_id):
-    """거래 내역 생성"""
+    """거래 내역 생성
+    
+    집행액 증가와 초과 지출 검사를 조건부 UPDATE 한 문장으로 처리하고 거래 INSERT와 함께 커밋한다.
+    해당 비목 행만 잠그므로 여러 워커가 동시에 등록해도 초과 집행이나 갱신 유실이 생기지 않는다.
+    """
     try:
-        budget_line = BudgetLine.query.get_or_404(line_id)
         data = request.get_json()
         
         # 유효성 검사
@@ -136,18 +190,36 @@ def create_transaction(line_id):
                 'error': 'amount must be positive'
             }), 400
         
-        # 초과 지출 검사
-        new_spent_amount = budget_line.spent_amount + data['amount']
-        if new_spent_amount > budget_line.allocated_amount:
+        transaction_date = datetime.strptime(data.get('date', datetime.now().strftime('%Y-%m-%d')), '%Y-%m-%d').date()
+        
+        # spent_amount 업데이트 (denormalized) - 잔액이 충분할 때만 한 행이 갱신됨
+        result = db.session.execute(
+            update(BudgetLine)
+            .where(BudgetLine.id == line_id,
+                   BudgetLine.spent_amount + data['amount'] <= BudgetLine.allocated_amount)
+            .values(spent_amount=BudgetLine.spent_amount + data['amount'])
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            db.session.rollback()
+            budget_line = db.session.get(BudgetLine, line_id)
+            if budget_line is None:
+                return jsonify({
+                    'success': False,
+                    'error': 'Budget line not found'
+                }), 404
             return jsonify({
                 'success': False,
                 'error': f'Transaction would exceed allocated amount. Remaining: {budget_line.remaining_amount}'
             }), 400
         
+        # 월별 집계 갱신
+        apply_spend_deltas(db.session, {(line_id, spend_period(transaction_date)): (1, data['amount'])})
+        
         # 거래 생성
         transaction = Transaction(
             budget_line_id=line_id,
-            date=datetime.strptime(data.get('date', datetime.now().strftime('%Y-%m-%d')), '%Y-%m-%d').date(),
+            date=transaction_date,
             vendor_name=data['vendor_name'],
             amount=data['amount'],
             payment_method=data['payment_method'],
@@ -156,10 +228,6 @@ def create_transaction(line_id):
         )
         
         db.session.add(transaction)
-        
-        # spent_amount 업데이트 (denormalized)
-        budget_line.spent_amount = new_spent_amount
-        
         db.session.commit()
         
         return jsonify({
@@ -179,20 +247,380 @@ def create_transaction(line_id):
             'error': str(e)
         }), 500
 
+CSV_MIMETYPES = ('text/csv', 'application/csv', 'application/vnd.ms-excel')
+
+def read_batch_records() -> List[Any]:
+    """요청 본문의 일괄 등록 행 읽기 (JSON 배열, JSON Lines, CSV 본문 또는 file 업로드, 최대 MAX_BATCH_ROWS + 1행)"""
+    upload = request.files.get('file')
+    if upload:
+        stream = io.BytesIO(upload.read())
+        is_csv = (upload.filename or '').lower().endswith('.csv') or upload.mimetype in CSV_MIMETYPES
+    elif request.mimetype == 'application/json':
+        payload = request.get_json()
+        records = payload.get('transactions') if isinstance(payload, dict) else payload
+        return records[:MAX_BATCH_ROWS + 1] if isinstance(records, list) else []
+    else:
+        stream = io.BytesIO(request.get_data())
+        is_csv = request.mimetype in CSV_MIMETYPES
+    
+    records = iter_csv_records(stream) if is_csv else iter_json_lines(stream)
+    return list(islice(records, MAX_BATCH_ROWS + 1))
+
+@budget_bp.route('/transactions:batch', methods=['POST'])
+@FeatureFlags.require_budget_ledger
+def create_transactions_batch():
+    """거래 내역 일괄 등록
+    
+    모든 행을 메모리에서 검증(필수 값, 형식, 비목별 잔액을 입력 순서대로 누적 차감)한 뒤
+    비목마다 조건부 UPDATE 한 번과 거래 INSERT 한 번(executemany)으로 한 트랜잭션에 반영한다.
+    all_or_nothing=true이면 한 행이라도 거부될 때 아무것도 등록하지 않는다.
+    """
+    try:
+        try:
+            records = read_batch_records()
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': f'Could not read transactions: {e}'
+            }), 400
+        
+        if not records:
+            return jsonify({
+                'success': False,
+                'error': 'No transactions to import'
+            }), 400
+        if len(records) > MAX_BATCH_ROWS:
+            return jsonify({
+                'success': False,
+                'error': f'Too many transactions (max {MAX_BATCH_ROWS})'
+            }), 400
+        
+        all_or_nothing = request.args.get('all_or_nothing', 'false').lower() == 'true'
+        today = date.today()
+        report: Dict[int, Dict[str, Any]] = {}
+        
+        # 형식 검증
+        candidates = []
+        for row, record in enumerate(records, start=1):
+            try:
+                candidates.append((row, normalize_transaction(record, today)))
+            except ValueError as e:
+                report[row] = {'row': row, 'status': 'rejected', 'error': str(e)}
+        
+        # 비목별 잔액 검증 (비목은 한 번의 쿼리로 조회)
+        line_ids = {values['budget_line_id'] for _, values in candidates}
+        lines = {line.id: line for line in BudgetLine.query.filter(BudgetLine.id.in_(line_ids)).all()}
+        spent = {line_id: line.spent_amount for line_id, line in lines.items()}
+        accepted = []
+        for row, values in candidates:
+            line = lines.get(values['budget_line_id'])
+            if line is None:
+                report[row] = {'row': row, 'status': 'rejected', 'error': 'Budget line not found'}
+            elif spent[line.id] + values['amount'] > line.allocated_amount:
+                report[row] = {
+                    'row': row, 'status': 'rejected',
+                    'error': f'Transaction would exceed allocated amount. Remaining: {line.allocated_amount - spent[line.id]}'
+                }
+            else:
+                spent[line.id] += values['amount']
+                accepted.append((row, values))
+        
+        if all_or_nothing and report:
+            accepted = []
+        
+        # 비목별 합계를 조건부 UPDATE로 반영 (검증 이후 다른 요청이 집행했다면 해당 비목 행은 거부)
+        totals: Dict[int, int] = {}
+        for _, values in accepted:
+            totals[values['budget_line_id']] = totals.get(values['budget_line_id'], 0) + values['amount']
+        changed_lines = set()
+        for line_id, total in totals.items():
+            result = db.session.execute(
+                update(BudgetLine)
+                .where(BudgetLine.id == line_id,
+                       BudgetLine.spent_amount + total <= BudgetLine.allocated_amount)
+                .values(spent_amount=BudgetLine.spent_amount + total)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount != 1:
+                changed_lines.add(line_id)
+        
+        if changed_lines and all_or_nothing:
+            # 바뀐 비목의 행만 거부로 남기고 나머지는 건너뜀으로 보고
+            db.session.rollback()
+            accepted = [(row, values) for row, values in accepted if values['budget_line_id'] in changed_lines]
+        
+        posted = []
+        for row, values in accepted:
+            if values['budget_line_id'] in changed_lines:
+                report[row] = {'row': row, 'status': 'rejected',
+                               'error': 'Budget line was updated concurrently. Retry this row'}
+            else:
+                report[row] = {'row': row, 'status': 'posted', 'budget_line_id': values['budget_line_id'],
+                               'amount': values['amount']}
+                posted.append(values)
+        for row, _ in candidates:
+            report.setdefault(row, {'row': row, 'status': 'skipped'})
+        
+        if posted:
+            db.session.execute(Transaction.__table__.insert(), posted)
+            # 월별 집계 갱신
+            deltas: Dict[Any, Any] = {}
+            for values in posted:
+                key = (values['budget_line_id'], spend_period(values['date']))
+                count, amount = deltas.get(key, (0, 0))
+                deltas[key] = (count + 1, amount + values['amount'])
+            apply_spend_deltas(db.session, deltas)
+        db.session.commit()
+        
+        results = [report[row] for row in sorted(report)]
+        rejected = sum(1 for result in results if result['status'] == 'rejected')
+        return jsonify({
+            'success': bool(posted),
+            'data': {
+                'posted': len(posted),
+                'rejected': rejected,
+                'posted_amount': sum(values['amount'] for values in posted),
+                'results': results
+            }
+        }), 201 if posted else 400
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@budget_bp.route('/transactions/<int:transaction_id>/invalidate', methods=['POST'])
+@FeatureFlags.require_budget_ledger
+def invalidate_transaction(transaction_id):
+    """거래 무효화 (비목 집행액과 월별 집계에서 차감)"""
+    try:
+        # 유효한 거래만 한 번 무효화되도록 조건부 UPDATE
+        result = db.session.execute(
+            update(Transaction)
+            .where(Transaction.id == transaction_id, Transaction.is_valid == True)
+            .values(is_valid=False)
+            .execution_options(synchronize_session=False)
+        )
+        transaction = db.session.get(Transaction, transaction_id)
+        if result.rowcount != 1:
+            db.session.rollback()
+            if transaction is None:
+                return jsonify({
+                    'success': False,
+                    'error': 'Transaction not found'
+                }), 404
+            return jsonify({
+                'success': False,
+                'error': 'Transaction is already invalid'
+            }), 400
+        
+        db.session.execute(
+            update(BudgetLine)
+            .where(BudgetLine.id == transaction.budget_line_id)
+            .values(spent_amount=BudgetLine.spent_amount - transaction.amount)
+            .execution_options(synchronize_session=False)
+        )
+        apply_spend_deltas(db.session, {
+            (transaction.budget_line_id, spend_period(transaction.date)): (-1, -transaction.amount)
+        })
+        db.session.commit()
+        
+        transaction_data = transaction.to_dict()
+        transaction_data['is_valid'] = False
+        return jsonify({
+            'success': True,
+            'data': transaction_data
+        })
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@budget_bp.route('/<int:budget_id>/rollup', methods=['GET'])
+@FeatureFlags.require_budget_ledger
+def get_budget_rollup(budget_id):
+    """예산 집행 추이 (spend_rollups 집계 조회)
+    
+    granularity=month(기본값)는 월별 합계·누적 집행액·집행률과 비목 분류별 금액,
+    granularity=line은 비목·월별 집계 셀을 그대로 반환한다.
+    """
+    try:
+        budget = Budget.query.get_or_404(budget_id)
+        granularity = request.args.get('granularity', 'month')
+        if granularity not in ('month', 'line'):
+            return jsonify({
+                'success': False,
+                'error': 'granularity must be month or line'
+            }), 400
+        
+        rows = db.session.query(
+            SpendRollup, BudgetLine.category
+        ).join(
+            BudgetLine, BudgetLine.id == SpendRollup.budget_line_id
+        ).filter(
+            SpendRollup.budget_id == budget_id
+        ).order_by(SpendRollup.period, SpendRollup.budget_line_id).all()
+        
+        if granularity == 'line':
+            cells = []
+            for rollup, category in rows:
+                cell = rollup.to_dict()
+                cell['category'] = category
+                cells.append(cell)
+            return jsonify({
+                'success': True,
+                'data': {'budget': budget.to_dict(), 'granularity': granularity, 'cells': cells}
+            })
+        
+        total_allocated = db.session.query(
+            func.coalesce(func.sum(BudgetLine.allocated_amount), 0)
+        ).filter(BudgetLine.budget_id == budget_id).scalar()
+        
+        periods: Dict[str, Dict[str, Any]] = {}
+        for rollup, category in rows:
+            period = periods.setdefault(rollup.period, {
+                'period': rollup.period, 'transaction_count': 0, 'total_amount': 0, 'by_category': {}
+            })
+            period['transaction_count'] += rollup.transaction_count
+            period['total_amount'] += rollup.total_amount
+            period['by_category'][category] = period['by_category'].get(category, 0) + rollup.total_amount
+        
+        cumulative = 0
+        series = []
+        for period in periods.values():
+            cumulative += period['total_amount']
+            period['cumulative_amount'] = cumulative
+            period['burn_rate'] = round(cumulative / total_allocated * 100, 2) if total_allocated else 0.0
+            series.append(period)
+        
+        return jsonify({
+            'success': True,
+            'data': {
+                'budget': budget.to_dict(),
+                'granularity': granularity,
+                'total_allocated': total_allocated,
+                'periods': series
+            }
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+# 거래 내역 페이지 크기 기본값 / 최댓값
+TRANSACTION_PAGE_SIZE = 50
+MAX_TRANSACTION_PAGE_SIZE = 500
+
+# 거래 내역 페이지 커서 "<거래일 YYYY-MM-DD>_<거래 id>" (이전 페이지 마지막 거래)
+TRANSACTION_CURSOR_PATTERN = re.compile(r'^(\d{4}-\d{2}-\d{2})_(\d+)$')
+
+# 내보내기 시 서버 측 커서에서 한 번에 가져오는 행 수
+EXPORT_BATCH_SIZE = 500
+EXPORT_COLUMNS = ('id', 'date', 'vendor_name', 'amount', 'payment_method', 'receipt_type', 'memo', 'created_at')
+
+def transaction_filters(line_id: int) -> List[Any]:
+    """
+    비목의 유효 거래 조회 조건 (from/to 거래일, vendor 거래처 부분 일치, payment_method)
+    
+    Raises:
+        ValueError: 날짜 형식이 잘못된 경우
+    """
+    conditions = [Transaction.budget_line_id == line_id, Transaction.is_valid == True]
+    date_from = request.args.get('from')
+    date_to = request.args.get('to')
+    if date_from:
+        conditions.append(Transaction.date >= datetime.strptime(date_from, '%Y-%m-%d').date())
+    if date_to:
+        conditions.append(Transaction.date <= datetime.strptime(date_to, '%Y-%m-%d').date())
+    vendor = request.args.get('vendor', '').strip()
+    if vendor:
+        conditions.append(Transaction.vendor_name.contains(vendor, autoescape=True))
+    payment_method = request.args.get('payment_method')
+    if payment_method:
+        conditions.append(Transaction.payment_method == payment_method)
+    return conditions
+
+def make_transaction_cursor(transaction: Transaction) -> str:
+    """거래 내역 페이지 커서 생성 ("2025-03-31_9580")"""
+    return f'{transaction.date.isoformat()}_{transaction.id}'
+
+def parse_transaction_cursor(cursor: str) -> Tuple[date, int]:
+    """
+    거래 내역 페이지 커서를 (거래일, 거래 id)로 변환
+    
+    Raises:
+        ValueError: "<YYYY-MM-DD>_<id>" 형식이 아니거나 날짜가 잘못된 경우
+    """
+    match = TRANSACTION_CURSOR_PATTERN.match(cursor)
+    if not match:
+        raise ValueError(cursor)
+    return datetime.strptime(match.group(1), '%Y-%m-%d').date(), int(match.group(2))
+
 @budget_bp.route('/lines/<int:line_id>/summary', methods=['GET'])
 @FeatureFlags.require_budget_ledger
 def get_line_summary(line_id):
-    """비목별 집계 정보 조회"""
+    """비목별 집계 정보와 거래 내역 한 페이지 조회
+    
+    거래 내역은 (거래일, id) 내림차순 키셋 페이지네이션으로 limit(기본 50, 500 초과는 500)개씩 반환한다.
+    응답의 next_cursor("<YYYY-MM-DD>_<id>", 이 페이지 마지막 거래의 거래일과 id)를
+    cursor 파라미터로 넘기면 다음 페이지를 조회하며, 마지막 페이지에서는 null이다.
+    transaction_count는 필터에 맞는 전체 거래 수(모든 페이지 합), page_count는 이 페이지의 거래 수다.
+    """
     try:
         budget_line = BudgetLine.query.get_or_404(line_id)
+        try:
+            limit = int(request.args.get('limit', TRANSACTION_PAGE_SIZE))
+        except ValueError:
+            limit = 0
+        if limit < 1:
+            return jsonify({
+                'success': False,
+                'error': 'limit must be a positive integer'
+            }), 400
+        limit = min(limit, MAX_TRANSACTION_PAGE_SIZE)
+        cursor = request.args.get('cursor')
+        if cursor:
+            try:
+                cursor_date, cursor_id = parse_transaction_cursor(cursor)
+            except ValueError:
+                return jsonify({
+                    'success': False,
+                    'error': 'Invalid cursor. Pass next_cursor from the previous page (<YYYY-MM-DD>_<id>)'
+                }), 400
+        try:
+            conditions = transaction_filters(line_id)
+        except ValueError:
+            return jsonify({
+                'success': False,
+                'error': 'Invalid date format. Use YYYY-MM-DD'
+            }), 400
         
-        # 거래 내역 조회
-        transactions = Transaction.query.filter_by(budget_line_id=line_id, is_valid=True).all()
+        transaction_count = db.session.query(func.count(Transaction.id)).filter(*conditions).scalar()
+        
+        # 거래 내역 조회 (다음 페이지 존재 여부 확인을 위해 limit + 1개)
+        query = Transaction.query.filter(*conditions)
+        if cursor:
+            query = query.filter(
+                Transaction.date <= cursor_date,
+                or_(Transaction.date < cursor_date, Transaction.id < cursor_id)
+            )
+        transactions = query.order_by(Transaction.date.desc(), Transaction.id.desc()).limit(limit + 1).all()
+        has_more = len(transactions) > limit
+        transactions = transactions[:limit]
         
         summary = {
             'budget_line': budget_line.to_dict(),
             'transactions': [t.to_dict() for t in transactions],
-            'transaction_count': len(transactions),
+            'transaction_count': transaction_count,
+            'page_count': len(transactions),
+            'next_cursor': make_transaction_cursor(transactions[-1]) if has_more else None,
             'total_spent': budget_line.spent_amount,
             'remaining_amount': budget_line.remaining_amount,
             'spending_rate': round(budget_line.spending_rate, 2)
@@ -209,23 +637,69 @@ def get_line_summary(line_id):
             'error': str(e)
         }), 500
 
+@budget_bp.route('/lines/<int:line_id>/transactions.<any(csv, ndjson):export_format>', methods=['GET'])
+@FeatureFlags.require_budget_ledger
+def export_line_transactions(line_id, export_format):
+    """비목 유효 거래 내역 내보내기 (CSV / NDJSON 스트리밍, 거래일·id 순)
+    
+    정렬 순서가 ix_transactions_line_valid_date (비목, 유효, 거래일, id) 순서와 같아
+    정렬 없이 첫 행부터 읽히고, 서버 측 커서에서 EXPORT_BATCH_SIZE행씩 바로 응답으로
+    흘려보내므로 전체 목록을 메모리에 만들지 않는다. summary와 같은 필터 파라미터를 받는다.
+    """
+    try:
+        if db.session.get(BudgetLine, line_id) is None:
+            return jsonify({
+                'success': False,
+                'error': 'Budget line not found'
+            }), 404
+        try:
+            conditions = transaction_filters(line_id)
+        except ValueError:
+            return jsonify({
+                'success': False,
+                'error': 'Invalid date format. Use YYYY-MM-DD'
+            }), 400
+        
+        columns = [getattr(Transaction, column) for column in EXPORT_COLUMNS]
+        statement = select(*columns).where(*conditions).order_by(Transaction.date, Transaction.id)
+        
+        def generate():
+            result = db.session.execute(statement.execution_options(stream_results=True))
+            if export_format == 'csv':
+                # 엑셀에서 한글이 깨지지 않도록 BOM을 붙임
+                yield '\ufeff' + ','.join(EXPORT_COLUMNS) + '\r\n'
+            for rows in result.partitions(EXPORT_BATCH_SIZE):
+                rows = [[value.isoformat() if isinstance(value, (date, datetime)) else value for value in row] for row in rows]
+                buffer = io.StringIO()
+                if export_format == 'csv':
+                    csv.writer(buffer).writerows(rows)
+                else:
+                    for row in rows:
+                        buffer.write(json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False) + '\n')
+                yield buffer.getvalue()
+        
+        filename = f'budget_line_{line_id}_transactions.{export_format}'
+        mimetype = 'text/csv' if export_format == 'csv' else 'application/x-ndjson'
+        return Response(stream_with_context(generate()), mimetype=mimetype, headers={
+            'Content-Disposition': f'attachment; filename={filename}'
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @budget_bp.route('', methods=['GET'])
 @FeatureFlags.require_budget_ledger
 def list_budgets():
     """예산 목록 조회"""
     try:
         budgets = Budget.query.order_by(Budget.created_at.desc()).all()
-        budget_list = []
         
-        for budget in budgets:
-            budget_data = budget.to_dict()
-            # 각 예산의 비목별 집계 정보 포함
-            budget_lines = BudgetLine.query.filter_by(budget_id=budget.id).all()
-            budget_data['budget_lines'] = [line.to_dict() for line in budget_lines]
-            budget_data['total_allocated'] = sum(line.allocated_amount for line in budget_lines)
-            budget_data['total_spent'] = sum(line.spent_amount for line in budget_lines)
-            budget_data['total_remaining'] = budget_data['total_allocated'] - budget_data['total_spent']
-            budget_list.append(budget_data)
+        # 모든 예산의 비목을 한 번에 조회해 예산별로 묶음
+        lines = lines_by_budget([budget.id for budget in budgets])
+        budget_list = [budget_with_lines(budget, lines[budget.id]) for budget in budgets]
         
         return jsonify({
             'success': True,
@@ -238,6 +712,51 @@ def list_budgets():
             'error': str(e)
         }), 500
 
+@budget_bp.route('/overview', methods=['GET'])
+@FeatureFlags.require_budget_ledger
+def get_budgets_overview():
+    """전체 예산 현황 (예산, 비목, 비목별 거래 건수·합계를 두 번의 쿼리로 조회)"""
+    try:
+        budgets = Budget.query.order_by(Budget.created_at.desc()).all()
+        lines = lines_by_budget([budget.id for budget in budgets], with_transaction_stats=True)
+        
+        return jsonify({
+            'success': True,
+            'data': [budget_with_lines(budget, lines[budget.id]) for budget in budgets]
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@budget_bp.route('/<int:budget_id>/overview', methods=['GET'])
+@FeatureFlags.require_budget_ledger
+def get_budget_overview(budget_id):
+    """예산 대시보드 (비목별 거래 건수·합계와 최근 거래 내역, 비목 수와 무관하게 세 번의 쿼리)"""
+    try:
+        budget = Budget.query.get_or_404(budget_id)
+        recent = int(request.args.get('recent', 10))
+        
+        budget_data = budget_with_lines(budget, lines_by_budget([budget_id], with_transaction_stats=True)[budget_id])
+        recent_transactions = Transaction.query.join(BudgetLine).filter(
+            BudgetLine.budget_id == budget_id,
+            Transaction.is_valid == True
+        ).order_by(Transaction.date.desc(), Transaction.id.desc()).limit(recent).all()
+        budget_data['recent_transactions'] = [t.to_dict() for t in recent_transactions]
+        
+        return jsonify({
+            'success': True,
+            'data': budget_data
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @budget_bp.route('/feature-status', methods=['GET'])
 def get_feature_status():
     """Feature Flag 상태 조회"""
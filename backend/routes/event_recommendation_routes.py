@@ -1,9 +1,9 @@
 from flask import Blueprint, request, jsonify
-from models.database import DatabaseManager
+from models.database import get_database_manager
+from models.connection import get_connection
 from services.feature_flags import FeatureFlags
-from typing import List, Dict, Any
-import sqlite3
-import re
+from services.geocoder import distance_label, get_geocoder
+from typing import List, Dict, Any, Optional, Tuple
 
 event_recommendation_bp = Blueprint('event_recommendation', __name__, url_prefix='/api/event-recommendations')
 
@@ -16,6 +16,7 @@ def get_near_event_recommendations():
         budget_category = request.args.get('category', '식비')
         people = int(request.args.get('people', 4))
         limit = int(request.args.get('limit', 10))
+        radius_km = request.args.get('radius_km', type=float)
         
         if not event_location:
             return jsonify({
@@ -25,7 +26,8 @@ def get_near_event_recommendations():
         
         # 행사장 근처 업소 검색
         nearby_restaurants = find_nearby_restaurants(
-            event_location, event_region, budget_category, people, limit
+            event_location, event_region, budget_category, people, limit,
+            radius_km=radius_km
         )
         
         # 행사 정보도 함께 반환
@@ -52,14 +54,14 @@ def get_near_event_recommendations():
 def get_event_specific_recommendations(event_id):
     """특정 행사 기반 추천"""
     try:
-        db_manager = DatabaseManager()
-        conn = sqlite3.connect(db_manager.db_path)
+        db_manager = get_database_manager()
+        conn = get_connection(db_manager.db_path)
         cursor = conn.cursor()
         
         # 행사 정보 조회
         cursor.execute('''
             SELECT id, event_name, location, region, start_date, end_date, 
-                   host_organization, tech_category
+                   host_organization, tech_category, lat, lon
             FROM events WHERE id = ?
         ''', (event_id,))
         
@@ -79,7 +81,9 @@ def get_event_specific_recommendations(event_id):
             'start_date': event[4],
             'end_date': event[5],
             'host_organization': event[6],
-            'tech_category': event[7]
+            'tech_category': event[7],
+            'lat': event[8],
+            'lon': event[9]
         }
         
         # 행사장 근처 업소 검색
@@ -88,7 +92,9 @@ def get_event_specific_recommendations(event_id):
             event_data['region'], 
             '식비', 
             4, 
-            15
+            15,
+            coordinate=(event[8], event[9]) if event[8] is not None else None,
+            event_id=event_id
         )
         
         # 행사 유형별 맞춤 추천
@@ -96,8 +102,6 @@ def get_event_specific_recommendations(event_id):
             event_data, nearby_restaurants
         )
         
-        conn.close()
-        
         return jsonify({
             'success': True,
             'data': {
@@ -119,142 +123,89 @@ def find_nearby_restaurants(
     event_region: str, 
     budget_category: str, 
     people: int, 
-    limit: int
+    limit: int,
+    coordinate: Optional[Tuple[float, float]] = None,
+    radius_km: Optional[float] = None,
+    event_id: Optional[int] = None
 ) -> List[Dict[str, Any]]:
-    """행사장 근처 업소 검색"""
+    """행사장 근처 업소 검색 (행사장 좌표 기준 거리순, event_id를 주면 미리 계산한 후보 우선)"""
     
-    db_manager = DatabaseManager()
-    conn = sqlite3.connect(db_manager.db_path)
-    cursor = conn.cursor()
+    db_manager = get_database_manager()
     
-    # 위치 키워드 추출
-    location_keywords = extract_location_keywords(event_location)
+    # 행사장 좌표 (없으면 장소명을 오프라인 지오코딩)
+    if coordinate is None:
+        geocoded = get_geocoder().geocode_location(event_location, event_region)
+        if geocoded:
+            coordinate = geocoded[:2]
     
-    # 기본 쿼리
-    query = '''
-        SELECT id, name, address, phone, region, business_type, 
-               has_private_room, noise_level, max_party_size, 
-               tax_invoice_supported, card_payment_supported
-        FROM restaurants 
-        WHERE 1=1
-    '''
+    conditions = []
     params = []
     
-    # 지역 우선 매칭
-    if event_region:
-        query += ' AND region = ?'
-        params.append(event_region)
-    
-    # 위치 키워드 매칭
-    if location_keywords:
-        location_conditions = []
-        for keyword in location_keywords:
-            location_conditions.append('address LIKE ?')
-            params.append(f'%{keyword}%')
-        
-        if location_conditions:
-            query += f' AND ({" OR ".join(location_conditions)})'
-    
     # 인원수 필터링
     if people > 0:
-        query += ' AND max_party_size >= ?'
+        conditions.append('r.max_party_size >= ?')
         params.append(people)
     
     # 예산 카테고리별 필터링
     if budget_category == '회의비':
-        query += ' AND (noise_level = "low" OR has_private_room = 1)'
+        conditions.append('(r.noise_level = "low" OR r.has_private_room = 1)')
     elif budget_category == '다과비':
-        query += ' AND business_type IN ("카페", "베이커리", "디저트")'
+        conditions.append('r.business_type IN ("카페", "베이커리", "디저트")')
     
-    query += ' ORDER BY RANDOM() LIMIT ?'
-    params.append(limit)
+    restaurants = None
+    if event_id is not None:
+        restaurants = db_manager.get_event_candidates(
+            event_id, limit, radius_km, ' AND '.join(conditions), params
+        )
     
-    cursor.execute(query, params)
-    restaurants = cursor.fetchall()
+    if restaurants is None and coordinate:
+        restaurants = db_manager.find_restaurants_near(
+            coordinate[0], coordinate[1], limit, radius_km, ' AND '.join(conditions), params
+        )
+    elif restaurants is None:
+        # 좌표를 알 수 없는 장소는 지역 일치로 대체
+        cursor = get_connection(db_manager.db_path).cursor()
+        where = ' AND '.join(['r.region = ?'] + conditions)
+        cursor.execute(f'''
+            SELECT r.* FROM restaurants r WHERE {where}
+            ORDER BY r.id LIMIT ?
+        ''', [event_region] + params + [limit])
+        columns = [description[0] for description in cursor.description]
+        restaurants = [dict(zip(columns, row)) for row in cursor.fetchall()]
     
     # 결과 포맷팅
     result = []
     for restaurant in restaurants:
+        distance_km = restaurant.get('distance_km')
         result.append({
-            'id': restaurant[0],
-            'name': restaurant[1],
-            'address': restaurant[2],
-            'phone': restaurant[3],
-            'region': restaurant[4],
-            'business_type': restaurant[5],
-            'has_private_room': bool(restaurant[6]),
-            'noise_level': restaurant[7],
-            'max_party_size': restaurant[8],
-            'tax_invoice_supported': bool(restaurant[9]),
-            'card_payment_supported': bool(restaurant[10]),
-            'distance_estimate': estimate_distance(event_location, restaurant[2])
+            'id': restaurant['id'],
+            'name': restaurant['name'],
+            'address': restaurant['address'],
+            'phone': restaurant['phone'],
+            'region': restaurant['region'],
+            'business_type': restaurant['business_type'],
+            'has_private_room': bool(restaurant['has_private_room']),
+            'noise_level': restaurant['noise_level'],
+            'max_party_size': restaurant['max_party_size'],
+            'tax_invoice_supported': bool(restaurant['tax_invoice_supported']),
+            'card_payment_supported': bool(restaurant['card_payment_supported']),
+            'distance_km': distance_km,
+            'distance_estimate': distance_label(distance_km)
         })
     
-    conn.close()
     return result
 
-def extract_location_keywords(location: str) -> List[str]:
-    """위치 문자열에서 키워드 추출"""
-    if not location:
-        return []
-    
-    # 괄호 안의 내용 제거
-    location = re.sub(r'\([^)]*\)', '', location)
-    
-    # 쉼표로 분리
-    parts = [part.strip() for part in location.split(',')]
-    
-    # 각 부분에서 주요 키워드 추출
-    keywords = []
-    for part in parts:
-        # 구, 동, 건물명 등 추출
-        if any(keyword in part for keyword in ['구', '동', '로', '길', '센터', '빌딩', '타워']):
-            keywords.append(part)
-        elif len(part) > 2:  # 2글자 이상인 경우만
-            keywords.append(part)
-    
-    return keywords[:3]  # 최대 3개 키워드만 사용
-
-def estimate_distance(location1: str, location2: str) -> str:
-    """거리 추정 (간단한 텍스트 매칭 기반)"""
-    if not location1 or not location2:
-        return "거리 불명"
-    
-    # 같은 구/동이면 가까움
-    if any(keyword in location2 for keyword in location1.split()):
-        return "도보 5분 이내"
-    
-    # 같은 지역이면 중간
-    if any(keyword in location2 for keyword in ['서울', '부산', '대구', '인천', '광주', '대전', '울산']):
-        return "차량 10-20분"
-    
-    return "차량 20분 이상"
-
 def get_event_info(location: str, region: str) -> Dict[str, Any]:
-    """행사 정보 조회"""
-    db_manager = DatabaseManager()
-    conn = sqlite3.connect(db_manager.db_path)
-    cursor = conn.cursor()
-    
-    # 해당 위치의 행사 정보 조회
-    cursor.execute('''
-        SELECT event_name, start_date, end_date, host_organization, tech_category
-        FROM events 
-        WHERE location LIKE ? OR region = ?
-        ORDER BY start_date DESC
-        LIMIT 1
-    ''', (f'%{location}%', region))
-    
-    event = cursor.fetchone()
-    conn.close()
+    """행사 정보 조회 (장소 또는 지역이 같은 가장 최근 행사)"""
+    event = get_database_manager().get_latest_event(location, region)
     
     if event:
         return {
-            'event_name': event[0],
-            'start_date': event[1],
-            'end_date': event[2],
-            'host_organization': event[3],
-            'tech_category': event[4]
+            'event_name': event['event_name'],
+            'start_date': event['start_date'],
+            'end_date': event['end_date'],
+            'host_organization': event['host_organization'],
+            'tech_category': event['tech_category']
         }
     
     return None
@@ -1,9 +1,9 @@
 from flask import Blueprint, request, jsonify
 from models.budget_models import db, PolicyRule, BudgetLine
-from models.database import DatabaseManager
+from models.database import get_database_manager
 from services.feature_flags import FeatureFlags
-from typing import List, Dict, Any
-import sqlite3
+from typing import List, Dict, Any, Optional
+import random
 
 policy_recommendation_bp = Blueprint('policy_recommendation', __name__, url_prefix='/api/policy-recommendations')
 
@@ -17,6 +17,8 @@ def get_policy_based_recommendations():
         people = int(request.args.get('people', 4))
         budget_per_head = int(request.args.get('budget_per_head', 0))
         limit = int(request.args.get('limit', 10))
+        offset = int(request.args.get('offset', 0))
+        seed = request.args.get('seed') or new_sample_seed()
         
         if not category:
             return jsonify({
@@ -34,7 +36,7 @@ def get_policy_based_recommendations():
         
         # 규칙에 맞는 업소 필터링
         filtered_restaurants = filter_restaurants_by_policy(
-            policy_rule, location, people, budget_per_head, limit
+            policy_rule, location, people, budget_per_head, limit, seed, offset
         )
         
         return jsonify({
@@ -43,7 +45,9 @@ def get_policy_based_recommendations():
                 'category': category,
                 'policy_rule': policy_rule.to_dict(),
                 'restaurants': filtered_restaurants,
-                'total_count': len(filtered_restaurants)
+                'total_count': len(filtered_restaurants),
+                'seed': seed,
+                'next_offset': offset + limit if len(filtered_restaurants) == limit else None
             }
         })
         
@@ -62,6 +66,8 @@ def get_budget_line_recommendations(budget_line_id):
         location = request.args.get('location', '')
         people = int(request.args.get('people', 4))
         limit = int(request.args.get('limit', 10))
+        offset = int(request.args.get('offset', 0))
+        seed = request.args.get('seed') or new_sample_seed()
         
         # 비목의 카테고리로 정책 규칙 조회
         policy_rule = PolicyRule.query.filter_by(category=budget_line.category).first()
@@ -77,7 +83,7 @@ def get_budget_line_recommendations(budget_line_id):
         
         # 규칙에 맞는 업소 필터링
         filtered_restaurants = filter_restaurants_by_policy(
-            policy_rule, location, people, budget_per_head, limit
+            policy_rule, location, people, budget_per_head, limit, seed, offset
         )
         
         return jsonify({
@@ -87,7 +93,9 @@ def get_budget_line_recommendations(budget_line_id):
                 'policy_rule': policy_rule.to_dict(),
                 'budget_per_head': budget_per_head,
                 'restaurants': filtered_restaurants,
-                'total_count': len(filtered_restaurants)
+                'total_count': len(filtered_restaurants),
+                'seed': seed,
+                'next_offset': offset + limit if len(filtered_restaurants) == limit else None
             }
         })
         
@@ -97,83 +105,78 @@ def get_budget_line_recommendations(budget_line_id):
             'error': str(e)
         }), 500
 
+def new_sample_seed() -> str:
+    """seed 파라미터가 없을 때 사용할 새 표본 seed (응답에 돌려주어 재사용 가능)"""
+    return format(random.getrandbits(32), '08x')
+
 def filter_restaurants_by_policy(
     policy_rule: PolicyRule, 
     location: str, 
     people: int, 
     budget_per_head: int, 
-    limit: int
+    limit: int,
+    seed: Optional[str] = None,
+    offset: int = 0
 ) -> List[Dict[str, Any]]:
-    """정책 규칙에 따라 업소 필터링"""
+    """정책 규칙에 따라 업소 필터링 (seed별로 고정된 무작위 순서)"""
     
-    db_manager = DatabaseManager()
-    conn = sqlite3.connect(db_manager.db_path)
-    cursor = conn.cursor()
+    db_manager = get_database_manager()
     
-    # 기본 쿼리
-    query = '''
-        SELECT id, name, address, phone, region, business_type, 
-               has_private_room, noise_level, max_party_size, 
-               tax_invoice_supported, card_payment_supported
-        FROM restaurants 
-        WHERE 1=1
-    '''
+    # 기본 조건
+    conditions = ['1 = 1']
     params = []
     
     # 업종 필터링
     allowed_business_types = policy_rule.get_allowed_business_types()
     if allowed_business_types:
         placeholders = ','.join(['?' for _ in allowed_business_types])
-        query += f' AND business_type IN ({placeholders})'
+        conditions.append(f'business_type IN ({placeholders})')
         params.extend(allowed_business_types)
     
     # 위치 필터링 (간단한 지역명 매칭)
     if location:
-        query += ' AND (address LIKE ? OR region LIKE ?)'
+        conditions.append('(address LIKE ? OR region LIKE ?)')
         params.extend([f'%{location}%', f'%{location}%'])
     
     # 인원수 필터링
     if people > 0:
-        query += ' AND max_party_size >= ?'
+        conditions.append('max_party_size >= ?')
         params.append(people)
     
     # 정책별 특수 조건
     if policy_rule.category == '회의비':
         # 조용한 환경 또는 개인룸 필요
-        query += ' AND (noise_level = "low" OR has_private_room = 1)'
+        conditions.append('(noise_level = "low" OR has_private_room = 1)')
     
     # 증빙 요구사항 확인
     required_receipt_types = policy_rule.get_required_receipt_types()
     if 'tax_invoice' in required_receipt_types:
-        query += ' AND tax_invoice_supported = 1'
+        conditions.append('tax_invoice_supported = 1')
     if 'card_slip' in required_receipt_types:
-        query += ' AND card_payment_supported = 1'
-    
-    query += ' ORDER BY RANDOM() LIMIT ?'
-    params.append(limit)
+        conditions.append('card_payment_supported = 1')
     
-    cursor.execute(query, params)
-    restaurants = cursor.fetchall()
+    restaurants = db_manager.sample_restaurants(
+        ' AND '.join(conditions), params, limit, seed, offset
+    )
     
     # 결과 포맷팅
     result = []
     for restaurant in restaurants:
         result.append({
-            'id': restaurant[0],
-            'name': restaurant[1],
-            'address': restaurant[2],
-            'phone': restaurant[3],
-            'region': restaurant[4],
-            'business_type': restaurant[5],
-            'has_private_room': bool(restaurant[6]),
-            'noise_level': restaurant[7],
-            'max_party_size': restaurant[8],
-            'tax_invoice_supported': bool(restaurant[9]),
-            'card_payment_supported': bool(restaurant[10]),
-            'estimated_cost_per_person': estimate_cost_per_person(restaurant[5], budget_per_head)
+            'id': restaurant['id'],
+            'name': restaurant['name'],
+            'address': restaurant['address'],
+            'phone': restaurant['phone'],
+            'region': restaurant['region'],
+            'business_type': restaurant['business_type'],
+            'has_private_room': bool(restaurant['has_private_room']),
+            'noise_level': restaurant['noise_level'],
+            'max_party_size': restaurant['max_party_size'],
+            'tax_invoice_supported': bool(restaurant['tax_invoice_supported']),
+            'card_payment_supported': bool(restaurant['card_payment_supported']),
+            'estimated_cost_per_person': estimate_cost_per_person(restaurant['business_type'], budget_per_head)
         })
     
-    conn.close()
     return result
 
 def estimate_cost_per_person(business_type: str, budget_per_head: int) -> int:
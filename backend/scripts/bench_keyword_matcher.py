@@ -0,0 +1,70 @@
+"""
+키워드 매처 성능 측정
+
+적재된 백년가게 주소·업소명과 행사 장소를 100,000건으로 늘려 KeywordMatcher와
+기존 방식(키워드마다 `in` 검사, 첫 일치에서 중단)의 처리 시간을 비교한다. 5회 중 최솟값(초).
+
+    cd backend && PYTHONPATH=. python scripts/bench_keyword_matcher.py
+"""
+import timeit
+
+from models.database import get_database_manager
+from services.geocoder import get_geocoder
+from services.keyword_matcher import (BUSINESS_TYPE_MATCHER, BUSINESS_TYPE_WORDS, EVENT_WORDS, QUERY_TYPE_MATCHER,
+                                      REGION_MATCHER, REGION_NAMES, VENUE_WORDS)
+
+SAMPLE_SIZE = 100000
+
+def repeat_to(values, size: int = SAMPLE_SIZE):
+    """값 목록을 size건이 되도록 반복"""
+    values = [value or '' for value in values]
+    return (values * (size // len(values) + 1))[:size]
+
+def best_time(func, texts) -> float:
+    """texts 전체에 func를 적용하는 시간 (5회 중 최솟값)"""
+    return min(timeit.repeat(lambda: [func(text) for text in texts], number=1, repeat=5))
+
+def first_region(address: str) -> str:
+    """기존 방식: 시도 약칭을 순서대로 포함 여부 확인"""
+    for region in REGION_NAMES:
+        if region in address:
+            return region
+    return '기타'
+
+def query_type(query: str) -> str:
+    """기존 방식: 지역 > 행사 > 장소 단어 순으로 포함 여부 확인"""
+    for label, words in (('region', REGION_NAMES), ('event', EVENT_WORDS), ('location', VENUE_WORDS)):
+        if any(word in query for word in words):
+            return label
+    return 'general'
+
+def business_type(name: str) -> str:
+    """기존 방식: 업종 순서대로 업소명에 분류 단어가 있는지 확인"""
+    name = name.lower()
+    for label, words in BUSINESS_TYPE_WORDS.items():
+        if any(word.lower() in name for word in words):
+            return label
+    return '기타'
+
+def main():
+    db_manager = get_database_manager()
+    addresses = repeat_to(row['address'] for row in db_manager._fetch_all('SELECT address FROM restaurants'))
+    names = repeat_to(row['name'] for row in db_manager._fetch_all('SELECT name FROM restaurants'))
+    locations = repeat_to(row['location'] for row in db_manager._fetch_all('SELECT location FROM events'))
+    venue_matcher = get_geocoder().venue_matcher
+
+    cases = [
+        ('지역 추출 (주소)', addresses, first_region, lambda text: REGION_MATCHER.first_label(text, '기타')),
+        ('쿼리 유형 (행사 장소)', locations, query_type, lambda text: QUERY_TYPE_MATCHER.best_label(text, 'general')),
+        ('업종 분류 (업소명)', names, business_type, lambda text: BUSINESS_TYPE_MATCHER.best_label(text, '기타')),
+        ('행사장 별칭 최장 일치 (행사 장소)', locations, None, venue_matcher.longest_match)
+    ]
+    print(f'{SAMPLE_SIZE:,}건 기준 처리 시간 (초)')
+    for name, texts, baseline, matcher in cases:
+        line = f'{name}: KeywordMatcher {best_time(matcher, texts):.3f}'
+        if baseline:
+            line += f', 기존 방식 {best_time(baseline, texts):.3f}'
+        print(line)
+
+if __name__ == '__main__':
+    main()
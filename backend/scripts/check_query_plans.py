@@ -0,0 +1,131 @@
+"""
+예산 원장 주요 쿼리의 실행 계획 점검
+
+빈 임시 SQLite DB에 마이그레이션을 끝까지 적용한 뒤, 라우트가 사용하는 쿼리의
+EXPLAIN QUERY PLAN에 기대한 인덱스가 나타나는지, 정렬을 인덱스 순서로 처리해야 하는 쿼리에
+임시 B-tree 정렬(USE TEMP B-TREE)이 없는지 확인한다. 하나라도 어긋나면 종료 코드 1.
+
+    cd backend && PYTHONPATH=. python scripts/check_query_plans.py
+"""
+import os
+import sys
+import tempfile
+from datetime import date
+
+from flask import Flask
+from flask_migrate import Migrate, upgrade
+from sqlalchemy import and_, func, or_, text
+from sqlalchemy.dialects import sqlite
+
+from models.budget_models import db, Budget, BudgetLine, Transaction, PolicyRule, SpendRollup
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+def plan_checks():
+    """(이름, 쿼리, 계획에 나타나야 하는 인덱스, 임시 정렬 허용 여부) 목록"""
+    return [
+        (
+            'get_line_summary: 비목별 유효 거래 건수',
+            db.session.query(func.count(Transaction.id)).filter(
+                Transaction.budget_line_id == 1, Transaction.is_valid == True
+            ),
+            'ix_transactions_line_valid_date',
+            False
+        ),
+        (
+            'get_line_summary: 키셋 페이지',
+            Transaction.query.filter(
+                Transaction.budget_line_id == 1, Transaction.is_valid == True,
+                Transaction.date <= date(2025, 6, 30),
+                or_(Transaction.date < date(2025, 6, 30), Transaction.id < 100)
+            ).order_by(Transaction.date.desc(), Transaction.id.desc()).limit(51),
+            'ix_transactions_line_valid_date',
+            False
+        ),
+        (
+            'export: 비목 거래 내보내기',
+            Transaction.query.filter(
+                Transaction.budget_line_id == 1, Transaction.is_valid == True
+            ).order_by(Transaction.date, Transaction.id),
+            'ix_transactions_line_valid_date',
+            False
+        ),
+        (
+            'list_budgets: 예산 최신순',
+            Budget.query.order_by(Budget.created_at.desc()),
+            'ix_budgets_created_at',
+            False
+        ),
+        (
+            'list_budgets: 예산별 비목',
+            BudgetLine.query.filter(BudgetLine.budget_id.in_([1, 2, 3])).order_by(BudgetLine.budget_id, BudgetLine.id),
+            'ix_budget_lines_budget_id',
+            False
+        ),
+        (
+            'overview: 비목별 거래 건수·합계',
+            db.session.query(
+                BudgetLine, func.count(Transaction.id), func.coalesce(func.sum(Transaction.amount), 0)
+            ).outerjoin(
+                Transaction, and_(Transaction.budget_line_id == BudgetLine.id, Transaction.is_valid == True)
+            ).filter(BudgetLine.budget_id.in_([1])).group_by(BudgetLine.id),
+            'ix_transactions_line_valid_date',
+            False
+        ),
+        (
+            'overview: 최근 거래',
+            Transaction.query.join(BudgetLine).filter(
+                BudgetLine.budget_id == 1, Transaction.is_valid == True
+            ).order_by(Transaction.date.desc(), Transaction.id.desc()).limit(10),
+            'ix_budget_lines_budget_id',
+            True  # 여러 비목의 거래를 합쳐 정렬하므로 임시 정렬 허용
+        ),
+        (
+            'policy: 분류별 정책 규칙',
+            PolicyRule.query.filter_by(category='회의비'),
+            'ix_policy_rules_category',
+            False
+        ),
+        (
+            'rollup: 예산별 월 집계',
+            SpendRollup.query.filter(SpendRollup.budget_id == 1).order_by(SpendRollup.period),
+            'ix_spend_rollups_budget_period',
+            False
+        )
+    ]
+
+def explain(query) -> str:
+    """ORM 쿼리를 리터럴 값으로 컴파일해 EXPLAIN QUERY PLAN 결과를 한 문자열로 반환"""
+    sql = str(query.statement.compile(dialect=sqlite.dialect(), compile_kwargs={'literal_binds': True}))
+    rows = db.session.execute(text('EXPLAIN QUERY PLAN ' + sql)).fetchall()
+    return ' | '.join(row[-1] for row in rows)
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as directory:
+        app = Flask(__name__)
+        app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(directory, 'plans.db')}"
+        app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        db.init_app(app)
+        Migrate(app, db, directory=MIGRATIONS_DIR)
+
+        failures = 0
+        with app.app_context():
+            upgrade()
+            for name, query, index, allow_temp_sort in plan_checks():
+                plan = explain(query)
+                uses_index = index in plan
+                sorted_by_index = allow_temp_sort or 'USE TEMP B-TREE' not in plan
+                ok = uses_index and sorted_by_index
+                failures += not ok
+                print(f"[{'OK' if ok else 'FAIL'}] {name}: {plan}")
+                if not uses_index:
+                    print(f"       기대한 인덱스 {index}를 사용하지 않습니다")
+                if not sorted_by_index:
+                    print("       인덱스 순서 대신 임시 B-tree로 정렬합니다")
+            db.session.remove()
+
+    print(f"\n실행 계획 점검 {'통과' if not failures else f'실패 {failures}건'}")
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+전문 검색 색인과 메모리 조회 엔진의 검색 결과 일치 점검
+
+임시 SQLite DB에 원본 CSV를 적재한 뒤 같은 검색어를 FTS 색인(SQLite)과 메모리 카탈로그로
+각각 조회해 결과 id 집합이 같은지 확인한다. 한 단어 검색어는 기존 LIKE '%검색어%' 결과와도
+비교한다. 하나라도 다르면 종료 코드 1.
+
+    cd backend && PYTHONPATH=. python scripts/check_search_parity.py
+"""
+import os
+import sys
+import tempfile
+
+from models.database import DatabaseManager, _sql_limit
+from services.text_search import WORD_PATTERN
+
+RESTAURANT_KEYWORDS = ['집', '탕', '빵', '회', '국', '떡', '서울', '한식', '국밥', '전주시', '서울 국', '대전 집']
+EVENT_KEYWORDS = ['회', '대전', '포럼', '기술', '세미나', 'AI', '대전 회']
+
+def like_ids(manager: DatabaseManager, table: str, columns, keyword: str):
+    """기존 LIKE 부분 문자열 검색 결과 id 집합"""
+    condition = ' OR '.join(f'{column} LIKE ?' for column in columns)
+    rows = manager._fetch_all(f'SELECT id FROM {table} WHERE {condition} LIMIT ?',
+                              [f'%{keyword}%' for _ in columns] + [_sql_limit(None)])
+    return {row['id'] for row in rows}
+
+def compare(name: str, keyword: str, sqlite_ids, memory_ids, like=None) -> bool:
+    """결과 집합을 비교해 한 줄로 출력"""
+    ok = sqlite_ids == memory_ids and (like is None or like == sqlite_ids)
+    counts = f'sqlite {len(sqlite_ids)}, memory {len(memory_ids)}'
+    if like is not None:
+        counts += f', LIKE {len(like)}'
+    print(f"[{'OK' if ok else 'FAIL'}] {name} '{keyword}': {counts}")
+    return ok
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = os.path.join(directory, 'search.db')
+        sqlite_engine = DatabaseManager(db_path, memory_engine=False)
+        memory_engine = DatabaseManager(db_path, auto_load=False, memory_engine=True)
+
+        failures = 0
+        for keyword in RESTAURANT_KEYWORDS:
+            single_word = len(WORD_PATTERN.findall(keyword)) == 1
+            failures += not compare(
+                '백년가게', keyword,
+                {row['id'] for row in sqlite_engine.get_restaurants_by_keyword(keyword)},
+                {row['id'] for row in memory_engine.get_restaurants_by_keyword(keyword)},
+                like_ids(sqlite_engine, 'restaurants', ('name', 'address'), keyword) if single_word else None
+            )
+        for keyword in EVENT_KEYWORDS:
+            single_word = len(WORD_PATTERN.findall(keyword)) == 1
+            failures += not compare(
+                '행사', keyword,
+                {row['id'] for row in sqlite_engine.search_events(keyword)},
+                {row['id'] for row in memory_engine.search_events(keyword)},
+                like_ids(sqlite_engine, 'events', ('event_name', 'location', 'hashtags'), keyword) if single_word else None
+            )
+
+    print(f"\n검색 결과 일치 점검 {'통과' if not failures else f'실패 {failures}건'}")
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
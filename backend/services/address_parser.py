@@ -0,0 +1,94 @@
+import re
+from typing import NamedTuple, Optional
+
+from services.keyword_matcher import REGION_NAMES
+
+# 주소 첫 단어 표기 -> 시도 약칭
+SIDO_ALIASES = {
+    '서울특별시': '서울', '서울시': '서울',
+    '부산광역시': '부산', '부산시': '부산',
+    '대구광역시': '대구', '대구시': '대구',
+    '인천광역시': '인천', '인천시': '인천',
+    '광주광역시': '광주',
+    '대전광역시': '대전', '대전시': '대전',
+    '울산광역시': '울산', '울산시': '울산',
+    '세종특별자치시': '세종', '세종시': '세종',
+    '경기도': '경기',
+    '강원도': '강원', '강원특별자치도': '강원',
+    '충청북도': '충북',
+    '충청남도': '충남',
+    '전라북도': '전북', '전북특별자치도': '전북',
+    '전라남도': '전남',
+    '경상북도': '경북',
+    '경상남도': '경남',
+    '제주도': '제주', '제주특별자치도': '제주'
+}
+
+# 시/군/구, 읍/면/동(리·가 포함) 단위로 끝나는 주소 단어
+SIGUNGU_PATTERN = re.compile(r'^[가-힣]+[시군구]$')
+EUPMYEONDONG_PATTERN = re.compile(r'^[가-힣]+(?:[0-9]*[읍면동리]|[0-9]+가)$')
+# 도로명 주소의 참고항목 괄호 (예: "(만년동)", "(대치동, 미도상가 ...)")
+REFERENCE_PATTERN = re.compile(r'\(([^)]*)\)')
+
+class ParsedAddress(NamedTuple):
+    """시도 / 시군구 / 읍면동으로 나눈 주소 (알 수 없는 단계는 빈 문자열)"""
+    sido: str
+    sigungu: str
+    eupmyeondong: str
+
+def normalize_sido(token: Optional[str]) -> Optional[str]:
+    """시도 표기를 약칭으로 변환 ("서울특별시", "전라북도" -> "서울", "전북")"""
+    if not token:
+        return None
+    if token in REGION_NAMES:
+        return token
+    return SIDO_ALIASES.get(token)
+
+def parse_address(address: Optional[str]) -> ParsedAddress:
+    """
+    도로명/지번 주소를 시도, 시군구, 읍면동으로 분해
+
+    시군구는 "전주시 덕진구"처럼 일반구가 붙은 경우 시 단위("전주시")까지만 담는다.
+    읍면동은 지번 주소의 단어 또는 도로명 주소의 참고항목 괄호에서 찾는다.
+
+    Args:
+        address: 원본 주소 (예: "대전 서구 만년로68번길 21(만년동)")
+
+    Returns:
+        ParsedAddress: (예: ("대전", "서구", "만년동"))
+    """
+    if not address:
+        return ParsedAddress('', '', '')
+
+    tokens = REFERENCE_PATTERN.sub(' ', address).replace(',', ' ').split()
+    if not tokens:
+        return ParsedAddress('', '', '')
+
+    sido = normalize_sido(tokens[0]) or ''
+    rest = tokens[1:] if sido else tokens
+
+    # "수원 팔달구"처럼 시를 생략한 표기는 시를 붙여 보정
+    if len(rest) > 1 and not SIGUNGU_PATTERN.match(rest[0]) and rest[1].endswith('구') and SIGUNGU_PATTERN.match(rest[1]):
+        rest = [rest[0] + '시'] + rest[1:]
+    
+    sigungu = ''
+    if rest and SIGUNGU_PATTERN.match(rest[0]):
+        sigungu = rest[0]
+        rest = rest[1:]
+        # 일반구 ("전주시 덕진구"의 "덕진구")는 건너뜀
+        if sigungu.endswith('시') and rest and rest[0].endswith('구') and SIGUNGU_PATTERN.match(rest[0]):
+            rest = rest[1:]
+
+    eupmyeondong = ''
+    for token in rest[:2]:
+        if EUPMYEONDONG_PATTERN.match(token):
+            eupmyeondong = token
+            break
+    else:
+        for reference in REFERENCE_PATTERN.findall(address):
+            first = reference.replace(',', ' ').split()
+            if first and EUPMYEONDONG_PATTERN.match(first[0]):
+                eupmyeondong = first[0]
+                break
+
+    return ParsedAddress(sido, sigungu, eupmyeondong)
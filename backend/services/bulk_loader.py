@@ -0,0 +1,92 @@
+import sqlite3
+from itertools import islice
+from typing import Iterable, List, Sequence, Tuple
+
+class BulkLoader:
+    """스테이징 테이블에 대량 적재한 뒤 원본 테이블과 교체하는 적재기
+
+    호출하는 쪽에서 연 트랜잭션 안에서 동작하며 커밋하지 않는다.
+    교체까지 한 트랜잭션으로 묶이므로 다른 연결은 커밋 전까지 기존 스냅샷을 본다.
+    """
+
+    def __init__(self, cursor: sqlite3.Cursor, batch_size: int = 5000):
+        self.cursor = cursor
+        self.batch_size = batch_size
+
+    def load(
+        self,
+        table: str,
+        create_sql: str,
+        index_sqls: Sequence[str],
+        columns: Sequence[str],
+        rows: Iterable[Tuple],
+        preserve_columns: Sequence[str] = (),
+        trigger_sqls: Sequence[str] = ()
+    ) -> int:
+        """
+        rows를 스테이징 테이블에 배치 단위로 적재하고 table과 교체
+
+        Args:
+            table: 교체할 테이블명
+            create_sql: 테이블 생성 DDL ({table} 자리표시자 포함)
+            index_sqls: 적재 후 생성할 인덱스 DDL 목록 ({table} 자리표시자 포함)
+            columns: rows 튜플의 컬럼 순서
+            rows: 적재할 행 (이터레이터 가능)
+            preserve_columns: 기존 테이블에서 같은 id·name 행의 값을 이어받을 컬럼
+            trigger_sqls: 교체 후 다시 생성할 트리거 DDL 목록 (적재 중에는 트리거를 거치지 않음)
+
+        Returns:
+            int: 적재된 행 수
+        """
+        staging = f'{table}_staging'
+
+        self.cursor.execute(f'DROP TABLE IF EXISTS {staging}')
+        self.cursor.execute(create_sql.format(table=staging))
+
+        insert_sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+            staging, ', '.join(columns), ', '.join('?' for _ in columns)
+        )
+
+        total = 0
+        for batch in self._batched(rows):
+            self.cursor.executemany(insert_sql, batch)
+            total += len(batch)
+
+        if preserve_columns:
+            self._carry_over(table, staging, preserve_columns)
+
+        # 교체 후 인덱스 생성 (기존 인덱스는 기존 테이블과 함께 삭제됨)
+        self.cursor.execute(f'DROP TABLE IF EXISTS {table}')
+        self.cursor.execute(f'ALTER TABLE {staging} RENAME TO {table}')
+        for index_sql in index_sqls:
+            self.cursor.execute(index_sql.format(table=table))
+        for trigger_sql in trigger_sqls:
+            self.cursor.execute(trigger_sql)
+
+        return total
+
+    def _batched(self, rows: Iterable[Tuple]) -> Iterable[List[Tuple]]:
+        """행을 batch_size 단위 리스트로 분할"""
+        iterator = iter(rows)
+        while True:
+            batch = list(islice(iterator, self.batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def _carry_over(self, table: str, staging: str, columns: Sequence[str]):
+        """기존 테이블의 보강 컬럼 값을 같은 행(id, name 일치)으로 복사"""
+        self.cursor.execute(f'PRAGMA table_info({table})')
+        existing = {row[1] for row in self.cursor.fetchall()}
+        columns = [column for column in columns if column in existing]
+        if not columns:
+            return
+
+        column_list = ', '.join(columns)
+        old_columns = ', '.join(f'old.{column}' for column in columns)
+        match = f'old.id = {staging}.id AND old.name = {staging}.name'
+        self.cursor.execute(f'''
+            UPDATE {staging}
+            SET ({column_list}) = (SELECT {old_columns} FROM {table} AS old WHERE {match})
+            WHERE EXISTS (SELECT 1 FROM {table} AS old WHERE {match})
+        ''')
@@ -1,12 +1,92 @@
 import csv
+import codecs
+import io
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, BinaryIO, Iterator
+
+from services.keyword_matcher import REGION_MATCHER
+from services.address_parser import parse_address
 
 class CSVReader:
     """한글 CSV 파일을 읽기 위한 클래스"""
     
-    def __init__(self):
+    def __init__(self, sniff_bytes: int = 64 * 1024):
         self.encodings = ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr']
+        self.sniff_bytes = sniff_bytes
+    
+    def detect_encoding(self, file_path: str) -> str:
+        """파일 앞부분을 읽어 인코딩 판별"""
+        with open(file_path, 'rb') as file:
+            return self.detect_stream_encoding(file)
+    
+    def detect_stream_encoding(self, stream: BinaryIO) -> str:
+        """
+        바이너리 스트림의 인코딩 판별 (판별 후 스트림 위치를 처음으로 되돌림)
+        
+        sniff_bytes 단위로 읽으며 후보 인코딩별 증분 디코더로 엄격하게 검사한다.
+        ASCII가 아닌 바이트가 처음 나타난 구간까지만 읽으므로 파일 전체를 디코딩하지 않는다.
+        
+        Args:
+            stream: seek 가능한 바이너리 스트림
+            
+        Returns:
+            str: 판별된 인코딩
+        """
+        head = stream.read(len(codecs.BOM_UTF8))
+        stream.seek(0)
+        if head == codecs.BOM_UTF8:
+            return 'utf-8-sig'
+        
+        decoders = [(encoding, codecs.getincrementaldecoder(encoding)('strict'))
+                    for encoding in self.encodings if encoding != 'utf-8-sig']
+        try:
+            while decoders:
+                chunk = stream.read(self.sniff_bytes)
+                final = not chunk
+                survivors = []
+                for encoding, decoder in decoders:
+                    try:
+                        decoder.decode(chunk, final=final)
+                        survivors.append((encoding, decoder))
+                    except UnicodeDecodeError:
+                        continue
+                decoders = survivors
+                # 비 ASCII 바이트가 있는 구간을 통과한 첫 후보로 결정
+                if decoders and (final or not chunk.isascii()):
+                    return decoders[0][0]
+        finally:
+            stream.seek(0)
+        
+        raise Exception("Failed to detect encoding with any of: " + ', '.join(self.encodings))
+    
+    def iter_csv(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        CSV 파일을 한 행씩 딕셔너리로 반환하는 제너레이터
+        
+        Args:
+            file_path: CSV 파일 경로
+            
+        Yields:
+            Dict[str, Any]: CSV 한 행
+        """
+        with open(file_path, 'rb') as binary:
+            yield from self.iter_csv_stream(binary, name=file_path)
+    
+    def iter_csv_stream(self, stream: BinaryIO, name: str = '<stream>') -> Iterator[Dict[str, Any]]:
+        """바이너리 스트림에서 CSV 행을 하나씩 반환하는 제너레이터"""
+        encoding = self.detect_stream_encoding(stream)
+        print(f"Reading {name} with encoding: {encoding}")
+        
+        text = io.TextIOWrapper(stream, encoding=encoding, errors='strict', newline='')
+        try:
+            count = 0
+            for row in csv.DictReader(text):
+                count += 1
+                yield row
+            print(f"Total rows: {count}")
+        finally:
+            # 호출한 쪽이 연 스트림은 닫지 않음
+            text.detach()
     
     def read_csv(self, file_path: str) -> List[Dict[str, Any]]:
         """
@@ -18,21 +98,7 @@ class CSVReader:
         Returns:
             List[Dict[str, Any]]: CSV 데이터를 딕셔너리 리스트로 변환한 결과
         """
-        for encoding in self.encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding, newline='') as file:
-                    reader = csv.DictReader(file)
-                    data = list(reader)
-                    print(f"Successfully read {file_path} with encoding: {encoding}")
-                    print(f"Total rows: {len(data)}")
-                    return data
-            except UnicodeDecodeError:
-                continue
-            except Exception as e:
-                print(f"Error reading {file_path} with encoding {encoding}: {e}")
-                continue
-        
-        raise Exception(f"Failed to read {file_path} with any encoding")
+        return list(self.iter_csv(file_path))
 
 class DataProcessor:
     """CSV 데이터를 처리하는 클래스"""
@@ -42,29 +108,28 @@ class DataProcessor:
     
     def load_restaurant_data(self, file_path: str) -> List[Dict[str, Any]]:
         """백년가게 데이터 로드"""
-        data = self.csv_reader.read_csv(file_path)
-        
+        return list(self.iter_restaurant_data(file_path))
+    
+    def iter_restaurant_data(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """백년가게 데이터를 한 행씩 정제하여 반환"""
         # 데이터 정제 및 변환
-        processed_data = []
-        for row in data:
-            processed_row = {
+        for row in self.csv_reader.iter_csv(file_path):
+            yield {
                 'id': int(row.get('연번', 0)),
                 'name': row.get('업체명', '').strip(),
                 'address': row.get('업체주소', '').strip(),
                 'phone': row.get('연락처', '').strip(),
                 'region': self._extract_region(row.get('업체주소', ''))
             }
-            processed_data.append(processed_row)
-        
-        return processed_data
     
     def load_event_data(self, file_path: str) -> List[Dict[str, Any]]:
         """행사일정 데이터 로드"""
-        data = self.csv_reader.read_csv(file_path)
-        
-        processed_data = []
-        for row in data:
-            processed_row = {
+        return list(self.iter_event_data(file_path))
+    
+    def iter_event_data(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """행사일정 데이터를 한 행씩 정제하여 반환"""
+        for row in self.csv_reader.iter_csv(file_path):
+            yield {
                 'id': int(row.get('순번', 0)),
                 'organization': row.get('기관명', '').strip(),
                 'event_name': row.get('행사명', '').strip(),
@@ -76,41 +141,29 @@ class DataProcessor:
                 'start_date': row.get('행사기간-시작일', '').strip(),
                 'end_date': row.get('행사기간-종료일', '').strip()
             }
-            processed_data.append(processed_row)
-        
-        return processed_data
     
     def load_schedule_data(self, file_path: str) -> List[Dict[str, Any]]:
         """유관기관 일정 데이터 로드"""
-        data = self.csv_reader.read_csv(file_path)
-        
-        processed_data = []
-        for row in data:
-            processed_row = {
+        return list(self.iter_schedule_data(file_path))
+    
+    def iter_schedule_data(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """유관기관 일정 데이터를 한 행씩 정제하여 반환"""
+        for row in self.csv_reader.iter_csv(file_path):
+            yield {
                 'id': int(row.get('구분', 0)),
                 'start_date': row.get('일정 시작일', '').strip(),
                 'end_date': row.get('일정 종료일', '').strip(),
                 'title': row.get('일정제목', '').strip(),
                 'created_date': row.get('작성일', '').strip()
             }
-            processed_data.append(processed_row)
-        
-        return processed_data
     
     def _extract_region(self, address: str) -> str:
         """주소에서 지역 정보 추출"""
         if not address:
             return ''
         
-        # 주요 지역 키워드 추출
-        regions = ['서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종', 
-                  '경기', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주']
-        
-        for region in regions:
-            if region in address:
-                return region
-        
-        return '기타'
+        # 주소 첫머리의 시도 표기 ("서울특별시", "전라북도" 포함), 없으면 가장 먼저 등장하는 시도명
+        return parse_address(address).sido or REGION_MATCHER.first_label(address, '기타')
 
 if __name__ == "__main__":
     processor = DataProcessor()
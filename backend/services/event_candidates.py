@@ -0,0 +1,63 @@
+from typing import Iterator, Sequence, Tuple
+
+import numpy as np
+
+from services.geocoder import distance_bucket
+
+EARTH_RADIUS_KM = 6371.0088
+
+def haversine_matrix(lats: np.ndarray, lons: np.ndarray, to_lats: np.ndarray, to_lons: np.ndarray) -> np.ndarray:
+    """두 좌표 목록 사이의 대원 거리(km) 행렬 (행: 첫 목록, 열: 두 번째 목록)"""
+    lat1, lon1 = np.radians(lats)[:, None], np.radians(lons)[:, None]
+    lat2, lon2 = np.radians(to_lats)[None, :], np.radians(to_lons)[None, :]
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return EARTH_RADIUS_KM * 2 * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+def nearest_candidates(
+    events: Sequence[Tuple[int, float, float]],
+    restaurants: Sequence[Tuple[int, float, float]],
+    limit: int,
+    chunk_size: int = 256
+) -> Iterator[Tuple[int, int, int, float, int, float]]:
+    """
+    행사마다 가장 가까운 백년가게 limit개를 계산
+
+    행사 chunk_size개씩 거리 행렬을 만들어 argpartition으로 상위 후보를 고른 뒤
+    (거리, id) 순으로 정렬한다. 거리는 실시간 근접 검색과 같게 소수 셋째 자리로 반올림한다.
+
+    Args:
+        events: (행사 id, 위도, 경도) 목록
+        restaurants: (백년가게 id, 위도, 경도) 목록
+        limit: 행사당 후보 수
+
+    Yields:
+        Tuple: (event_id, rank, restaurant_id, distance_km, distance_bucket, score)
+            score는 가까울수록 큰 근접 점수 1 / (1 + distance_km)
+    """
+    if not events or not restaurants or limit <= 0:
+        return
+
+    restaurant_ids = np.array([row[0] for row in restaurants], dtype=np.int64)
+    restaurant_lats = np.array([row[1] for row in restaurants], dtype=np.float64)
+    restaurant_lons = np.array([row[2] for row in restaurants], dtype=np.float64)
+    top = min(limit, len(restaurants))
+
+    for start in range(0, len(events), chunk_size):
+        chunk = events[start:start + chunk_size]
+        distances = np.round(haversine_matrix(
+            np.array([row[1] for row in chunk]), np.array([row[2] for row in chunk]),
+            restaurant_lats, restaurant_lons
+        ), 3)
+
+        for (event_id, _, _), row in zip(chunk, distances):
+            # 경계 동점이 잘리지 않도록 top번째 거리 이하인 후보를 모두 남긴 뒤 정렬
+            if top < len(row):
+                threshold = np.partition(row, top - 1)[top - 1]
+                candidates = np.flatnonzero(row <= threshold)
+            else:
+                candidates = np.arange(len(row))
+            order = candidates[np.lexsort((restaurant_ids[candidates], row[candidates]))][:top]
+            for rank, index in enumerate(order, start=1):
+                distance_km = float(row[index])
+                yield (int(event_id), rank, int(restaurant_ids[index]), distance_km,
+                       distance_bucket(distance_km), round(1 / (1 + distance_km), 4))
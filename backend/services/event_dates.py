@@ -0,0 +1,37 @@
+import re
+from datetime import date
+from typing import Optional, Tuple
+
+# "2023-01-30", "2023.1.30", "2023/01/30", "20230130" 형식의 날짜
+DATE_PATTERN = re.compile(r'^\s*(\d{4})[-./]?(\d{1,2})[-./]?(\d{1,2})\.?\s*$')
+
+def parse_date(value: Optional[str]) -> Optional[date]:
+    """여러 표기의 날짜 문자열을 date로 변환 (해석할 수 없으면 None)"""
+    if not value:
+        return None
+    match = DATE_PATTERN.match(value)
+    if not match:
+        return None
+    try:
+        return date(*(int(part) for part in match.groups()))
+    except ValueError:
+        return None
+
+def normalize_period(start: Optional[str], end: Optional[str]) -> Tuple[str, str, Optional[int], Optional[int]]:
+    """
+    행사 시작일/종료일을 ISO 문자열과 서수(date.toordinal) 정수로 정규화
+
+    종료일이 없거나 시작일보다 앞서면 시작일과 같은 날로 본다.
+    해석할 수 없는 시작일은 원본 문자열과 서수 None을 그대로 돌려준다.
+
+    Returns:
+        Tuple[str, str, Optional[int], Optional[int]]: (start_date, end_date, start_ord, end_ord)
+    """
+    start_day = parse_date(start)
+    if start_day is None:
+        return start or '', end or '', None, None
+
+    end_day = parse_date(end)
+    if end_day is None or end_day < start_day:
+        end_day = start_day
+    return start_day.isoformat(), end_day.isoformat(), start_day.toordinal(), end_day.toordinal()
@@ -10,6 +10,11 @@ class FeatureFlags:
         """예산 관리 기능 활성화 여부 확인"""
         return os.environ.get('BUDGET_LEDGER_ENABLED', 'false').lower() == 'true'
     
+    @staticmethod
+    def is_memory_engine_enabled() -> bool:
+        """카탈로그 메모리 조회 엔진 활성화 여부 확인"""
+        return os.environ.get('MEMORY_ENGINE_ENABLED', 'false').lower() == 'true'
+    
     @staticmethod
     def require_budget_ledger(f):
         """예산 관리 기능이 활성화되어야만 접근 가능한 데코레이터"""
@@ -27,5 +32,6 @@ class FeatureFlags:
     def get_feature_status() -> dict:
         """모든 Feature Flag 상태 반환"""
         return {
-            'budget_ledger_enabled': FeatureFlags.is_budget_ledger_enabled()
+            'budget_ledger_enabled': FeatureFlags.is_budget_ledger_enabled(),
+            'memory_engine_enabled': FeatureFlags.is_memory_engine_enabled()
         }
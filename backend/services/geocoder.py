@@ -0,0 +1,163 @@
+import math
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from services.data_processor import CSVReader
+from services.keyword_matcher import KeywordMatcher
+from services.address_parser import normalize_sido
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+# 주소 좌표 참조 테이블 (시도/시군구 청사 소재지 기준 근사 좌표, 주요 행사장 좌표)
+REGION_COORDINATES_CSV = os.path.join(DATA_DIR, 'region_coordinates.csv')
+VENUE_COORDINATES_CSV = os.path.join(DATA_DIR, 'venue_coordinates.csv')
+
+# 연구개발특구 행사지역 -> 대표 시도/시군구 (행사장 좌표를 찾지 못했을 때 사용)
+ZONE_REGIONS = {
+    '대덕특구': ('대전', '유성구'),
+    '과학벨트': ('대전', '유성구'),
+    '광주특구': ('광주', '북구'),
+    '대구특구': ('대구', '달성군'),
+    '부산특구': ('부산', '강서구'),
+    '전북특구': ('전북', '전주시'),
+    '울산특구': ('울산', '울주군')
+}
+
+# 위도 1도의 거리(km)
+KM_PER_DEGREE_LAT = 111.32
+
+Coordinate = Tuple[float, float, str]
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """두 좌표 사이의 대원 거리(km)"""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 6371.0088 * 2 * math.asin(math.sqrt(a))
+
+def bounding_box(lat: float, lon: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """중심 좌표에서 반경 radius_km를 포함하는 (min_lat, max_lat, min_lon, max_lon)"""
+    delta_lat = radius_km / KM_PER_DEGREE_LAT
+    delta_lon = radius_km / (KM_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 0.01))
+    return lat - delta_lat, lat + delta_lat, lon - delta_lon, lon + delta_lon
+
+# 이동 시간 구간: (최대 거리 km, 문구), 마지막 구간은 그 이상
+DISTANCE_BUCKETS = ((1, "도보 15분 이내"), (5, "차량 10분 이내"), (15, "차량 10-20분"), (None, "차량 20분 이상"))
+
+def distance_bucket(distance_km: Optional[float]) -> Optional[int]:
+    """거리(km)가 속한 DISTANCE_BUCKETS 구간 번호 (거리 불명이면 None)"""
+    if distance_km is None:
+        return None
+    for bucket, (limit, _) in enumerate(DISTANCE_BUCKETS):
+        if limit is None or distance_km <= limit:
+            return bucket
+    return len(DISTANCE_BUCKETS) - 1
+
+def distance_label(distance_km: Optional[float]) -> str:
+    """거리(km)를 이동 시간 구간 문구로 변환"""
+    bucket = distance_bucket(distance_km)
+    if bucket is None:
+        return "거리 불명"
+    return DISTANCE_BUCKETS[bucket][1]
+
+class OfflineGeocoder:
+    """로컬 참조 테이블 기반 주소/장소 좌표 변환기 (네트워크 사용 안 함)"""
+
+    def __init__(self, region_file: str = REGION_COORDINATES_CSV, venue_file: str = VENUE_COORDINATES_CSV):
+        self.sido_coords: Dict[str, Tuple[float, float]] = {}
+        self.sigungu_coords: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self.sigungu_by_name: Dict[str, List[str]] = {}
+        self.venue_coords: Dict[str, Tuple[float, float]] = {}
+        venue_aliases: Dict[str, List[str]] = {}
+
+        csv_reader = CSVReader()
+        for row in csv_reader.iter_csv(region_file):
+            coords = (float(row['위도']), float(row['경도']))
+            sido, sigungu = row['시도'].strip(), row['시군구'].strip()
+            if sigungu:
+                self.sigungu_coords[(sido, sigungu)] = coords
+                self.sigungu_by_name.setdefault(sigungu, []).append(sido)
+            else:
+                self.sido_coords[sido] = coords
+
+        for row in csv_reader.iter_csv(venue_file):
+            self.venue_coords[row['장소명']] = (float(row['위도']), float(row['경도']))
+            venue_aliases[row['장소명']] = [row['장소명']] + [alias for alias in row['별칭'].split('|') if alias]
+        self.venue_matcher = KeywordMatcher(venue_aliases)
+
+    def normalize_sido(self, token: str) -> Optional[str]:
+        """주소 첫 단어를 시도 약칭으로 변환 (좌표가 있는 시도만)"""
+        sido = normalize_sido(token)
+        return sido if sido in self.sido_coords else None
+
+    def geocode_address(self, address: str) -> Optional[Coordinate]:
+        """
+        도로명/지번 주소를 좌표로 변환
+
+        Returns:
+            Optional[Coordinate]: (위도, 경도, 정밀도) - 정밀도는 'sigungu' 또는 'sido'
+        """
+        tokens = (address or '').replace(',', ' ').split()
+        if not tokens:
+            return None
+
+        sido = self.normalize_sido(tokens[0])
+        rest = tokens[1:] if sido else tokens
+
+        for token in rest[:2]:
+            for candidate in (token, token + '시', token + '군'):
+                if sido and (sido, candidate) in self.sigungu_coords:
+                    lat, lon = self.sigungu_coords[(sido, candidate)]
+                    return lat, lon, 'sigungu'
+                # 시도 없이 시군구로 시작하는 주소 (예: "청주시 상당구 ...")
+                if not sido and len(self.sigungu_by_name.get(candidate, [])) == 1:
+                    lat, lon = self.sigungu_coords[(self.sigungu_by_name[candidate][0], candidate)]
+                    return lat, lon, 'sigungu'
+
+        if sido:
+            lat, lon = self.sido_coords[sido]
+            return lat, lon, 'sido'
+        return None
+
+    def geocode_location(self, location: str, region: Optional[str] = None) -> Optional[Coordinate]:
+        """
+        행사 장소명(자유 형식)을 좌표로 변환
+
+        주요 행사장 별칭 -> 주소 형태 해석 -> 문자열 속 시도명 -> 특구 대표 지역 순으로 시도한다.
+
+        Returns:
+            Optional[Coordinate]: (위도, 경도, 정밀도) - 정밀도는 'venue', 'sigungu', 'sido', 'zone'
+        """
+        # 가장 긴 별칭 우선 ("국립광주과학관"이 "광주과학관"보다 먼저)
+        venue = self.venue_matcher.longest_match(location)
+        if venue:
+            lat, lon = self.venue_coords[venue.label]
+            return lat, lon, 'venue'
+
+        coordinate = self.geocode_address(location)
+        if coordinate:
+            return coordinate
+
+        for token in (location or '').replace('(', ' ').replace(')', ' ').split():
+            sido = self.normalize_sido(token)
+            if sido:
+                lat, lon = self.sido_coords[sido]
+                return lat, lon, 'sido'
+
+        if region in ZONE_REGIONS:
+            lat, lon = self.sigungu_coords[ZONE_REGIONS[region]]
+            return lat, lon, 'zone'
+        return None
+
+_geocoder: Optional[OfflineGeocoder] = None
+_geocoder_lock = threading.Lock()
+
+def get_geocoder() -> OfflineGeocoder:
+    """참조 테이블을 한 번만 읽어 공유하는 지오코더 반환"""
+    global _geocoder
+    if _geocoder is None:
+        with _geocoder_lock:
+            if _geocoder is None:
+                _geocoder = OfflineGeocoder()
+    return _geocoder
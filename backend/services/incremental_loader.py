@@ -0,0 +1,90 @@
+import hashlib
+import sqlite3
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+def row_hash(values: Sequence[Any]) -> str:
+    """행 값으로 만든 변경 감지용 해시"""
+    joined = '\x1f'.join('' if value is None else str(value) for value in values)
+    return hashlib.sha256(joined.encode('utf-8')).hexdigest()[:16]
+
+class IncrementalLoader:
+    """새로 생기거나 바뀐 행만 기존 테이블에 반영하는 적재기
+
+    BulkLoader처럼 호출하는 쪽에서 연 트랜잭션 안에서 동작하며 커밋하지 않는다.
+    대상 테이블에는 key_column(PRIMARY KEY 또는 UNIQUE)과 row_hash 컬럼이 있어야 한다.
+    """
+
+    def __init__(self, cursor: sqlite3.Cursor, batch_size: int = 500):
+        self.cursor = cursor
+        self.batch_size = batch_size
+
+    def apply(
+        self,
+        table: str,
+        key_column: str,
+        columns: Sequence[str],
+        rows: Iterable[Tuple],
+        version_column: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        rows를 key_column 기준으로 기존 행의 row_hash와 비교해 신규 행은 추가, 변경 행은 갱신
+
+        모든 행을 batch_size개씩 기존 해시와 한 번에 비교하므로 예전 작성일의 행이 수정되어도
+        반영되고, 쓰기는 실제로 바뀐 행에만 일어난다.
+
+        Args:
+            table: 대상 테이블명
+            key_column: 행 식별 컬럼
+            columns: rows 튜플의 컬럼 순서 (key_column, version_column 포함)
+            rows: 반영할 행 (이터레이터 가능)
+            version_column: 행이 작성·수정된 시점 컬럼 (정렬 가능한 문자열, 최댓값 보고용)
+
+        Returns:
+            Dict[str, Any]: inserted, updated, unchanged 건수와
+                이번에 본 version_column 최댓값(watermark)
+        """
+        key_index = columns.index(key_column)
+        version_index = columns.index(version_column) if version_column else None
+        column_list = ', '.join(columns)
+        updates = ', '.join(f'{column} = excluded.{column}' for column in columns if column != key_column)
+        upsert_sql = f'''
+            INSERT INTO {table} ({column_list}, row_hash) VALUES ({', '.join('?' for _ in columns)}, ?)
+            ON CONFLICT({key_column}) DO UPDATE SET {updates}, row_hash = excluded.row_hash
+        '''
+
+        result = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'watermark': None}
+        for batch in self._batched(rows):
+            existing = self._existing_hashes(table, key_column, [row[key_index] for row in batch])
+            changed = []
+            for row in batch:
+                if version_index is not None:
+                    version = row[version_index]
+                    if version and (result['watermark'] is None or version > result['watermark']):
+                        result['watermark'] = version
+                digest = row_hash(row)
+                previous = existing.get(row[key_index])
+                if previous == digest:
+                    result['unchanged'] += 1
+                    continue
+                result['inserted' if previous is None else 'updated'] += 1
+                existing[row[key_index]] = digest
+                changed.append(tuple(row) + (digest,))
+            self.cursor.executemany(upsert_sql, changed)
+
+        return result
+
+    def _existing_hashes(self, table: str, key_column: str, keys: List[Any]) -> Dict[Any, str]:
+        """키 목록에 해당하는 기존 행 해시 조회"""
+        placeholders = ','.join('?' for _ in keys)
+        self.cursor.execute(f'SELECT {key_column}, row_hash FROM {table} WHERE {key_column} IN ({placeholders})', keys)
+        return dict(self.cursor.fetchall())
+
+    def _batched(self, rows: Iterable[Tuple]) -> Iterable[List[Tuple]]:
+        """행을 batch_size 단위 리스트로 분할"""
+        iterator = iter(rows)
+        while True:
+            batch = list(islice(iterator, self.batch_size))
+            if not batch:
+                return
+            yield batch
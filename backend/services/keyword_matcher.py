@@ -0,0 +1,178 @@
+import re
+from typing import Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Set
+
+class KeywordMatch(NamedTuple):
+    """문자열에서 찾은 키워드 위치"""
+    start: int
+    end: int
+    keyword: str
+    label: str
+
+class KeywordMatcher:
+    """
+    다중 키워드 매처
+
+    {라벨: [키워드, ...]} 사전을 긴 키워드가 앞서는 정규식 대안(alternation) 하나로 컴파일해 두고
+    문자열 탐색은 re 모듈(C 구현)에 맡긴다. 사전의 라벨 순서가 우선순위가 된다.
+    겹치는 출현은 전방 탐색 패턴으로 위치마다 가장 긴 키워드를 찾은 뒤,
+    그 키워드의 접두어인 키워드(같은 위치에서 함께 나타나는 키워드)를 미리 계산한 표로 펼친다.
+    키워드가 없는 문자열이 대부분이므로 겹치는 출현 탐색은 첫 출현 위치부터만 수행한다.
+    """
+
+    def __init__(self, dictionary: Mapping[str, Iterable[str]], ignore_case: bool = True):
+        self.ignore_case = ignore_case
+        self.labels: List[str] = list(dictionary)
+
+        # 정규화한 키워드 -> 같은 키워드의 (원래 키워드, 라벨) 목록 (사전 순서)
+        entries: Dict[str, List[KeywordMatch]] = {}
+        for label, keywords in dictionary.items():
+            for keyword in keywords:
+                if keyword:
+                    entries.setdefault(self._normalize(keyword), []).append(
+                        KeywordMatch(0, len(keyword), keyword, label)
+                    )
+
+        # 키워드에 대소문자가 있는 글자가 없으면 본문을 소문자로 바꿀 필요가 없음
+        self._fold_case = ignore_case and any(char.lower() != char.upper() for key in entries for char in key)
+
+        # 정규화한 키워드 -> 같은 위치에서 함께 나타나는 키워드(자신과 접두어) 목록, 긴 키워드부터
+        self._prefix_matches: Dict[str, List[KeywordMatch]] = {}
+        self._prefix_labels: Dict[str, Set[str]] = {}
+        for key in entries:
+            matches = [match for prefix in sorted(entries, key=len, reverse=True) if key.startswith(prefix)
+                       for match in entries[prefix]]
+            self._prefix_matches[key] = matches
+            self._prefix_labels[key] = {match.label for match in matches}
+        self._entries = entries
+
+        alternation = self._alternation(entries)
+        self._leftmost = re.compile(alternation)
+        self._overlapping = re.compile(f'(?=({alternation}))')
+        # 우선순위 순 라벨별 패턴 (best_label이 첫 일치 라벨에서 멈추도록)
+        self._label_patterns = [
+            (label, re.compile(self._alternation([key for key, matches in entries.items()
+                                                   if any(match.label == label for match in matches)])))
+            for label in self.labels
+        ]
+
+    @staticmethod
+    def _alternation(keys: Iterable[str]) -> str:
+        """긴 키워드가 앞서는 정규식 대안 (키워드가 없으면 아무것도 일치하지 않는 패턴)"""
+        return '|'.join(re.escape(key) for key in sorted(keys, key=len, reverse=True)) or '(?!)'
+
+    def _normalize(self, text: str) -> str:
+        return text.lower() if self.ignore_case else text
+
+    def _prepare(self, text: Optional[str]) -> str:
+        if not text:
+            return ''
+        return text.lower() if self._fold_case else text
+
+    def _first_position(self, text: str) -> int:
+        """첫 키워드 출현 위치 (없으면 -1)"""
+        found = self._leftmost.search(text)
+        return found.start() if found else -1
+
+    def iter_matches(self, text: Optional[str]) -> Iterator[KeywordMatch]:
+        """문자열의 모든 키워드 출현을 시작 위치 순(같은 위치는 긴 키워드부터)으로 반환 (겹치는 출현 포함)"""
+        text = self._prepare(text)
+        position = self._first_position(text)
+        if position < 0:
+            return
+        for found in self._overlapping.finditer(text, position):
+            start = found.start()
+            for match in self._prefix_matches[found.group(1)]:
+                yield match._replace(start=start, end=start + match.end)
+
+    def find_all(self, text: Optional[str]) -> List[KeywordMatch]:
+        """모든 키워드 출현을 시작 위치 순으로 반환"""
+        return sorted(self.iter_matches(text), key=lambda match: (match.start, -match.end))
+
+    def find_labels(self, text: Optional[str]) -> Set[str]:
+        """문자열에 등장한 라벨 집합"""
+        text = self._prepare(text)
+        position = self._first_position(text)
+        labels = set()
+        if position < 0:
+            return labels
+        for key in set(self._overlapping.findall(text, position)):
+            labels |= self._prefix_labels[key]
+        return labels
+
+    def first_match(self, text: Optional[str]) -> Optional[KeywordMatch]:
+        """가장 앞에서 시작하는 출현 (같은 위치면 가장 긴 키워드)"""
+        found = self._leftmost.search(self._prepare(text))
+        if not found:
+            return None
+        match = self._entries[found.group()][0]
+        return match._replace(start=found.start(), end=found.end())
+
+    def longest_match(self, text: Optional[str]) -> Optional[KeywordMatch]:
+        """가장 긴 키워드의 출현 (같은 길이면 앞쪽)"""
+        text = self._prepare(text)
+        position = self._first_position(text)
+        if position < 0:
+            return None
+        # 위치마다 가장 긴 키워드 중 최장 (같은 길이면 먼저 찾은 쪽 = 앞쪽)
+        key = max(self._overlapping.findall(text, position), key=len)
+        start = text.find(key, position)
+        match = self._entries[key][0]
+        return match._replace(start=start, end=start + match.end)
+
+    def first_label(self, text: Optional[str], default: Optional[str] = None) -> Optional[str]:
+        """가장 앞에서 등장한 키워드의 라벨"""
+        found = self._leftmost.search(text.lower() if self._fold_case and text else text or '')
+        return self._entries[found.group()][0].label if found else default
+
+    def best_label(self, text: Optional[str], default: Optional[str] = None) -> Optional[str]:
+        """등장한 라벨 중 사전 순서상 우선순위가 가장 높은 라벨"""
+        text = self._prepare(text)
+        for label, pattern in self._label_patterns:
+            if pattern.search(text):
+                return label
+        return default
+
+# 시도 약칭 (주소 첫머리 표기)
+REGION_NAMES = ['서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종',
+                '경기', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주']
+
+# 연구개발특구 행사지역
+ZONE_NAMES = ['대덕특구', '과학벨트', '부산특구', '대구특구', '광주특구', '울산특구', '전북특구']
+
+# 행사 유형 단어
+EVENT_WORDS = ['회의', '세미나', '컨퍼런스', '포럼', '워크샵', '행사', '이벤트',
+               '심포지움', '설명회', '발표회', '전시회', '박람회']
+
+# 행사장 유형 단어
+VENUE_WORDS = ['센터', '홀', '컨벤션', '대학교', '대학', '연구원', '기업',
+               '아트센터', '문화센터', 'DCC', 'BCC']
+
+# 업소명 기반 업종 분류 단어 (앞선 업종이 우선)
+BUSINESS_TYPE_WORDS = {
+    '카페': ['카페', '커피', '스타벅스', '투썸', '이디야', '커피빈', '카페베네'],
+    '베이커리': ['베이커리', '빵집', '제과', '제빵', '도넛', '케이크'],
+    '디저트': ['디저트', '아이스크림', '젤라토', '마카롱', '타르트'],
+    '한식': ['한식', '김치찌개', '된장찌개', '비빔밥', '불고기', '삼겹살', '갈비'],
+    '중식': ['중식', '짜장면', '짬뽕', '탕수육', '중화요리', '만두'],
+    '일식': ['일식', '초밥', '라멘', '우동', '돈카츠', '회'],
+    '양식': ['양식', '스테이크', '파스타', '피자', '햄버거', '샐러드'],
+    '퓨전': ['퓨전', '모던', '크리에이티브'],
+    '패스트푸드': ['맥도날드', '버거킹', '롯데리아', 'KFC', '서브웨이']
+}
+
+# 개인룸 보유 / 조용한 환경 추정 단어
+PRIVATE_ROOM_WORDS = ['룸', '방', '개인실', 'VIP', '단체실', '회의실']
+QUIET_WORDS = ['조용', '한적', '아늑', '편안', '고요']
+
+# 모듈 로드 시 한 번만 컴파일하여 공유하는 매처
+REGION_MATCHER = KeywordMatcher({region: [region] for region in REGION_NAMES})
+QUERY_TYPE_MATCHER = KeywordMatcher({
+    'region': REGION_NAMES,
+    'event': EVENT_WORDS,
+    'location': VENUE_WORDS
+})
+BUSINESS_TYPE_MATCHER = KeywordMatcher(BUSINESS_TYPE_WORDS)
+AMENITY_MATCHER = KeywordMatcher({
+    'private_room': PRIVATE_ROOM_WORDS,
+    'quiet': QUIET_WORDS
+})
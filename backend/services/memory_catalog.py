@@ -0,0 +1,192 @@
+import math
+import sqlite3
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from services.text_search import WORD_PATTERN, index_tokens, word_ngrams
+
+# 정수 / 실수 배열로 저장하는 컬럼 (나머지는 문자열 인터닝한 리스트)
+INTEGER_COLUMNS = {'id', 'sample_rank'}
+REAL_COLUMNS = {'lat', 'lon'}
+
+class ColumnarTable:
+    """
+    id 순으로 정렬된 행을 컬럼별 배열로 보관하는 읽기 전용 테이블
+
+    행 위치(position)가 id 순서와 같으므로 해시 인덱스의 위치 목록도 id 순으로 정렬되어 있다.
+    """
+
+    def __init__(self, columns: Sequence[str], rows: Iterable[Sequence[Any]]):
+        self.columns = tuple(columns)
+        self.data: Dict[str, Any] = {}
+        for column in self.columns:
+            if column in INTEGER_COLUMNS:
+                self.data[column] = array('q')
+            elif column in REAL_COLUMNS:
+                self.data[column] = array('d')
+            else:
+                self.data[column] = []
+
+        for row in rows:
+            for column, value in zip(self.columns, row):
+                if column in REAL_COLUMNS:
+                    value = math.nan if value is None else value
+                elif isinstance(value, str):
+                    value = sys.intern(value)
+                self.data[column].append(value)
+
+        self.ids = self.data['id']
+        self.positions = {row_id: position for position, row_id in enumerate(self.ids)}
+        self.hash_indexes: Dict[str, Dict[Any, array]] = {}
+        self.ngram_index: Dict[str, array] = {}
+        self.ngram_columns: Sequence[str] = ()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def build_hash_index(self, column: str):
+        """컬럼 값 -> 행 위치 배열 인덱스 생성"""
+        index: Dict[Any, array] = {}
+        for position, value in enumerate(self.data[column]):
+            index.setdefault(value, array('I')).append(position)
+        self.hash_indexes[column] = index
+
+    def build_ngram_index(self, columns: Sequence[str]):
+        """부분 문자열 검색용 n-gram -> 행 위치 배열 인덱스 생성 (FTS 색인과 같은 bigram·unigram 분해)"""
+        index: Dict[str, array] = {}
+        for position in range(len(self)):
+            grams = set()
+            for column in columns:
+                for word in WORD_PATTERN.findall(self.data[column][position] or ''):
+                    grams.update(index_tokens(word))
+            for gram in grams:
+                index.setdefault(gram, array('I')).append(position)
+        self.ngram_index = index
+        self.ngram_columns = tuple(columns)
+
+    def row(self, position: int) -> Dict[str, Any]:
+        """행 위치의 값을 딕셔너리로 변환"""
+        result = {}
+        for column in self.columns:
+            value = self.data[column][position]
+            if column in REAL_COLUMNS and math.isnan(value):
+                value = None
+            result[column] = value
+        return result
+
+    def get(self, row_id: int) -> Optional[Dict[str, Any]]:
+        """id로 행 조회"""
+        position = self.positions.get(row_id)
+        return self.row(position) if position is not None else None
+
+    def lookup(self, column: str, value: Any) -> Sequence[int]:
+        """해시 인덱스로 값이 일치하는 행 위치 조회 (id 순)"""
+        return self.hash_indexes[column].get(value, ())
+
+    def page(self, positions: Optional[Sequence[int]], limit: Optional[int] = None,
+             offset: int = 0, after_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """id 순 행 위치 목록에서 after_id 키셋 또는 offset으로 한 페이지 추출"""
+        if positions is None:
+            positions = range(len(self))
+        start = 0
+        if after_id is not None:
+            start = bisect_left(positions, bisect_right(self.ids, after_id))
+        start += offset
+        end = len(positions) if limit is None else start + limit
+        return [self.row(position) for position in positions[start:end]]
+
+    def search(self, text: str) -> List[int]:
+        """
+        n-gram 인덱스로 검색어의 모든 단어를 포함하는 행 위치 조회 (id 순)
+
+        단어마다 bigram(한 글자 단어는 unigram) 위치 목록의 교집합으로 후보를 줄인 뒤
+        실제 포함 여부를 확인한다.
+        """
+        words = [word.lower() for word in WORD_PATTERN.findall(text or '')]
+        if not words:
+            return []
+
+        candidates = None
+        for word in words:
+            for gram in word_ngrams(word):
+                postings = set(self.ngram_index.get(gram, ()))
+                candidates = postings if candidates is None else candidates & postings
+                if not candidates:
+                    return []
+
+        matched = []
+        for position in sorted(candidates):
+            haystack = ' '.join((self.data[column][position] or '') for column in self.ngram_columns).lower()
+            if all(word in haystack for word in words):
+                matched.append(position)
+        return matched
+
+class MemoryCatalog:
+    """백년가게 / 행사일정 전체를 메모리에 올린 읽기 모델 (적재본 하나에 대응)"""
+
+    def __init__(self, dataset_tag: str, restaurants: ColumnarTable, events: ColumnarTable):
+        self.dataset_tag = dataset_tag
+        self.restaurants = restaurants
+        self.events = events
+
+    @classmethod
+    def from_connection(cls, conn: sqlite3.Connection, dataset_tag: str) -> 'MemoryCatalog':
+        """한 읽기 트랜잭션 안에서 두 테이블을 읽어 카탈로그 생성"""
+        def read(table: str) -> ColumnarTable:
+            cursor = conn.execute(f'SELECT * FROM {table} ORDER BY id')
+            return ColumnarTable([description[0] for description in cursor.description], cursor)
+
+        conn.execute('BEGIN')
+        try:
+            restaurants = read('restaurants')
+            events = read('events')
+        finally:
+            conn.execute('COMMIT')
+
+        for column in ('region', 'business_type', 'sido'):
+            restaurants.build_hash_index(column)
+        restaurants.build_ngram_index(('name', 'address'))
+        events.build_hash_index('region')
+        events.build_ngram_index(('event_name', 'location', 'hashtags'))
+        return cls(dataset_tag, restaurants, events)
+
+class MemoryCatalogHolder:
+    """
+    현재 적재본의 MemoryCatalog를 보관하고 재적재 시 교체
+
+    데이터셋 태그를 최대 check_interval초마다 확인해 바뀌었으면 새 카탈로그를 만든 뒤
+    참조 하나를 바꾸어 교체하므로, 조회 중인 요청은 이전 카탈로그를 끝까지 사용한다.
+    """
+
+    def __init__(self, connect_func: Callable[[], sqlite3.Connection],
+                 tag_func: Callable[[], str], check_interval: float = 5.0):
+        self.connect_func = connect_func
+        self.tag_func = tag_func
+        self.check_interval = check_interval
+        self._catalog: Optional[MemoryCatalog] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> MemoryCatalog:
+        """현재 카탈로그 반환 (필요하면 다시 구성)"""
+        catalog = self._catalog
+        if catalog is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return catalog
+        return self.refresh()
+
+    def refresh(self, force: bool = False) -> MemoryCatalog:
+        """데이터셋 태그가 바뀌었거나 force이면 카탈로그를 다시 구성해 교체"""
+        with self._lock:
+            tag = self.tag_func()
+            if force or self._catalog is None or self._catalog.dataset_tag != tag:
+                conn = self.connect_func()
+                try:
+                    self._catalog = MemoryCatalog.from_connection(conn, tag)
+                finally:
+                    conn.close()
+            self._checked_at = time.monotonic()
+            return self._catalog
@@ -1,76 +1,53 @@
-import sqlite3
-import os
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime
-import re
+from typing import List, Dict, Any, Optional
+
+from services.keyword_matcher import QUERY_TYPE_MATCHER
+from services.relevance_scorer import RelevanceScorer
+from models.connection import DB_PATH, get_connection
+from models.database import get_database_manager
 
 class RecommendationEngine:
     """추천 엔진 클래스"""
     
-    def __init__(self, db_path: str = "hungry_people.db"):
+    def __init__(self, db_path: str = DB_PATH):
         self.db_path = db_path
+        # 스마트 추천 점수 계산기 (적재본별로 한 번 구성)
+        self._scorer: Optional[RelevanceScorer] = None
     
-    def get_location_based_recommendations(self, location: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """장소 기반 추천 - 행사 장소 근처 백년가게 추천"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # 장소명에서 지역 키워드 추출
-        location_keywords = self._extract_location_keywords(location)
-        
-        if not location_keywords:
-            conn.close()
-            return []
-        
-        # 키워드로 주소 검색
-        recommendations = []
-        
-        for keyword in location_keywords:
-            cursor.execute('''
-                SELECT * FROM restaurants 
-                WHERE address LIKE ?
-                ORDER BY name
-                LIMIT ?
-            ''', (f'%{keyword}%', limit))
-            
-            columns = [description[0] for description in cursor.description]
-            results = [dict(zip(columns, row)) for row in cursor.fetchall()]
-            recommendations.extend(results)
-        
-        # 중복 제거
-        unique_recommendations = {}
-        for rec in recommendations:
-            if rec['id'] not in unique_recommendations:
-                unique_recommendations[rec['id']] = rec
-        
-        final_recommendations = list(unique_recommendations.values())[:limit]
-        
-        conn.close()
-        return final_recommendations
+    def get_location_based_recommendations(self, location: str, limit: int = 10,
+                                           radius_km: Optional[float] = None) -> List[Dict[str, Any]]:
+        """장소 기반 추천 - 행사 장소 근처 백년가게 추천 (실제 거리순)"""
+        return get_database_manager(self.db_path).get_nearby_restaurants(location, limit, radius_km)
     
-    def get_event_based_recommendations(self, event_id: int, limit: int = 10) -> List[Dict[str, Any]]:
-        """행사 기반 추천 - 특정 행사 근처 백년가게 추천"""
-        conn = sqlite3.connect(self.db_path)
+    def get_coordinate_based_recommendations(self, lat: float, lon: float, limit: int = 10,
+                                             radius_km: Optional[float] = None) -> List[Dict[str, Any]]:
+        """좌표 기반 추천 - 위도/경도 근처 백년가게 추천"""
+        return get_database_manager(self.db_path).find_restaurants_near(lat, lon, limit, radius_km)
+    
+    def get_event_based_recommendations(self, event_id: int, limit: int = 10,
+                                        radius_km: Optional[float] = None) -> List[Dict[str, Any]]:
+        """행사 기반 추천 - 특정 행사 근처 백년가게 추천 (적재 시 계산한 후보 우선)"""
+        candidates = get_database_manager(self.db_path).get_event_candidates(event_id, limit, radius_km)
+        if candidates is not None:
+            return candidates
+        
+        conn = get_connection(self.db_path)
         cursor = conn.cursor()
         
-        # 행사 정보 조회
-        cursor.execute('SELECT * FROM events WHERE id = ?', (event_id,))
+        # 행사 정보 조회 (적재 시 지오코딩된 행사장 좌표)
+        cursor.execute('SELECT location, lat, lon FROM events WHERE id = ?', (event_id,))
         event = cursor.fetchone()
         
         if not event:
-            conn.close()
             return []
         
-        # 행사 장소로 추천
-        event_location = event[5]  # location 컬럼
-        recommendations = self.get_location_based_recommendations(event_location, limit)
-        
-        conn.close()
-        return recommendations
+        location, lat, lon = event
+        if lat is None or lon is None:
+            return self.get_location_based_recommendations(location, limit, radius_km)
+        return self.get_coordinate_based_recommendations(lat, lon, limit, radius_km)
     
     def get_region_based_recommendations(self, region: str, limit: int = 10) -> List[Dict[str, Any]]:
         """지역 기반 추천 - 특정 지역의 인기 백년가게 추천"""
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -83,113 +60,50 @@ class RecommendationEngine:
         columns = [description[0] for description in cursor.description]
         results = [dict(zip(columns, row)) for row in cursor.fetchall()]
         
-        conn.close()
         return results
     
     def get_smart_recommendations(self, user_query: str, limit: int = 10) -> Dict[str, Any]:
-        """스마트 추천 - 사용자 쿼리 분석하여 최적의 추천 제공"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """
+        스마트 추천 - 사용자 쿼리의 여러 신호를 함께 반영한 점수 순 추천
+        
+        지역·업종·편의 조건·인원·행사 단어와 TF-IDF 텍스트 유사도를 합산하므로
+        "대전 세미나 조용한 한식"처럼 여러 신호가 섞인 질의도 한 번에 순위를 매긴다.
+        """
+        db_manager = get_database_manager(self.db_path)
         
-        # 쿼리 분석
+        # 쿼리 분석 (제안 문구 유형)
         query_type = self._analyze_query(user_query)
         
-        recommendations = {
-            'type': query_type,
-            'restaurants': [],
-            'events': [],
-            'suggestions': []
-        }
+        ranked = self._get_scorer(db_manager).rank(user_query, limit, event_limit=5)
         
-        if query_type == 'location':
-            # 장소명으로 추천
-            recommendations['restaurants'] = self.get_location_based_recommendations(user_query, limit)
-            
-            # 관련 행사도 검색
-            cursor.execute('''
-                SELECT * FROM events 
-                WHERE location LIKE ? OR event_name LIKE ?
-                LIMIT 5
-            ''', (f'%{user_query}%', f'%{user_query}%'))
-            
-            columns = [description[0] for description in cursor.description]
-            recommendations['events'] = [dict(zip(columns, row)) for row in cursor.fetchall()]
-            
-        elif query_type == 'region':
-            # 지역으로 추천
-            recommendations['restaurants'] = self.get_region_based_recommendations(user_query, limit)
-            
-            # 해당 지역 행사 검색
-            cursor.execute('''
-                SELECT * FROM events 
-                WHERE region = ?
-                LIMIT 5
-            ''', (user_query,))
-            
-            columns = [description[0] for description in cursor.description]
-            recommendations['events'] = [dict(zip(columns, row)) for row in cursor.fetchall()]
-            
-        else:
-            # 일반 검색
-            cursor.execute('''
-                SELECT * FROM restaurants 
-                WHERE name LIKE ? OR address LIKE ?
-                LIMIT ?
-            ''', (f'%{user_query}%', f'%{user_query}%', limit))
-            
-            columns = [description[0] for description in cursor.description]
-            recommendations['restaurants'] = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        restaurants = db_manager.get_restaurants_by_ids([restaurant_id for restaurant_id, _ in ranked['restaurants']])
+        for restaurant, (_, score) in zip(restaurants, ranked['restaurants']):
+            restaurant['relevance'] = score
         
-        # 추천 제안 생성
-        recommendations['suggestions'] = self._generate_suggestions(user_query, query_type)
+        events = db_manager.get_events_by_ids([event_id for event_id, _ in ranked['events']])
+        for event, (_, score) in zip(events, ranked['events']):
+            event['relevance'] = score
         
-        conn.close()
-        return recommendations
+        return {
+            'type': query_type,
+            'restaurants': restaurants,
+            'events': events,
+            'suggestions': self._generate_suggestions(user_query, query_type)
+        }
     
-    def _extract_location_keywords(self, location: str) -> List[str]:
-        """장소명에서 지역 키워드 추출"""
-        keywords = []
-        
-        # 주요 지역 키워드
-        regions = ['서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종',
-                  '경기', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주',
-                  '대덕특구', '과학벨트', '부산특구', '대구특구', '광주특구', '울산특구']
-        
-        for region in regions:
-            if region in location:
-                keywords.append(region)
-        
-        return keywords
+    def _get_scorer(self, db_manager) -> RelevanceScorer:
+        """현재 적재본의 점수 계산기 (데이터셋 태그가 바뀌면 다시 구성)"""
+        dataset_tag = db_manager.get_dataset_tag()
+        scorer = self._scorer
+        if scorer is None or scorer.dataset_tag != dataset_tag:
+            scorer = RelevanceScorer(get_connection(self.db_path), dataset_tag)
+            self._scorer = scorer
+        return scorer
     
     def _analyze_query(self, query: str) -> str:
         """쿼리 분석하여 타입 결정"""
-        query_lower = query.lower()
-        
-        # 지역 키워드 체크
-        region_keywords = ['서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종',
-                          '경기', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주']
-        
-        for region in region_keywords:
-            if region in query:
-                return 'region'
-        
-        # 행사 관련 키워드 체크
-        event_keywords = ['회의', '세미나', '컨퍼런스', '포럼', '워크샵', '행사', '이벤트',
-                         '심포지움', '설명회', '발표회', '전시회', '박람회']
-        
-        for keyword in event_keywords:
-            if keyword in query:
-                return 'event'
-        
-        # 장소 관련 키워드 체크
-        location_keywords = ['센터', '홀', '컨벤션', '대학교', '대학', '연구원', '기업',
-                            '아트센터', '문화센터', 'DCC', 'BCC']
-        
-        for keyword in location_keywords:
-            if keyword in query:
-                return 'location'
-        
-        return 'general'
+        # 지역 > 행사 > 장소 키워드 순으로 우선 (한 번의 스캔으로 모두 확인)
+        return QUERY_TYPE_MATCHER.best_label(query, 'general')
     
     def _generate_suggestions(self, query: str, query_type: str) -> List[str]:
         """추천 제안 생성"""
@@ -0,0 +1,171 @@
+import math
+import re
+import sqlite3
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from services.keyword_matcher import (AMENITY_MATCHER, BUSINESS_TYPE_MATCHER, BUSINESS_TYPE_WORDS,
+                                      EVENT_WORDS, KeywordMatcher, REGION_MATCHER, REGION_NAMES)
+from services.text_search import WORD_PATTERN, word_ngrams
+
+# 신호별 가중치 (텍스트 점수는 질의 내 최댓값 1로 정규화)
+TEXT_WEIGHT = 1.0
+REGION_WEIGHT = 1.0
+BUSINESS_TYPE_WEIGHT = 0.8
+AMENITY_WEIGHT = 0.5
+PARTY_SIZE_WEIGHT = 0.5
+EVENT_INTENT_WEIGHT = 0.3
+
+# "8명", "10인" 같은 인원수 표현
+PARTY_SIZE_PATTERN = re.compile(r'(\d+)\s*(?:명|인)')
+
+EVENT_WORD_MATCHER = KeywordMatcher({'event': EVENT_WORDS})
+BUSINESS_TYPES = list(BUSINESS_TYPE_WORDS) + ['기타']
+
+class TfidfIndex:
+    """bigram 토큰 TF-IDF 역색인 (토큰 -> 행 번호 배열, 가중치 배열)"""
+
+    def __init__(self, documents: Sequence[str]):
+        self.size = len(documents)
+        counts: Dict[str, Dict[int, int]] = {}
+        for row, document in enumerate(documents):
+            for word in WORD_PATTERN.findall(document or ''):
+                for token in word_ngrams(word):
+                    postings = counts.setdefault(token, {})
+                    postings[row] = postings.get(row, 0) + 1
+
+        # 행별 L2 정규화를 위해 먼저 가중치를 모은 뒤 노름으로 나눔
+        norms = np.zeros(self.size)
+        raw: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for token, postings in counts.items():
+            idf = math.log((1 + self.size) / (1 + len(postings))) + 1
+            rows = np.fromiter(postings.keys(), dtype=np.int32, count=len(postings))
+            weights = (1 + np.log(np.fromiter(postings.values(), dtype=np.float64, count=len(postings)))) * idf
+            np.add.at(norms, rows, weights ** 2)
+            raw[token] = (rows, weights)
+        norms = np.sqrt(norms)
+        norms[norms == 0] = 1
+        self.postings = {token: (rows, weights / norms[rows]) for token, (rows, weights) in raw.items()}
+
+    def score(self, text: str) -> np.ndarray:
+        """질의 토큰과의 코사인 유사도 (전체 행에 대한 점수 벡터)"""
+        scores = np.zeros(self.size)
+        query_tokens = [token for word in WORD_PATTERN.findall(text or '') for token in word_ngrams(word)]
+        for token in set(query_tokens):
+            if token in self.postings:
+                rows, weights = self.postings[token]
+                np.add.at(scores, rows, weights)
+        return scores
+
+def one_hot(values: Sequence[str], labels: Sequence[str]) -> np.ndarray:
+    """값 목록을 labels 기준 원-핫 행렬로 변환 (labels에 없는 값은 0 벡터)"""
+    positions = {label: index for index, label in enumerate(labels)}
+    matrix = np.zeros((len(values), len(labels)))
+    for row, value in enumerate(values):
+        if value in positions:
+            matrix[row, positions[value]] = 1
+    return matrix
+
+class QuerySignals:
+    """질의에서 뽑은 신호 (지역, 업종, 편의 조건, 인원, 행사 의도)"""
+
+    def __init__(self, query: str):
+        self.text = query
+        self.regions = REGION_MATCHER.find_labels(query)
+        # 한 글자 업종 단어("회")는 "회의", "회식"에도 걸리므로 질의 신호에서는 제외
+        self.business_types = {
+            match.label for match in BUSINESS_TYPE_MATCHER.iter_matches(query) if len(match.keyword) > 1
+        }
+        self.amenities = AMENITY_MATCHER.find_labels(query)
+        self.event_intent = bool(EVENT_WORD_MATCHER.find_labels(query))
+        party_size = PARTY_SIZE_PATTERN.search(query)
+        self.party_size = int(party_size.group(1)) if party_size else 0
+
+    def vector(self, labels: Sequence[str], selected) -> np.ndarray:
+        return np.array([1.0 if label in selected else 0.0 for label in labels])
+
+class RelevanceScorer:
+    """
+    백년가게·행사 특성 행렬 기반 스마트 추천 점수 계산기
+
+    적재본 하나에 대해 특성 행렬과 TF-IDF 색인을 한 번 만들어 두고,
+    질의마다 신호 벡터와의 행렬 곱으로 전체 후보 점수를 한 번에 계산한다.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, dataset_tag: str):
+        self.dataset_tag = dataset_tag
+
+        restaurant_rows = conn.execute('''
+            SELECT id, name, address, region, business_type, has_private_room, noise_level, max_party_size
+            FROM restaurants ORDER BY id
+        ''').fetchall()
+        self.restaurant_ids = np.array([row[0] for row in restaurant_rows], dtype=np.int64)
+        self.restaurant_text = TfidfIndex([f'{row[1]} {row[2]}' for row in restaurant_rows])
+        self.restaurant_regions = one_hot([row[3] for row in restaurant_rows], REGION_NAMES)
+        self.restaurant_business_types = one_hot([row[4] or '기타' for row in restaurant_rows], BUSINESS_TYPES)
+        self.restaurant_amenities = np.array([
+            [1.0 if row[5] else 0.0, 1.0 if row[6] == 'low' else 0.0] for row in restaurant_rows
+        ]).reshape(-1, 2)
+        self.restaurant_party_sizes = np.array([row[7] or 0 for row in restaurant_rows], dtype=np.float64)
+
+        event_rows = conn.execute('''
+            SELECT id, event_name, location, hashtags, region, tech_category
+            FROM events ORDER BY id
+        ''').fetchall()
+        self.event_ids = np.array([row[0] for row in event_rows], dtype=np.int64)
+        self.event_text = TfidfIndex([f'{row[1]} {row[2]} {row[3]} {row[5]}' for row in event_rows])
+        # 행사 지역은 특구명이므로 장소 문자열에 나온 시도로 지역 특성을 만듦
+        self.event_regions = one_hot([REGION_MATCHER.first_label(row[2]) for row in event_rows], REGION_NAMES)
+
+    def score_restaurants(self, signals: QuerySignals) -> np.ndarray:
+        """전체 백년가게 점수 벡터"""
+        scores = TEXT_WEIGHT * self._normalized(self.restaurant_text.score(signals.text))
+        scores += REGION_WEIGHT * (self.restaurant_regions @ signals.vector(REGION_NAMES, signals.regions))
+        scores += BUSINESS_TYPE_WEIGHT * (
+            self.restaurant_business_types @ signals.vector(BUSINESS_TYPES, signals.business_types)
+        )
+        scores += AMENITY_WEIGHT * (
+            self.restaurant_amenities @ signals.vector(['private_room', 'quiet'], signals.amenities)
+        )
+        if signals.party_size:
+            scores += PARTY_SIZE_WEIGHT * (self.restaurant_party_sizes >= signals.party_size)
+        if signals.event_intent:
+            # 세미나·회의 등 행사 질의는 다른 신호와 맞는 업소 중 개인룸이 있는 곳을 우대
+            scores += EVENT_INTENT_WEIGHT * self.restaurant_amenities[:, 0] * (scores > 0)
+        return scores
+
+    def score_events(self, signals: QuerySignals) -> np.ndarray:
+        """전체 행사 점수 벡터"""
+        scores = TEXT_WEIGHT * self._normalized(self.event_text.score(signals.text))
+        scores += REGION_WEIGHT * (self.event_regions @ signals.vector(REGION_NAMES, signals.regions))
+        return scores
+
+    def rank(self, query: str, limit: int = 10, event_limit: int = 5) -> Dict[str, List[Tuple[int, float]]]:
+        """
+        질의에 대한 백년가게·행사 상위 (id, 점수) 목록
+
+        Returns:
+            Dict[str, List[Tuple[int, float]]]: {'restaurants': [...], 'events': [...]} (점수 내림차순, 동점은 id 순)
+        """
+        signals = QuerySignals(query)
+        return {
+            'restaurants': self._top_k(self.restaurant_ids, self.score_restaurants(signals), limit),
+            'events': self._top_k(self.event_ids, self.score_events(signals), event_limit)
+        }
+
+    def _normalized(self, scores: np.ndarray) -> np.ndarray:
+        peak = scores.max() if scores.size else 0
+        return scores / peak if peak > 0 else scores
+
+    def _top_k(self, ids: np.ndarray, scores: np.ndarray, limit: int) -> List[Tuple[int, float]]:
+        """점수가 0보다 큰 후보 중 상위 limit개"""
+        candidates = np.flatnonzero(scores > 0)
+        if limit <= 0 or candidates.size == 0:
+            return []
+        if candidates.size > limit:
+            # 경계 동점이 잘리지 않도록 limit번째 점수 이상인 후보만 남긴 뒤 정렬
+            threshold = np.partition(scores[candidates], candidates.size - limit)[candidates.size - limit]
+            candidates = candidates[scores[candidates] >= threshold]
+        order = np.lexsort((ids[candidates], -scores[candidates]))[:limit]
+        return [(int(ids[index]), round(float(scores[index]), 4)) for index in candidates[order]]
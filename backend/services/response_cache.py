@@ -0,0 +1,143 @@
+import hashlib
+import os
+from functools import wraps
+from typing import Callable, Optional
+from urllib.parse import urlencode
+
+from flask import Response, make_response, request
+
+from services.lru_cache import LRUCache
+
+# 응답 캐시 설정 (환경 변수로 조정)
+RESPONSE_CACHE_TTL = float(os.environ.get('RESPONSE_CACHE_TTL', 300))
+RESPONSE_CACHE_SIZE = int(os.environ.get('RESPONSE_CACHE_SIZE', 1024))
+# 여러 워커가 캐시를 공유할 때 사용하는 Redis URL (없으면 프로세스 내 메모리 캐시)
+RESPONSE_CACHE_URL = os.environ.get('RESPONSE_CACHE_URL')
+
+class InMemoryCacheBackend:
+    """프로세스 내 LRU + TTL 캐시 백엔드 (기본값, 공유 백엔드의 로컬 대체)"""
+
+    def __init__(self, maxsize: int = RESPONSE_CACHE_SIZE, ttl: float = RESPONSE_CACHE_TTL):
+        self._cache = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None):
+        self._cache.set(key, value, ttl)
+
+    def clear(self):
+        self._cache.clear()
+
+class RedisCacheBackend:
+    """Redis 공유 캐시 백엔드 (redis 패키지 필요)"""
+
+    def __init__(self, url: str, namespace: str = 'hungry-people:response:'):
+        import redis
+        self._client = redis.Redis.from_url(url)
+        self.namespace = namespace
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(self.namespace + key)
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None):
+        self._client.set(self.namespace + key, value, ex=int(ttl) if ttl else None)
+
+    def clear(self):
+        for key in self._client.scan_iter(match=self.namespace + '*'):
+            self._client.delete(key)
+
+def create_cache_backend():
+    """설정에 맞는 캐시 백엔드 생성 (Redis를 쓸 수 없으면 메모리 캐시)"""
+    if RESPONSE_CACHE_URL:
+        try:
+            return RedisCacheBackend(RESPONSE_CACHE_URL)
+        except ImportError:
+            print("redis 패키지가 없어 메모리 응답 캐시를 사용합니다")
+    return InMemoryCacheBackend()
+
+class ResponseCache:
+    """
+    읽기 전용 API 응답 캐시
+
+    캐시 키는 엔드포인트, 데이터셋 태그, 정렬한 요청 파라미터로 구성되므로
+    데이터를 재적재해 태그가 바뀌면 이전 응답은 더 이상 조회되지 않는다.
+    응답에는 ETag와 Cache-Control: no-cache를 붙여 브라우저·프록시가 304로 재검증하게 한다.
+    공유 백엔드(Redis)가 장애로 실패하면 프로세스 내 메모리 캐시로 대신 처리한다.
+    """
+
+    def __init__(self, version_func: Callable[[], str], backend=None, ttl: float = RESPONSE_CACHE_TTL):
+        self.version_func = version_func
+        self.backend = backend or create_cache_backend()
+        self.ttl = ttl
+        self.fallback = self.backend if isinstance(self.backend, InMemoryCacheBackend) else InMemoryCacheBackend(ttl=ttl)
+        self._backend_failing = False
+
+    def make_key(self, prefix: str, version: str, view_args: dict) -> str:
+        """정규화한 요청 파라미터로 캐시 키 생성 (파라미터 순서와 무관)"""
+        args = sorted(request.args.items(multi=True)) + sorted(view_args.items())
+        digest = hashlib.sha256(urlencode(args).encode('utf-8')).hexdigest()[:16]
+        return f'{prefix}-{version}-{digest}'
+
+    def cached(self, prefix: str):
+        """200 응답을 캐시하는 뷰 데코레이터"""
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                key = self.make_key(prefix, self.version_func(), kwargs)
+                body = self._get(key)
+                cache_status = 'HIT'
+
+                if body is None:
+                    response = make_response(view(*args, **kwargs))
+                    if response.status_code != 200:
+                        return response
+                    body = response.get_data()
+                    self._set(key, body)
+                    cache_status = 'MISS'
+
+                response = Response(body, mimetype='application/json')
+                response.set_etag(key)
+                response.headers['Cache-Control'] = 'no-cache'
+                response.headers['X-Cache'] = cache_status
+                return response.make_conditional(request)
+            return wrapper
+        return decorator
+
+    def _get(self, key: str) -> Optional[bytes]:
+        """백엔드에서 조회 (실패하면 메모리 캐시에서 조회)"""
+        try:
+            body = self.backend.get(key)
+        except Exception as e:
+            self._backend_failed('조회', e)
+            return self.fallback.get(key)
+        self._backend_recovered()
+        return body
+
+    def _set(self, key: str, body: bytes):
+        """백엔드에 저장 (실패하면 메모리 캐시에 저장)"""
+        try:
+            self.backend.set(key, body, self.ttl)
+        except Exception as e:
+            self._backend_failed('저장', e)
+            self.fallback.set(key, body, self.ttl)
+
+    def _backend_failed(self, action: str, error: Exception):
+        """장애가 시작될 때 한 번만 기록"""
+        if not self._backend_failing:
+            self._backend_failing = True
+            print(f"응답 캐시 백엔드 {action} 실패, 메모리 캐시로 대체합니다: {error}")
+
+    def _backend_recovered(self):
+        """장애 뒤 백엔드가 다시 응답하면 기록"""
+        if self._backend_failing:
+            self._backend_failing = False
+            print("응답 캐시 백엔드가 복구되었습니다")
+
+    def clear(self):
+        """캐시 전체 비우기"""
+        self.fallback.clear()
+        try:
+            self.backend.clear()
+        except Exception as e:
+            self._backend_failed('삭제', e)
@@ -0,0 +1,34 @@
+from datetime import date
+from typing import Dict, Tuple
+
+from sqlalchemy import update
+
+from models.budget_models import BudgetLine, SpendRollup
+
+def spend_period(day: date) -> str:
+    """거래일의 집계 기간 (YYYY-MM)"""
+    return day.strftime('%Y-%m')
+
+def apply_spend_deltas(session, deltas: Dict[Tuple[int, str], Tuple[int, int]]):
+    """
+    (비목 id, 기간)별 (건수, 금액) 증감을 spend_rollups에 반영
+
+    호출하는 쪽 트랜잭션 안에서 비목 행의 조건부 UPDATE 뒤에 실행된다.
+    같은 비목의 집계 행은 그 비목 행을 잠근 요청만 고치므로 UPDATE 후 없으면 INSERT해도 경합이 없다.
+
+    Args:
+        session: SQLAlchemy 세션
+        deltas: {(budget_line_id, 'YYYY-MM'): (건수 증감, 금액 증감)}
+    """
+    for (line_id, period), (count, amount) in sorted(deltas.items()):
+        result = session.execute(
+            update(SpendRollup)
+            .where(SpendRollup.budget_line_id == line_id, SpendRollup.period == period)
+            .values(transaction_count=SpendRollup.transaction_count + count,
+                    total_amount=SpendRollup.total_amount + amount)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            budget_id = session.query(BudgetLine.budget_id).filter(BudgetLine.id == line_id).scalar()
+            session.add(SpendRollup(budget_id=budget_id, budget_line_id=line_id, period=period,
+                                    transaction_count=count, total_amount=amount))
@@ -0,0 +1,73 @@
+import re
+import sqlite3
+from typing import List, Optional, Sequence
+
+# 한글/영문/숫자 연속 구간 (공백·문장부호로 단어 분리)
+WORD_PATTERN = re.compile(r'[0-9A-Za-z가-힣ㄱ-ㆎ]+')
+
+def word_ngrams(word: str, n: int = 2) -> List[str]:
+    """단어를 n-gram 목록으로 분해 (n보다 짧은 단어는 그대로)"""
+    word = word.lower()
+    if len(word) <= n:
+        return [word]
+    return [word[i:i + n] for i in range(len(word) - n + 1)]
+
+def index_tokens(word: str) -> List[str]:
+    """단어의 색인 토큰 (bigram 뒤에 한 글자 검색용 unigram을 덧붙임)"""
+    tokens = word_ngrams(word)
+    if len(word) > 1:
+        tokens.extend(dict.fromkeys(word.lower()))
+    return tokens
+
+def ngram_tokens(text: Optional[str]) -> str:
+    """
+    FTS5 색인용 bigram 토큰 문자열 생성
+
+    FTS5 기본 토크나이저는 띄어쓰기 단위로만 토큰을 나누므로 "전주시"에서 "주시"를 찾을 수 없고,
+    trigram 토크나이저는 두 글자 검색어("서울", "한식")를 찾지 못한다.
+    단어마다 bigram으로 분해해 공백으로 이어 붙인 문자열을 색인한다.
+    한 글자 검색어("집", "빵")도 찾을 수 있도록 단어의 글자(unigram)도 bigram 뒤에 함께 색인한다.
+
+    Args:
+        text: 원본 문자열
+
+    Returns:
+        str: 공백으로 구분된 토큰 (예: "전주시" -> "전주 주시 전 주 시")
+    """
+    if not text:
+        return ''
+    tokens = []
+    for word in WORD_PATTERN.findall(text):
+        tokens.extend(index_tokens(word))
+    return ' '.join(tokens)
+
+def build_match_query(text: str, columns: Optional[Sequence[str]] = None, operator: str = 'AND') -> str:
+    """
+    검색어를 FTS5 MATCH 식으로 변환
+
+    단어마다 bigram 구(phrase)를 만들고 operator로 연결한다.
+    한 글자 단어는 색인된 unigram 토큰과 일치시키므로 그 글자를 포함한 모든 행을 찾는다.
+
+    Args:
+        text: 사용자 검색어
+        columns: 검색 대상 FTS 컬럼 (None이면 전체 컬럼)
+        operator: 단어 간 결합 연산자 (AND / OR)
+
+    Returns:
+        str: MATCH 식 (검색 가능한 단어가 없으면 빈 문자열)
+    """
+    phrases = []
+    for word in WORD_PATTERN.findall(text or ''):
+        phrases.append('"' + ' '.join(word_ngrams(word)) + '"')
+
+    if not phrases:
+        return ''
+
+    expression = f' {operator} '.join(phrases)
+    if columns:
+        return '{' + ' '.join(columns) + '} : (' + expression + ')'
+    return expression
+
+def register_search_functions(conn: sqlite3.Connection):
+    """FTS 동기화 트리거가 사용하는 SQL 함수 등록"""
+    conn.create_function('ngram_tokens', 1, ngram_tokens, deterministic=True)
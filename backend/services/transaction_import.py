@@ -0,0 +1,70 @@
+import json
+from datetime import date, datetime
+from typing import Any, BinaryIO, Dict, Iterator
+
+from services.data_processor import CSVReader
+
+# 일괄 등록 한 번에 받는 최대 행 수
+MAX_BATCH_ROWS = 5000
+
+# 일괄 등록 행 필드 (CSV 헤더도 같은 이름)
+TRANSACTION_FIELDS = ('budget_line_id', 'date', 'vendor_name', 'amount', 'payment_method', 'receipt_type', 'memo')
+REQUIRED_FIELDS = ('budget_line_id', 'vendor_name', 'amount', 'payment_method', 'receipt_type')
+
+def iter_json_lines(stream: BinaryIO) -> Iterator[Any]:
+    """JSON Lines 스트림을 한 줄씩 파싱 (파싱할 수 없는 줄은 원본 문자열 그대로 반환)"""
+    for raw in stream:
+        line = raw.decode('utf-8-sig').strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            yield line
+
+def iter_csv_records(stream: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """CSV 스트림을 한 행씩 딕셔너리로 반환 (CSVReader의 인코딩 판별 사용)"""
+    return CSVReader().iter_csv_stream(stream, name='<transactions>')
+
+def normalize_transaction(record: Any, today: date) -> Dict[str, Any]:
+    """
+    일괄 등록 행 하나를 검증해 거래 컬럼 딕셔너리로 변환
+
+    Args:
+        record: JSON 객체 또는 CSV 행 (값이 문자열일 수 있음)
+        today: 날짜가 없을 때 사용할 거래일
+
+    Returns:
+        Dict[str, Any]: budget_line_id, date, vendor_name, amount, payment_method, receipt_type, memo
+
+    Raises:
+        ValueError: 필수 값 누락, 숫자·날짜 형식 오류, 금액이 0 이하인 경우
+    """
+    if not isinstance(record, dict):
+        raise ValueError('Row is not a JSON object')
+
+    values = {field: record.get(field) for field in TRANSACTION_FIELDS}
+    for field in ('vendor_name', 'payment_method', 'receipt_type', 'memo', 'date'):
+        if isinstance(values[field], str):
+            values[field] = values[field].strip()
+
+    missing = [field for field in REQUIRED_FIELDS if values[field] in (None, '')]
+    if missing:
+        raise ValueError(f'Required fields: {", ".join(missing)}')
+
+    try:
+        values['budget_line_id'] = int(values['budget_line_id'])
+        amount = values['amount']
+        values['amount'] = int(amount.replace(',', '')) if isinstance(amount, str) else int(amount)
+    except (TypeError, ValueError):
+        raise ValueError('budget_line_id and amount must be integers')
+    if values['amount'] <= 0:
+        raise ValueError('amount must be positive')
+
+    try:
+        values['date'] = datetime.strptime(values['date'], '%Y-%m-%d').date() if values['date'] else today
+    except (TypeError, ValueError):
+        raise ValueError('Invalid date format. Use YYYY-MM-DD')
+
+    values['memo'] = values['memo'] or None
+    return values